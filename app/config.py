@@ -0,0 +1,109 @@
+"""
+Module defining configuration of the scraping run.
+Groups options of browsers and scraping strategy, that are shared
+by all run modes (single run, queue workers).
+"""
+
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, field_validator
+
+import app.constants as consts
+
+
+class ScrapeConfig(BaseModel):
+    """
+    Configuration of drivers and scraping strategy.
+
+    Parameters
+    ----------
+    headless : bool
+        Whether to run the browser in headless mode.
+    browser : str
+        Name of browser backend, one of `BROWSERS`, see `app.scraping.browsers`.
+    browser_binary : Path | None
+        Path to executable of chrome-headless-shell, if None it's found on PATH.
+    tabs : int
+        Number of browser tabs loading pages concurrently.
+    capture_network : bool
+        Whether to read stock data from JSON responses fetched by the page,
+        falling back to parsing the page.
+    bulk : bool
+        Whether to answer requests from paginated listing pages first
+        and scrape only stocks missing from it.
+    preflight : bool
+        Whether to reject requests redirected to price explorer
+        with lightweight HTTP requests, before loading them in browser.
+    workers : int
+        Maximum number of browsers scraping concurrently.
+        Actual number is adjusted to page load times and errors.
+    rate_limit : float
+        Maximum number of page loads per second sent to a single host,
+        applied when scraping with multiple workers.
+    remote : dict[str, int]
+        Capacity of remote WebDriver endpoints by their URLs, on which browsers
+        are started instead of locally. Number of workers is limited
+        by total capacity of endpoints. If empty, browsers are started locally.
+    recycle_pages : int
+        Number of pages after which browser is restarted.
+    recycle_memory : float
+        Resident memory in megabytes of browser processes,
+        above which browser is restarted.
+    profiles_dir : Path | None
+        Directory of persistent browser profiles, one per running browser,
+        which keep disk cache of static assets between runs.
+        Profiles of browsers other than Chrome are kept in its subdirectory
+        named after the browser. By default None, enabled by CLI with
+        `PROFILES_DIR`. If None or with remote endpoints, each browser starts
+        with temporary profile.
+    cache_size : float
+        Maximum size in megabytes of disk cache of each profile.
+    url_index : Path | None
+        CSV file with index of canonical URLs of stock pages, used instead
+        of URLs built from company names and updated with URLs of loaded pages.
+        By default None, enabled by CLI with `URL_INDEX_FILE`.
+        If None, URLs are always built from company names.
+    url_reference : Path | None
+        CSV file with stock code and url columns, imported to the index
+        before scraping, replacing indexed URLs.
+    record_dir : Path | None
+        Directory where stock data section of each parsed page is saved,
+        so it can be replayed without browser. Path with `.db` suffix is
+        snapshot store, which keeps deduplicated pages of every run.
+        If None, pages are not recorded.
+    keep_runs : int | None
+        Number of the latest runs kept in snapshot store, None for no limit.
+    snapshot_max_age : float | None
+        Age in days after which snapshots are removed, None for no limit.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    headless: bool = True
+    browser: str = consts.BROWSER_CHROME
+    browser_binary: Path | None = None
+    tabs: int = Field(default=consts.DEFAULT_TABS, ge=1)
+    capture_network: bool = False
+    bulk: bool = False
+    preflight: bool = False
+    workers: int = Field(default=consts.DEFAULT_WORKERS, ge=1)
+    rate_limit: float = Field(default=consts.DEFAULT_RATE_LIMIT, gt=0)
+    remote: dict[str, PositiveInt] = Field(default_factory=dict)
+    recycle_pages: int = Field(default=consts.RECYCLE_PAGES, ge=1)
+    recycle_memory: float = Field(default=consts.RECYCLE_MEMORY_MB, gt=0)
+    profiles_dir: Path | None = None
+    cache_size: float = Field(default=consts.DISK_CACHE_SIZE_MB, gt=0)
+    url_index: Path | None = None
+    url_reference: Path | None = None
+    record_dir: Path | None = None
+    keep_runs: int | None = Field(default=None, ge=1)
+    snapshot_max_age: float | None = Field(default=None, gt=0)
+
+    @field_validator("browser")
+    @classmethod
+    def _validate_browser(cls, value: str) -> str:
+        if value not in consts.BROWSERS:
+            raise ValueError(
+                f"Unknown browser {value!r}, expected one of {consts.BROWSERS}"
+            )
+        return value
@@ -2,9 +2,35 @@
 
 # scraping related constants
 PRICE_TAG_CLASS = "price-tag"
+CURRENCY_TAG_CLASS = "currency-tag"
 STOCK_SCOPE_ID = "ticker"
 TIMESTAMP_ANCESTOR_CLASS = "delay"
 TIMESTAMP_TAG_TYPE = "span"
+LISTING_ROW_CLASS = "instrument-row"
+LISTING_CODE_CLASS = "instrument-tidm"
+LISTING_PRICE_CLASS = "instrument-lastprice"
+LISTING_CURRENCY_CLASS = "instrument-currency"
+LISTING_TIMESTAMP_CLASS = "instrument-lastupdate"
+# link of pagination to the next page, missing on the last page of listing
+LISTING_NEXT_CLASS = "pagination-next"
+# marker shown instead of table of listing without rows
+LISTING_EMPTY_CLASS = "no-results"
+LSE_TIMEZONE = "Europe/London"
+LSE_TIMESTAMP_FORMAT = "%d.%m.%y %H:%M:%S %Z"
+# local part of LSE timestamp, zone abbreviation is parsed separately
+LSE_LOCAL_TIMESTAMP_FORMAT = "%d.%m.%y %H:%M:%S"
+LSE_SUMMER_TIME_ZONE = "BST"
+
+# keys of stock data in JSON responses fetched by LSE page
+PRICE_JSON_KEYS = ["lastprice", "lastPrice"]
+TIMESTAMP_JSON_KEYS = ["lastupdate", "lastUpdate", "lastpricedate"]
+CODE_JSON_KEY = "tidm"
+CURRENCY_JSON_KEY = "currency"
+
+# price conversion related constants
+# units of prices quoted in pence, case matters as `GBP` means pounds
+PENCE_CURRENCIES = ["GBX", "GBp"]
+PENCE_PER_POUND = 100
 
 # driver related constants
 CHROME_DEFAULT_ARGS = [
@@ -17,10 +43,103 @@ CHROME_DEFAULT_ARGS = [
 CHROME_LINUX_ARGS = [
     "--disable-dev-shm-usage",
     "--no-sandbox",
-    "--user-data-dir=driver_logs",
 ]
 CHROME_EXPERIMENTAL = {"excludeSwitches": ["enable-logging", "disable-popup-blocking"]}
 DEFAULT_TIMEOUT = 10
+DEFAULT_TABS = 1
+TAB_POLL_INTERVAL = 0.1
+NETWORK_POLL_INTERVAL = 0.05
+CHROME_PERFORMANCE_LOGGING = {"performance": "ALL"}
+MAX_LISTING_PAGES = 50
+
+# browser backends related constants
+BROWSER_CHROME = "chrome"
+BROWSER_HEADLESS_SHELL = "chrome-headless-shell"
+BROWSER_FIREFOX = "firefox"
+BROWSERS = [BROWSER_CHROME, BROWSER_HEADLESS_SHELL, BROWSER_FIREFOX]
+HEADLESS_SHELL_BINARY = "chrome-headless-shell"
+# popups are allowed and telemetry disabled, as with `CHROME_DEFAULT_ARGS`
+FIREFOX_PREFERENCES = {
+    "dom.disable_open_during_load": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+}
+KILOBYTE = 1024
+
+# logging related constants
+LOG_LEVEL = "INFO"
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+LOG_FORMAT = "%(asctime)s %(levelname)s %(threadName)s %(message)s"
+LOG_ERROR_SAMPLE = 5
+
+# browser profile related constants
+PROFILES_DIR = "driver_profiles"
+PROFILE_PREFIX = "worker-"
+PROFILE_LOCK_FILE = ".lock"
+PROFILE_USED_FILE = ".last_used"
+PROFILE_CACHE_DIR = "cache"
+MAX_PROFILES = 32
+PROFILE_MAX_AGE = 7 * 24 * 3600.0
+DISK_CACHE_SIZE_MB = 256
+
+# sharding related constants
+MERGE_CHUNK_SIZE = 4096
+
+# stock page URL index related constants
+URL_INDEX_FILE = "url_index.csv"
+
+# replay of recorded pages related constants
+REPLAY_HTML_PARSER = "html.parser"
+REPLAY_CHUNK_SIZE = 256
+
+# snapshot store related constants
+SNAPSHOT_SUFFIX = ".db"
+SNAPSHOT_RUN_FORMAT = "%Y%m%dT%H%M%SZ"
+SNAPSHOT_HASH_SIZE = 16
+SNAPSHOT_CHUNK_DIVISOR = 8
+SNAPSHOT_MAX_CHUNK = 4096
+SNAPSHOT_COMPRESSION = 9
+DAY = 24 * 3600.0
+
+# aggregation of collected prices related constants
+AGGREGATION_INTERVAL = "1h"
+
+# concurrency and rate limiting related constants
+DEFAULT_WORKERS = 1
+DEFAULT_RATE_LIMIT = 2.0
+RATE_LIMIT_BURST = 1
+SLOW_PAGE_LOAD = 5.0
+CONCURRENCY_DECREASE = 0.5
+ERROR_WINDOW = 20
+ERROR_THRESHOLD = 0.5
+
+# pre-flight check related constants
+PREFLIGHT_WORKERS = 8
+PREFLIGHT_TIMEOUT = 10.0
+PREFLIGHT_RATE_LIMIT = 20.0
+
+# remote WebDriver endpoints related constants
+REMOTE_CAPACITY = 1
+REMOTE_FAILURE_THRESHOLD = 3
+REMOTE_COOLDOWN = 60.0
+
+# work queue related constants
+DEFAULT_LEASE = 600.0
+DEFAULT_BATCH_SIZE = 20
+
+# SQLite files shared by processes related constants
+SQLITE_BUSY_TIMEOUT = 30.0
+
+# staged pipeline of the run related constants
+PIPELINE_QUEUE_SIZE = 2
+PIPELINE_POLL_INTERVAL = 0.1
+
+# driver recycling related constants
+RECYCLE_PAGES = 500
+RECYCLE_MEMORY_MB = 2048
+MEGABYTE = 1024**2
+RECYCLE_MEMORY = RECYCLE_MEMORY_MB * MEGABYTE
+MEMORY_CHECK_INTERVAL = 10
 
 
 class LSEWebsite:
@@ -30,6 +149,8 @@ class LSEWebsite:
     STOCK_ENDPOINT = f"stock"
     # it's a page where LSE websites redirects when url for stock details is invalid
     PRICE_EXPLORER_URL = f"{BASE_URL}/live-markets/market-data-dashboard/price-explorer"
+    # query parameter selecting page of paginated listing
+    LISTING_PAGE_PARAM = "page"
 
 
 class DataColumns:
@@ -39,5 +160,7 @@ class DataColumns:
     STOCK_CODE = "stock_code"
     TIMESTAMP = "timestamp"
     VALUE = "value"
+    PRIORITY = "priority"
 
     USE_COLUMNS = [COMPANY_NAME, STOCK_CODE]
+    OPTIONAL_COLUMNS = [PRIORITY]
@@ -0,0 +1,162 @@
+"""
+Module aggregating prices collected by repeated runs into intervals
+with open, high, low and close price, percentage change and staleness.
+Observations of all stocks are aggregated at once: they are sorted
+by stock and time, and each interval is reduced with NumPy over its slice,
+without iterating over stocks or intervals in Python.
+"""
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+import app.constants as const
+from app.constants import DataColumns
+from app.data_managers.delta import read_previous
+from app.data_managers.parsers import parse_timestamps
+from app.types import PathType
+
+INTERVAL_COLUMN = "interval"
+OPEN_COLUMN = "open"
+HIGH_COLUMN = "high"
+LOW_COLUMN = "low"
+CLOSE_COLUMN = "close"
+CHANGE_COLUMN = "change_pct"
+OBSERVATIONS_COLUMN = "observations"
+STALENESS_COLUMN = "staleness"
+OHLC_COLUMNS = [
+    DataColumns.STOCK_CODE,
+    INTERVAL_COLUMN,
+    OPEN_COLUMN,
+    HIGH_COLUMN,
+    LOW_COLUMN,
+    CLOSE_COLUMN,
+    CHANGE_COLUMN,
+    OBSERVATIONS_COLUMN,
+    STALENESS_COLUMN,
+]
+
+
+def parse_interval(value: str) -> pd.Timedelta:
+    """
+    Parses length of aggregation interval, e.g. `1min`, `15min`, `1h`.
+
+    Parameters
+    ----------
+    value : str
+        Length of the interval in format accepted by `pd.Timedelta`.
+
+    Returns
+    -------
+    pd.Timedelta
+        Length of the interval.
+
+    Raises
+    ------
+    ValueError
+        If value is not valid or not positive duration.
+    """
+    interval = pd.Timedelta(value)
+
+    if interval <= pd.Timedelta(0):
+        raise ValueError(f"Interval must be positive: {value}")
+
+    return interval
+
+
+def read_observations(paths: Sequence[PathType]) -> pd.DataFrame:
+    """
+    Reads outputs of repeated runs as observations of prices.
+    Rows without timestamp or value, e.g. failed stocks, are dropped.
+
+    Parameters
+    ----------
+    paths : Sequence[PathType]
+        Paths to output CSV files, in any format of timestamps.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with stock code, timezone-aware timestamp and value columns.
+    """
+    data = pd.concat([read_previous(path) for path in paths], ignore_index=True)
+    observations = pd.DataFrame(
+        {
+            DataColumns.STOCK_CODE: data[DataColumns.STOCK_CODE],
+            DataColumns.TIMESTAMP: parse_timestamps(data[DataColumns.TIMESTAMP]),
+            DataColumns.VALUE: pd.to_numeric(data[DataColumns.VALUE], errors="coerce"),
+        }
+    )
+    return observations.dropna().reset_index(drop=True)
+
+
+def aggregate_ohlc(observations: pd.DataFrame, interval: pd.Timedelta) -> pd.DataFrame:
+    """
+    Aggregates observations of each stock into intervals of given length.
+    Repeated observations of the same stock and timestamp, e.g. price
+    scraped again before it was updated, are counted once.
+
+    Intervals are aligned to UTC midnight and only intervals with observations
+    are returned. Percentage change is relative to close of the previous
+    returned interval of the stock. Staleness is time in seconds from
+    the last observation of the interval to its end.
+
+    Parameters
+    ----------
+    observations : pd.DataFrame
+        Observations of prices, see `read_observations`.
+    interval : pd.Timedelta
+        Length of the interval.
+
+    Returns
+    -------
+    pd.DataFrame
+        Row per stock and interval, ordered by stock code and start
+        of the interval, with columns `OHLC_COLUMNS`.
+    """
+    codes, stocks = pd.factorize(observations[DataColumns.STOCK_CODE], sort=True)
+    times = observations[DataColumns.TIMESTAMP].dt.as_unit("ns").array.asi8
+    values = observations[DataColumns.VALUE].to_numpy(dtype=float)
+
+    order = np.lexsort((times, codes))
+    codes, times, values = codes[order], times[order], values[order]
+
+    # the last of repeated observations is kept
+    unique = np.ones(len(codes), dtype=bool)
+    unique[:-1] = (codes[1:] != codes[:-1]) | (times[1:] != times[:-1])
+    codes, times, values = codes[unique], times[unique], values[unique]
+
+    step = interval.value
+    buckets = times // step * step
+    first = np.ones(len(codes), dtype=bool)
+    first[1:] = (codes[1:] != codes[:-1]) | (buckets[1:] != buckets[:-1])
+    starts = np.flatnonzero(first)
+
+    if not len(starts):
+        return pd.DataFrame(columns=OHLC_COLUMNS)
+
+    ends = np.append(starts[1:], len(codes)) - 1
+    close = values[ends]
+    group_codes = codes[starts]
+
+    previous_close = np.roll(close, 1)
+    new_stock = np.ones(len(starts), dtype=bool)
+    new_stock[1:] = group_codes[1:] != group_codes[:-1]
+    previous_close[new_stock] = np.nan
+
+    return pd.DataFrame(
+        {
+            DataColumns.STOCK_CODE: stocks[group_codes],
+            INTERVAL_COLUMN: pd.to_datetime(buckets[starts], utc=True).tz_convert(
+                const.LSE_TIMEZONE
+            ),
+            OPEN_COLUMN: values[starts],
+            HIGH_COLUMN: np.maximum.reduceat(values, starts),
+            LOW_COLUMN: np.minimum.reduceat(values, starts),
+            CLOSE_COLUMN: close,
+            CHANGE_COLUMN: (close / previous_close - 1) * 100,
+            OBSERVATIONS_COLUMN: np.diff(starts, append=len(codes)),
+            STALENESS_COLUMN: (buckets[starts] + step - times[ends]) / 1e9,
+        }
+    )
@@ -0,0 +1,107 @@
+"""
+Module with functions selecting rows of the output, which changed
+since the previous run. Rows are matched by stock code, values are compared
+as numbers and timestamps as points in time, regardless of their format.
+"""
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.constants import DataColumns
+from app.data_managers.parsers import parse_timestamps
+from app.types import PathType
+
+DELTA_COLUMNS = [DataColumns.STOCK_CODE, DataColumns.TIMESTAMP, DataColumns.VALUE]
+
+
+def read_previous(path: PathType) -> pd.DataFrame:
+    """
+    Reads output of the previous run, keeping only columns compared by delta.
+
+    Parameters
+    ----------
+    path : PathType
+        Path to the output CSV file of the previous run.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with stock code, timestamp and value columns.
+    """
+    data = pd.read_csv(
+        path,
+        usecols=lambda name: name.replace(" ", "_").lower() in DELTA_COLUMNS,
+        dtype={DataColumns.STOCK_CODE: str, DataColumns.TIMESTAMP: str},
+    )
+    data.columns = [name.replace(" ", "_").lower() for name in data.columns]
+    return data[DELTA_COLUMNS]
+
+
+def previous_timestamps(
+    stock_codes: Sequence[str], previous: pd.DataFrame
+) -> pd.Series:
+    """
+    Returns time of the last update of each stock in the previous output.
+    If stock appears in previous output multiple times, its last row is used.
+
+    Parameters
+    ----------
+    stock_codes : Sequence[str]
+        Stock codes of the current run.
+    previous : pd.DataFrame
+        Output of the previous run, see `read_previous`.
+
+    Returns
+    -------
+    pd.Series
+        Timezone-aware timestamps, NaT for stocks missing from previous output
+        or without timestamp.
+    """
+    previous = previous.drop_duplicates(DataColumns.STOCK_CODE, keep="last")
+    position = pd.Index(previous[DataColumns.STOCK_CODE]).get_indexer(stock_codes)
+    timestamps = parse_timestamps(previous[DataColumns.TIMESTAMP]).array
+    return pd.Series(timestamps.take(position, allow_fill=True))
+
+
+def changed_rows(current: pd.DataFrame, previous: pd.DataFrame) -> pd.DataFrame:
+    """
+    Selects rows of current output, whose value or timestamp differs
+    from the previous output, or whose stock was not present in it.
+    Missing values are equal to each other. If stock appears in previous
+    output multiple times, its last row is compared.
+
+    Parameters
+    ----------
+    current : pd.DataFrame
+        Output of the current run.
+    previous : pd.DataFrame
+        Output of the previous run, see `read_previous`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Changed rows of current output, in their original order.
+    """
+    previous = previous.drop_duplicates(DataColumns.STOCK_CODE, keep="last")
+    position = pd.Index(previous[DataColumns.STOCK_CODE]).get_indexer(
+        current[DataColumns.STOCK_CODE]
+    )
+    known = position >= 0
+
+    value = current[DataColumns.VALUE].to_numpy(dtype=float)
+    previous_value = previous[DataColumns.VALUE].to_numpy(dtype=float)
+    previous_value = np.append(previous_value, np.nan)[position]
+    same_value = (value == previous_value) | (
+        np.isnan(value) & np.isnan(previous_value)
+    )
+
+    timestamp = parse_timestamps(current[DataColumns.TIMESTAMP]).array
+    previous_timestamp = parse_timestamps(previous[DataColumns.TIMESTAMP]).array
+    previous_timestamp = previous_timestamp.take(position, allow_fill=True)
+    same_timestamp = np.asarray(timestamp == previous_timestamp, dtype=bool) | (
+        timestamp.isna() & previous_timestamp.isna()
+    )
+
+    return current[~(known & same_value & same_timestamp)]
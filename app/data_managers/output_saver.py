@@ -16,7 +16,7 @@ class IDataSaver(ABC):
     Interface for data savers. Defines a method to save data to a specified folder.
     """
 
-    def save(self, data: pd.DataFrame, path: PathType) -> None:
+    def save(self, data: pd.DataFrame, path: PathType, append: bool = False) -> None:
         """
         Saves the provided DataFrame to the specified output folder.
         Ensures the output directory exists before saving.
@@ -27,6 +27,9 @@ class IDataSaver(ABC):
             DataFrame containing the data to be saved.
         path : PathType
             Path to the file where the data will be saved.
+        append : bool, optional
+            Whether to append rows to the file saved before, e.g. output
+            saved in chunks, by default False, which means file is overwritten.
         """
         path = Path(path)
         directory = path.parent
@@ -34,10 +37,10 @@ class IDataSaver(ABC):
         if not directory.exists():
             directory.mkdir(parents=True, exist_ok=True)
 
-        self._save(data=data, path=path)
+        self._save(data=data, path=path, append=append)
 
     @abstractmethod
-    def _save(self, data: pd.DataFrame, path: Path) -> None:
+    def _save(self, data: pd.DataFrame, path: Path, append: bool) -> None:
         """
         Internal method to save the DataFrame to the specified path.
         Must be implemented by subclasses.
@@ -48,6 +51,8 @@ class IDataSaver(ABC):
             DataFrame containing the data to be saved.
         path : Path
             Path to the file where the data will be saved.
+        append : bool
+            Whether to append rows to existing file with the same columns.
         """
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -58,5 +63,5 @@ class CSVSaver(IDataSaver):
     Optionally includes a timestamp in the filename.
     """
 
-    def _save(self, data: pd.DataFrame, path: Path) -> None:
-        data.to_csv(path, index=False)
+    def _save(self, data: pd.DataFrame, path: Path, append: bool) -> None:
+        data.to_csv(path, index=False, mode="a" if append else "w", header=not append)
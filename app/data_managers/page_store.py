@@ -0,0 +1,88 @@
+"""
+Module with stores of rendered stock pages. Pages recorded during scraping
+can be parsed again later without browser, e.g. after scraper model was fixed.
+Contains IPageStore interface and specific implementations.
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from urllib.parse import quote
+
+from app.types import PathType
+
+PAGE_SUFFIX = ".html"
+
+
+class IPageStore(ABC):
+    """
+    Interface for page stores. Defines methods to save and load
+    HTML of the stock page by stock code.
+    """
+
+    @abstractmethod
+    def save(self, stock_code: str, html: str) -> None:
+        """
+        Saves HTML of the page of given stock, replacing previous one.
+
+        Parameters
+        ----------
+        stock_code : str
+            Stock code (ticker symbol) of the stock.
+        html : str
+            Rendered HTML of the stock data section of the page.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def load(self, stock_code: str) -> str | None:
+        """
+        Loads HTML of the page of given stock.
+
+        Parameters
+        ----------
+        stock_code : str
+            Stock code (ticker symbol) of the stock.
+
+        Returns
+        -------
+        str | None
+            Saved HTML of the page, None if page of the stock was not saved.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class DirectoryPageStore(IPageStore):
+    """
+    Implementation of IPageStore keeping each page in separate HTML file
+    named after stock code, e.g. `XD.html`, in given directory.
+    Files are replaced atomically, so concurrent drivers can record pages.
+    """
+
+    def __init__(self, root: PathType) -> None:
+        """
+        Parameters
+        ----------
+        root : PathType
+            Directory with HTML files of pages, created on first save.
+        """
+        self.root = Path(root)
+
+    def save(self, stock_code: str, html: str) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(stock_code)
+        owner = f"{os.getpid()}.{threading.get_ident()}"
+        temporary = path.with_name(f".{path.name}.{owner}.tmp")
+        temporary.write_text(html, encoding="utf-8")
+        temporary.replace(path)
+
+    def load(self, stock_code: str) -> str | None:
+        try:
+            return self._path(stock_code).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _path(self, stock_code: str) -> Path:
+        # stock codes are used as file names, so path separators are escaped
+        return self.root / f"{quote(stock_code, safe='')}{PAGE_SUFFIX}"
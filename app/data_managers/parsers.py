@@ -1,11 +1,19 @@
 """Module containing functions to parse input data into application-specific models."""
 
+from typing import Sequence
+
+import numpy as np
 import pandas as pd
 from pydantic import ValidationError
 
 import app.constants as const
 import app.exceptions as exc
-from app.models.pydantic_models import StockRequest
+from app.models.pydantic_models import (
+    FailedStockResponse,
+    RawStockResponse,
+    StockRequest,
+    StockResponse,
+)
 
 
 def parse_requests(data: pd.DataFrame) -> list[StockRequest]:
@@ -37,6 +45,39 @@ def parse_requests(data: pd.DataFrame) -> list[StockRequest]:
     return requests
 
 
+def parse_priorities(data: pd.DataFrame) -> np.ndarray:
+    """
+    Extracts priority of each request from optional priority column.
+    Missing priorities, or missing column, mean priority 0.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame containing stock request data.
+
+    Returns
+    -------
+    np.ndarray
+        Priority of each row of the data as float.
+
+    Raises
+    ------
+    exc.DataValidationError
+        If any of priorities is not a number.
+    """
+    if const.DataColumns.PRIORITY not in data.columns:
+        return np.zeros(len(data))
+
+    column = data[const.DataColumns.PRIORITY]
+    priorities = pd.to_numeric(column, errors="coerce")
+    invalid = priorities.isna() & column.notna()
+
+    if invalid.any():
+        raise exc.DataValidationError(f"Invalid priorities: {column[invalid].tolist()}")
+
+    return priorities.fillna(0).to_numpy(dtype=float)
+
+
 def parse_url(stock_info: StockRequest) -> str:
     """
     Constructs the URL for a given stock based on its code and company name.
@@ -58,3 +99,138 @@ def parse_url(stock_info: StockRequest) -> str:
         stock_info.company_name.lower().replace(" ", "-"),
     ]
     return "/".join(url_parts)
+
+
+def parse_listing_url(page: int) -> str:
+    """
+    Constructs the URL of given page of paginated instruments listing.
+
+    Parameters
+    ----------
+    page : int
+        Number of the page, starting from 1.
+
+    Returns
+    -------
+    str
+        Constructed URL for the listing page on the LSE website.
+    """
+    return (
+        f"{const.LSEWebsite.PRICE_EXPLORER_URL}"
+        f"?{const.LSEWebsite.LISTING_PAGE_PARAM}={page}"
+    )
+
+
+def parse_timestamps(timestamps: pd.Series) -> pd.Series:
+    """
+    Converts LSE timestamp strings, e.g. `14.09.25 13:03:33 BST`,
+    into timezone-aware datetimes in LSE timezone. Zone abbreviation decides
+    whether ambiguous local time falls in summer time. Strings in ISO 8601
+    format with UTC offset are accepted as well.
+
+    Each distinct string is parsed once, as many stocks share timestamps.
+
+    Parameters
+    ----------
+    timestamps : pd.Series
+        Series of timestamp strings, missing values are allowed.
+
+    Returns
+    -------
+    pd.Series
+        Series of datetimes with the same index, `NaT` for missing
+        or unparseable timestamps.
+    """
+    codes, uniques = pd.factorize(timestamps)
+    strings = pd.Series(uniques, dtype=str)
+    parts = strings.str.rsplit(" ", n=1, expand=True).reindex(columns=[0, 1])
+
+    local = pd.to_datetime(
+        parts[0], format=const.LSE_LOCAL_TIMESTAMP_FORMAT, errors="coerce"
+    )
+    parsed = local.dt.tz_localize(
+        const.LSE_TIMEZONE,
+        ambiguous=(parts[1] == const.LSE_SUMMER_TIME_ZONE).to_numpy(),
+        nonexistent="NaT",
+    )
+    iso = pd.to_datetime(
+        strings.where(parsed.isna()), format="ISO8601", utc=True, errors="coerce"
+    )
+    parsed = parsed.fillna(iso.dt.tz_convert(const.LSE_TIMEZONE))
+
+    values = parsed.array.take(codes, allow_fill=True)
+    return pd.Series(values, index=timestamps.index, name=timestamps.name)
+
+
+def parse_prices(prices: pd.Series, currencies: pd.Series) -> pd.Series:
+    """
+    Converts price strings displayed by LSE, e.g. `1,383.20`, into numbers
+    in pounds. Prices quoted in pence, see `PENCE_CURRENCIES`, are divided
+    by `PENCE_PER_POUND`, prices without currency are kept as they are.
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Series of price strings, missing values are allowed.
+    currencies : pd.Series
+        Series of units of prices with the same index, e.g. `GBX` or `GBP`.
+
+    Returns
+    -------
+    pd.Series
+        Series of float prices with the same index, `NaN` for missing,
+        unparseable or infinite prices.
+    """
+    text = prices.astype("string").str.replace(",", "", regex=False).str.strip()
+    values = pd.to_numeric(text, errors="coerce").astype(float)
+    values = values.where(np.isfinite(values))
+    pence = currencies.isin(const.PENCE_CURRENCIES).to_numpy()
+    return values.where(~pence, values / const.PENCE_PER_POUND)
+
+
+def parse_responses(
+    raws: Sequence[RawStockResponse],
+) -> tuple[list[StockResponse], dict[str, str]]:
+    """
+    Converts prices of scraped responses into numbers in pounds
+    with single `parse_prices` call for all of them.
+
+    Parameters
+    ----------
+    raws : Sequence[RawStockResponse]
+        Responses with price text and currency as scraped.
+
+    Returns
+    -------
+    tuple[list[StockResponse], dict[str, str]]
+        Responses in the same order as `raws`, with `FailedStockResponse`
+        for each price, which could not be parsed, and price text
+        of these failed responses by stock code.
+    """
+    values = parse_prices(
+        pd.Series([raw.value for raw in raws], dtype=object),
+        pd.Series([raw.currency for raw in raws], dtype=object),
+    )
+    responses: list[StockResponse] = []
+    failures: dict[str, str] = {}
+
+    for raw, value in zip(raws, values.tolist()):
+        if np.isnan(value):
+            failures[raw.stock_code] = raw.value
+            responses.append(
+                FailedStockResponse(
+                    company_name=raw.company_name, stock_code=raw.stock_code
+                )
+            )
+            continue
+
+        responses.append(
+            StockResponse(
+                company_name=raw.company_name,
+                stock_code=raw.stock_code,
+                timestamp=raw.timestamp,
+                value=value,
+            )
+        )
+
+    return responses, failures
@@ -1,16 +1,39 @@
 """
 Module with classes for reading and processing data files.
 Contains Reader interface and specific implementations.
+
+Readers of LSE input in all formats normalize column names the same way
+and read only relevant columns: header is inspected first, so column
+selection and string types of text columns are passed to the underlying
+parser and other columns of wide files are never parsed.
+Input can be read in chunks of rows, which CSV and Parquet readers
+stream from the file instead of reading it whole.
 """
 
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pj
+import pyarrow.parquet as pq
 
+import app.exceptions as exc
 from app.constants import DataColumns
 from app.types import PathType
 
+# columns holding text, which must not be inferred as numbers, e.g. stock codes
+STRING_COLUMNS = [DataColumns.COMPANY_NAME, DataColumns.STOCK_CODE]
+# types of other columns in formats, which need explicit types, e.g. JSON Lines
+NUMERIC_COLUMNS = {DataColumns.PRIORITY: pa.float64()}
+
+
+def normalize_column(name: str) -> str:
+    """Normalizes column name provided by client, e.g. `Stock Code` to `stock_code`."""
+    return name.replace(" ", "_").lower()
+
 
 class IDataReader(ABC):
     """
@@ -35,16 +58,236 @@ class IDataReader(ABC):
         raise NotImplementedError("Subclasses must implement this method")
 
 
+class BaseLSEReader(IDataReader):
+    """
+    Base of readers of London Stock Exchange data files in the format
+    provided by client. Reads only relevant columns and renames them
+    to processing friendly names. Optional columns are kept if present.
+    Subclasses read file of specific format, pushing column selection
+    and types down to the parser.
+    """
+
+    def read(self, path: PathType) -> pd.DataFrame:
+        columns, strings = self._columns(Path(path))
+        data = self._read(Path(path), columns=columns, strings=strings)
+        return self._normalize(data)
+
+    def read_chunks(
+        self, path: PathType, size: int | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads data from the specified path in chunks of rows.
+
+        Parameters
+        ----------
+        path : PathType
+            Path to the data file, either as a string or Path object.
+        size : int | None, optional
+            Maximum number of rows of each chunk, by default None,
+            which means whole file is read as single chunk.
+
+        Yields
+        ------
+        pd.DataFrame
+            Consecutive chunks of the data, with the same columns as `read`.
+        """
+        if size is None:
+            yield self.read(path)
+            return
+
+        columns, strings = self._columns(Path(path))
+
+        for chunk in self._read_chunks(Path(path), columns, strings, size):
+            yield self._normalize(chunk)
+
+    def _columns(self, path: Path) -> tuple[list[str], list[str]]:
+        """Returns names of relevant columns of the file and of its text columns."""
+        wanted = DataColumns.USE_COLUMNS + DataColumns.OPTIONAL_COLUMNS
+        columns = [col for col in self._header(path) if normalize_column(col) in wanted]
+        strings = [col for col in columns if normalize_column(col) in STRING_COLUMNS]
+        return columns, strings
+
+    def _normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Renames columns of read data and orders them, optional ones last."""
+        data.columns = [normalize_column(col) for col in data.columns]
+        optional = [col for col in DataColumns.OPTIONAL_COLUMNS if col in data.columns]
+        return data[DataColumns.USE_COLUMNS + optional]
+
+    def _read_chunks(
+        self, path: Path, columns: list[str], strings: list[str], size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads only given columns of the file in chunks of `size` rows.
+        By default whole file is read and split, subclasses of formats,
+        which can be streamed, override it.
+        """
+        data = self._read(path, columns=columns, strings=strings)
+
+        for start in range(0, len(data), size):
+            yield data.iloc[start : start + size]
+
+    @abstractmethod
+    def _header(self, path: Path) -> list[str]:
+        """
+        Returns names of all columns of the file, without reading its rows.
+        Must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def _read(self, path: Path, columns: list[str], strings: list[str]) -> pd.DataFrame:
+        """
+        Reads only given columns of the file, parsing `strings` columns as text.
+        Must be implemented by subclasses.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the data file.
+        columns : list[str]
+            Names of columns to be read, as they appear in the file.
+        strings : list[str]
+            Names of columns of `columns`, which are read as strings.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class CSVReader(BaseLSEReader):
+    """Implementation of BaseLSEReader reading CSV files."""
+
+    def _header(self, path: Path) -> list[str]:
+        return pd.read_csv(path, nrows=0).columns.tolist()
+
+    def _read(self, path: Path, columns: list[str], strings: list[str]) -> pd.DataFrame:
+        return pd.read_csv(path, usecols=columns, dtype=dict.fromkeys(strings, str))
+
+    def _read_chunks(
+        self, path: Path, columns: list[str], strings: list[str], size: int
+    ) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            path, usecols=columns, dtype=dict.fromkeys(strings, str), chunksize=size
+        ) as chunks:
+            yield from chunks
+
+
+class ParquetReader(BaseLSEReader):
+    """
+    Implementation of BaseLSEReader reading Parquet files with Arrow,
+    which reads only projected columns from the file.
+    """
+
+    def _header(self, path: Path) -> list[str]:
+        return pq.read_schema(path).names
+
+    def _read(self, path: Path, columns: list[str], strings: list[str]) -> pd.DataFrame:
+        return self._to_pandas(pq.read_table(path, columns=columns), strings)
+
+    def _read_chunks(
+        self, path: Path, columns: list[str], strings: list[str], size: int
+    ) -> Iterator[pd.DataFrame]:
+        file = pq.ParquetFile(path)
+
+        for batch in file.iter_batches(batch_size=size, columns=columns):
+            yield self._to_pandas(pa.Table.from_batches([batch]), strings)
+
+    @staticmethod
+    def _to_pandas(table: pa.Table, strings: list[str]) -> pd.DataFrame:
+        for name in strings:
+            position = table.schema.get_field_index(name)
+            table = table.set_column(
+                position, name, table.column(name).cast(pa.string())
+            )
+
+        return table.to_pandas()
+
+
+class JSONLinesReader(BaseLSEReader):
+    """
+    Implementation of BaseLSEReader reading JSON Lines files with Arrow.
+    Columns are taken from the first record, their types are pinned:
+    text columns are strings and others have types of `NUMERIC_COLUMNS`,
+    so types don't depend on values of any single record.
+    Only fields of selected columns are converted, other fields are skipped.
+    """
+
+    def _header(self, path: Path) -> list[str]:
+        return list(self._first_record(path))
+
+    def _read(self, path: Path, columns: list[str], strings: list[str]) -> pd.DataFrame:
+        schema = pa.schema(
+            [
+                (
+                    name,
+                    (
+                        pa.string()
+                        if name in strings
+                        else NUMERIC_COLUMNS[normalize_column(name)]
+                    ),
+                )
+                for name in columns
+            ]
+        )
+        options = pj.ParseOptions(
+            explicit_schema=schema, unexpected_field_behavior="ignore"
+        )
+
+        try:
+            return pj.read_json(path, parse_options=options).to_pandas()
+        except pa.ArrowInvalid as e:
+            raise exc.DataValidationError(
+                f"Invalid JSON Lines input {path}: {e}"
+            ) from e
+
+    @staticmethod
+    def _first_record(path: Path) -> dict:
+        with open(path, encoding="utf-8") as file:
+            line = file.readline()
+
+        return json.loads(line) if line.strip() else {}
+
+
+class ExcelReader(BaseLSEReader):
+    """Implementation of BaseLSEReader reading the first sheet of Excel files."""
+
+    def _header(self, path: Path) -> list[str]:
+        return [str(col) for col in pd.read_excel(path, nrows=0).columns]
+
+    def _read(self, path: Path, columns: list[str], strings: list[str]) -> pd.DataFrame:
+        return pd.read_excel(path, usecols=columns, dtype=dict.fromkeys(strings, str))
+
+
+READERS: dict[str, type[BaseLSEReader]] = {
+    ".csv": CSVReader,
+    ".parquet": ParquetReader,
+    ".jsonl": JSONLinesReader,
+    ".xlsx": ExcelReader,
+}
+
+
 class LSEDataReader(IDataReader):
     """
     Implementation of IDataReader for London Stock Exchange data files
-    in the format provided by client. Reads only relevant columns and renames them
-    to processing friendly names.
+    in the format provided by client. Format is picked by file extension,
+    see `READERS`.
     """
 
     def read(self, path: PathType) -> pd.DataFrame:
-        data = pd.read_csv(path)
-        columns = [col.replace(" ", "_").lower() for col in data.columns]
-        data.columns = columns
-        data = data[DataColumns.USE_COLUMNS]
-        return data
+        return self._reader(path).read(path)
+
+    def read_chunks(
+        self, path: PathType, size: int | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """Reads data in chunks of rows, see `BaseLSEReader.read_chunks`."""
+        return self._reader(path).read_chunks(path, size)
+
+    @staticmethod
+    def _reader(path: PathType) -> BaseLSEReader:
+        """Returns reader of the format of the file, picked by its extension."""
+        suffix = Path(path).suffix.lower()
+
+        if suffix not in READERS:
+            raise exc.DataValidationError(
+                f"Unsupported input format {suffix!r}, expected one of {list(READERS)}"
+            )
+
+        return READERS[suffix]()
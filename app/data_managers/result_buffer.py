@@ -0,0 +1,209 @@
+"""
+Module with compact columnar accumulator for scraping results.
+Stores results in preallocated arrays instead of a list of pydantic models,
+so building output DataFrame does not require per-row copies.
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.constants import DataColumns
+from app.models.pydantic_models import StockResponse
+
+DEFAULT_CAPACITY = 1024
+MISSING_CODE = -1
+
+
+class StringPool:
+    """
+    Interns strings and maps each unique value to an integer code.
+    Codes are positions in `categories` list, None is mapped to `MISSING_CODE`.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self.categories: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def code(self, value: str | None) -> int:
+        """
+        Returns integer code of the value, adding it to the pool if it's not there.
+
+        Parameters
+        ----------
+        value : str | None
+            String to be interned. None is treated as missing value.
+
+        Returns
+        -------
+        int
+            Code of the value in the pool or `MISSING_CODE` for None.
+        """
+        if value is None:
+            return MISSING_CODE
+
+        code = self._index.get(value)
+
+        if code is None:
+            code = len(self.categories)
+            self._index[value] = code
+            self.categories.append(value)
+
+        return code
+
+
+class ResultBuffer:
+    """
+    Columnar accumulator of scraping results. Values are kept in numpy float64 array
+    and string columns as integer codes of interned strings, which are exposed
+    as pandas categoricals in output DataFrame.
+
+    Arrays are preallocated and grow geometrically, so appending is amortized O(1).
+
+    Example
+    -------
+    >>> buffer = ResultBuffer()
+    >>> buffer.append_response(response)
+    >>> buffer.append(company_name="Xylion Devices", stock_code="XD")
+    >>> buffer.to_frame()
+    """
+
+    STRING_COLUMNS = [
+        DataColumns.COMPANY_NAME,
+        DataColumns.STOCK_CODE,
+        DataColumns.TIMESTAMP,
+    ]
+    COLUMNS = STRING_COLUMNS + [DataColumns.VALUE]
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Initializes empty buffer with preallocated arrays.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Initial number of rows to allocate, by default `DEFAULT_CAPACITY`.
+            Should be set to expected number of results to avoid reallocations.
+        """
+        capacity = max(capacity, 1)
+
+        self._size = 0
+        self._exported = False
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._codes = {
+            column: np.empty(capacity, dtype=np.int32) for column in self.STRING_COLUMNS
+        }
+        self._pools = {column: StringPool() for column in self.STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows that can be stored without reallocation."""
+        return len(self._values)
+
+    def append(
+        self,
+        company_name: str,
+        stock_code: str,
+        timestamp: str | None = None,
+        value: float | None = None,
+    ) -> None:
+        """
+        Appends single result to the buffer. Missing timestamp and value
+        are stored as missing values, which represents failed scraping.
+
+        Parameters
+        ----------
+        company_name : str
+            Name of the company.
+        stock_code : str
+            Stock code (ticker symbol) of the company.
+        timestamp : str | None, optional
+            Timestamp of the scraped value, by default None.
+        value : float | None, optional
+            Scraped stock value, by default None.
+        """
+        self._reserve(self._size + 1)
+
+        row = self._size
+        self._codes[DataColumns.COMPANY_NAME][row] = self._pools[
+            DataColumns.COMPANY_NAME
+        ].code(company_name)
+        self._codes[DataColumns.STOCK_CODE][row] = self._pools[
+            DataColumns.STOCK_CODE
+        ].code(stock_code)
+        self._codes[DataColumns.TIMESTAMP][row] = self._pools[
+            DataColumns.TIMESTAMP
+        ].code(timestamp)
+        self._values[row] = np.nan if value is None else value
+
+        self._size += 1
+
+    def append_response(self, response: StockResponse) -> None:
+        """
+        Appends scraping response to the buffer.
+
+        Parameters
+        ----------
+        response : StockResponse
+            Response model, either successful or failed.
+        """
+        self.append(
+            company_name=response.company_name,
+            stock_code=response.stock_code,
+            timestamp=response.timestamp,
+            value=response.value,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Builds output DataFrame from buffered results. Columns are views
+        on internal arrays and are not copied. Further appends to the buffer
+        do not modify already returned DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with columns in order of `COLUMNS`.
+        """
+        columns: dict[str, pd.Categorical | np.ndarray] = {
+            column: pd.Categorical.from_codes(
+                self._codes[column][: self._size],
+                categories=pd.Index(self._pools[column].categories, dtype=object),
+            )
+            for column in self.STRING_COLUMNS
+        }
+        columns[DataColumns.VALUE] = self._values[: self._size]
+
+        self._exported = True
+        return pd.DataFrame(columns, columns=self.COLUMNS, copy=False)
+
+    def _reserve(self, size: int) -> None:
+        """
+        Ensures arrays can hold at least `size` rows. Reallocates them
+        if needed or if they are shared with DataFrame that was already exported.
+        """
+        if size <= self.capacity and not self._exported:
+            return
+
+        capacity = self.capacity
+
+        while capacity < size:
+            capacity *= 2
+
+        self._values = self._resized(self._values, capacity)
+        self._codes = {
+            column: self._resized(codes, capacity)
+            for column, codes in self._codes.items()
+        }
+        self._exported = False
+
+    def _resized(self, array: np.ndarray, capacity: int) -> np.ndarray:
+        """Returns new array of given capacity with copied filled rows."""
+        resized = np.empty(capacity, dtype=array.dtype)
+        resized[: self._size] = array[: self._size]
+        return resized
@@ -0,0 +1,183 @@
+"""
+Module with functions for splitting input between independent nodes
+and merging their outputs back. Requests are assigned to shards by stable hash
+of stock code, so each node scrapes disjoint subset of the input.
+"""
+
+import csv
+import zlib
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Iterator, Sequence
+
+import app.constants as const
+import app.exceptions as exc
+from app.constants import DataColumns
+from app.data_managers.parsers import parse_requests
+from app.data_managers.reader import LSEDataReader
+from app.models.pydantic_models import StockRequest
+from app.types import PathType
+
+
+def shard_of(stock_code: str, shards: int) -> int:
+    """
+    Returns shard of the stock. Hash is stable across processes and machines,
+    unlike built-in `hash` of strings.
+
+    Parameters
+    ----------
+    stock_code : str
+        Stock code (ticker symbol) of the stock.
+    shards : int
+        Total number of shards.
+
+    Returns
+    -------
+    int
+        Index of the shard, from 0 to `shards - 1`.
+    """
+    return zlib.crc32(stock_code.encode()) % shards
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parses shard specification in format `i/n`, where `i` is zero-based index
+    of the shard and `n` is total number of shards.
+
+    Parameters
+    ----------
+    value : str
+        Shard specification, e.g. `0/4`.
+
+    Returns
+    -------
+    tuple[int, int]
+        Index of the shard and total number of shards.
+
+    Raises
+    ------
+    ValueError
+        If specification is malformed or index is out of range.
+    """
+    index, _, shards = value.partition("/")
+    shard = (int(index), int(shards))
+
+    if not 0 <= shard[0] < shard[1]:
+        raise ValueError(f"Shard index must be in range [0, {shard[1]}): {value}")
+
+    return shard
+
+
+def shard_mask(requests: list[StockRequest], index: int, shards: int) -> list[bool]:
+    """
+    Returns whether each of requests belongs to given shard,
+    e.g. to select data aligned with requests.
+
+    Parameters
+    ----------
+    requests : list[StockRequest]
+        All requests of the input.
+    index : int
+        Index of the shard.
+    shards : int
+        Total number of shards.
+
+    Returns
+    -------
+    list[bool]
+        Flag for each request, True if request is assigned to the shard.
+    """
+    return [shard_of(r.stock_code, shards) == index for r in requests]
+
+
+def merge_shards(
+    input_path: PathType, shard_paths: Sequence[PathType], output_path: PathType
+) -> int:
+    """
+    Merges outputs of all shards into single output in order of the input.
+    Input is read in chunks by the same reader as scraped input, shard outputs
+    are streamed row by row: input row decides which shard output holds
+    its result, so memory use does not depend on number of rows.
+
+    Parameters
+    ----------
+    input_path : PathType
+        Path to the input file in any supported format, which was split into shards.
+    shard_paths : Sequence[PathType]
+        Paths to output files of shards, ordered by shard index.
+    output_path : PathType
+        Path to the merged output file.
+
+    Returns
+    -------
+    int
+        Number of merged rows.
+
+    Raises
+    ------
+    exc.DataValidationError
+        If input can't be read or shard outputs do not match the input.
+    """
+    shards = len(shard_paths)
+    rows = 0
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        readers = [csv.reader(stack.enter_context(_open(p))) for p in shard_paths]
+        headers = [next(reader) for reader in readers]
+        shard_code_position = _column_position(headers[0], DataColumns.STOCK_CODE)
+
+        writer = csv.writer(
+            stack.enter_context(_open(output_path, "w")), lineterminator="\n"
+        )
+        writer.writerow(headers[0])
+
+        for stock_code in _stock_codes(input_path):
+            shard = shard_of(stock_code, shards)
+            row = next(readers[shard], None)
+
+            if row is None or row[shard_code_position] != stock_code:
+                raise exc.DataValidationError(
+                    f"Output of shard {shard} does not match input "
+                    f"at row {rows + 1}, expected stock {stock_code}"
+                )
+
+            writer.writerow(row)
+            rows += 1
+
+        for shard, reader in enumerate(readers):
+            if next(reader, None) is not None:
+                raise exc.DataValidationError(
+                    f"Output of shard {shard} has rows not present in input"
+                )
+
+    return rows
+
+
+def _stock_codes(input_path: PathType) -> Iterator[str]:
+    """Yields stock codes of the input in order, validated as scraped requests."""
+    chunks = LSEDataReader().read_chunks(input_path, const.MERGE_CHUNK_SIZE)
+
+    try:
+        for chunk in chunks:
+            for request in parse_requests(chunk):
+                yield request.stock_code
+    except KeyError as e:
+        raise exc.DataValidationError(f"Input columns not found: {e}") from e
+
+
+def _open(path: PathType, mode: str = "r") -> IO[str]:
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def _column_position(header: list[str], column: str) -> int:
+    """
+    Finds position of the column in CSV header, normalizing names
+    the same way as input reader does.
+    """
+    normalized = [name.replace(" ", "_").lower() for name in header]
+
+    try:
+        return normalized.index(column)
+    except ValueError as e:
+        raise exc.DataValidationError(f"Column {column} not found: {header}") from e
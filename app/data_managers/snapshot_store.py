@@ -0,0 +1,254 @@
+"""
+Module with content-addressed store of page snapshots, kept in SQLite file.
+Pages are split into content-defined chunks, so identical pages and identical
+parts of different pages are stored once. Chunks are compressed separately,
+so page of a single stock is read without decompressing other pages.
+"""
+
+import hashlib
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import Callable
+
+import app.constants as const
+from app.data_managers import sqlite
+from app.data_managers.page_store import IPageStore
+from app.types import PathType
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    hash TEXT PRIMARY KEY,
+    chunks TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    stock_code TEXT NOT NULL,
+    run TEXT NOT NULL,
+    page TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (stock_code, run)
+);
+CREATE INDEX IF NOT EXISTS snapshots_run ON snapshots (run);
+"""
+
+
+def content_hash(data: bytes) -> str:
+    """Returns hex digest identifying the content."""
+    return hashlib.blake2b(data, digest_size=const.SNAPSHOT_HASH_SIZE).hexdigest()
+
+
+def split_chunks(html: str) -> list[str]:
+    """
+    Splits page into chunks at line boundaries chosen by content of lines,
+    so the same sequence of lines is split the same way in any page,
+    regardless of what precedes it.
+
+    Parameters
+    ----------
+    html : str
+        HTML of the page.
+
+    Returns
+    -------
+    list[str]
+        Chunks, which joined together give the page.
+    """
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+
+    for line in html.splitlines(keepends=True):
+        current.append(line)
+        size += len(line)
+        boundary = zlib.crc32(line.encode()) % const.SNAPSHOT_CHUNK_DIVISOR == 0
+
+        if boundary or size >= const.SNAPSHOT_MAX_CHUNK:
+            chunks.append("".join(current))
+            current, size = [], 0
+
+    if current:
+        chunks.append("".join(current))
+
+    return chunks
+
+
+class SnapshotStore(IPageStore):
+    """
+    Implementation of IPageStore keeping snapshots of pages of every run.
+    Snapshot is identified by stock code and run, reading returns
+    the latest snapshot of the stock not newer than run of the store.
+
+    Example
+    -------
+    >>> store = SnapshotStore("snapshots.db")
+    >>> store.save("XD", html)
+    >>> store.load("XD")
+    >>> store.prune(keep_runs=24)
+    """
+
+    def __init__(
+        self,
+        path: PathType,
+        run: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Opens store database, creating it if it does not exist.
+
+        Parameters
+        ----------
+        path : PathType
+            Path to the SQLite database file.
+        run : str | None, optional
+            Identifier of the run, under which pages are saved and up to which
+            they are loaded. Identifiers are ordered as strings, by default
+            identifier is built from current UTC time.
+        clock : Callable[[], float], optional
+            Wall clock in seconds, by default `time.time`.
+        """
+        self.path = path
+        self._clock = clock
+        self.run = run or time.strftime(const.SNAPSHOT_RUN_FORMAT, time.gmtime(clock()))
+
+        with closing(sqlite.connect(self.path)) as connection:
+            connection.executescript(SCHEMA)
+
+    def save(self, stock_code: str, html: str) -> None:
+        data = html.encode()
+        page = content_hash(data)
+
+        with sqlite.transaction(self.path) as connection:
+            known = connection.execute(
+                "SELECT 1 FROM pages WHERE hash = ?", (page,)
+            ).fetchone()
+
+            if known is None:
+                self._save_page(connection, page, html)
+
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshots (stock_code, run, page, created) "
+                "VALUES (?, ?, ?, ?)",
+                (stock_code, self.run, page, self._clock()),
+            )
+
+    def load(self, stock_code: str) -> str | None:
+        with closing(sqlite.connect(self.path)) as connection:
+            row = connection.execute(
+                "SELECT pages.chunks FROM snapshots "
+                "JOIN pages ON pages.hash = snapshots.page "
+                "WHERE stock_code = ? AND run <= ? ORDER BY run DESC LIMIT 1",
+                (stock_code, self.run),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            hashes = row[0].split(",")
+            placeholders = ", ".join("?" * len(set(hashes)))
+            chunks = dict(
+                connection.execute(
+                    f"SELECT hash, data FROM chunks WHERE hash IN ({placeholders})",
+                    list(set(hashes)),
+                ).fetchall()
+            )
+
+        return "".join(zlib.decompress(chunks[h]).decode() for h in hashes)
+
+    def runs(self) -> list[str]:
+        """
+        Returns identifiers of all runs with snapshots, from the oldest.
+
+        Returns
+        -------
+        list[str]
+            Identifiers of runs.
+        """
+        with closing(sqlite.connect(self.path)) as connection:
+            rows = connection.execute(
+                "SELECT DISTINCT run FROM snapshots ORDER BY run"
+            ).fetchall()
+        return [run for (run,) in rows]
+
+    def prune(self, keep_runs: int | None = None, max_age: float | None = None) -> int:
+        """
+        Removes snapshots according to retention policy, then pages
+        and chunks no longer used by any snapshot.
+
+        Parameters
+        ----------
+        keep_runs : int | None, optional
+            Number of the latest runs, whose snapshots are kept,
+            by default None, which means no limit.
+        max_age : float | None, optional
+            Time in seconds, after which snapshots are removed,
+            by default None, which means no limit.
+
+        Returns
+        -------
+        int
+            Number of removed snapshots.
+        """
+        with sqlite.transaction(self.path) as connection:
+            removed = 0
+
+            if keep_runs is not None:
+                removed += connection.execute(
+                    "DELETE FROM snapshots WHERE run NOT IN "
+                    "(SELECT DISTINCT run FROM snapshots ORDER BY run DESC LIMIT ?)",
+                    (keep_runs,),
+                ).rowcount
+
+            if max_age is not None:
+                removed += connection.execute(
+                    "DELETE FROM snapshots WHERE created < ?",
+                    (self._clock() - max_age,),
+                ).rowcount
+
+            if removed:
+                self._collect_garbage(connection)
+
+        return removed
+
+    def _save_page(self, connection: sqlite3.Connection, page: str, html: str) -> None:
+        """Saves new page as list of chunks, compressing only unknown chunks."""
+        hashes = []
+
+        for chunk in split_chunks(html):
+            data = chunk.encode()
+            chunk_hash = content_hash(data)
+            hashes.append(chunk_hash)
+            known = connection.execute(
+                "SELECT 1 FROM chunks WHERE hash = ?", (chunk_hash,)
+            ).fetchone()
+
+            if known is None:
+                compressed = zlib.compress(data, const.SNAPSHOT_COMPRESSION)
+                connection.execute(
+                    "INSERT INTO chunks (hash, data) VALUES (?, ?)",
+                    (chunk_hash, compressed),
+                )
+
+        connection.execute(
+            "INSERT INTO pages (hash, chunks) VALUES (?, ?)", (page, ",".join(hashes))
+        )
+
+    def _collect_garbage(self, connection: sqlite3.Connection) -> None:
+        """Removes pages without snapshots and chunks without pages."""
+        connection.execute(
+            "DELETE FROM pages WHERE hash NOT IN (SELECT page FROM snapshots)"
+        )
+        used = set()
+
+        for (chunks,) in connection.execute("SELECT chunks FROM pages"):
+            used.update(chunks.split(","))
+
+        stored = [h for (h,) in connection.execute("SELECT hash FROM chunks")]
+        connection.executemany(
+            "DELETE FROM chunks WHERE hash = ?",
+            [(h,) for h in stored if h not in used],
+        )
@@ -0,0 +1,63 @@
+"""
+Module with helpers for SQLite files shared by concurrent processes,
+e.g. work queue and snapshot store. Connections use write-ahead log,
+so readers are not blocked by writer, and wait for locks of other
+processes up to `SQLITE_BUSY_TIMEOUT`.
+"""
+
+import sqlite3
+from contextlib import closing, contextmanager
+from typing import Iterator
+
+import app.constants as const
+from app.types import PathType
+
+
+def connect(path: PathType) -> sqlite3.Connection:
+    """
+    Opens connection to SQLite file in autocommit mode with write-ahead log.
+
+    Parameters
+    ----------
+    path : PathType
+        Path to the SQLite file, created if it doesn't exist.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Connection, which must be closed by the caller.
+    """
+    connection = sqlite3.connect(
+        path, timeout=const.SQLITE_BUSY_TIMEOUT, isolation_level=None
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    return connection
+
+
+@contextmanager
+def transaction(path: PathType) -> Iterator[sqlite3.Connection]:
+    """
+    Opens connection with write transaction, which is committed on success
+    and rolled back on error. Write lock is taken up front, so concurrent
+    processes cannot read data, which is about to be changed, in between.
+
+    Parameters
+    ----------
+    path : PathType
+        Path to the SQLite file.
+
+    Yields
+    ------
+    sqlite3.Connection
+        Connection inside the transaction, closed when it ends.
+    """
+    with closing(connect(path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
@@ -0,0 +1,176 @@
+"""
+Module with persistent index of canonical URLs of stock pages.
+URL built from company name does not match slug used by LSE for some stocks,
+e.g. with punctuation in name or dots in code, so such stocks fail to load.
+Index is filled with URLs of successfully loaded pages and reference lists,
+and is kept in CSV file between runs.
+"""
+
+import csv
+import os
+import threading
+from pathlib import Path
+
+import app.exceptions as exc
+from app.constants import DataColumns
+from app.data_managers.parsers import parse_url
+from app.models.pydantic_models import StockRequest
+from app.types import PathType
+
+URL_COLUMN = "url"
+URL_INDEX_COLUMNS = [DataColumns.STOCK_CODE, URL_COLUMN]
+
+
+def read_urls(path: PathType) -> dict[str, str]:
+    """
+    Reads CSV file with stock code and url columns, other columns are ignored.
+
+    Parameters
+    ----------
+    path : PathType
+        Path to the CSV file.
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of stock codes to URLs of their pages.
+
+    Raises
+    ------
+    exc.DataValidationError
+        If file does not contain stock code and url columns.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        missing = set(URL_INDEX_COLUMNS) - set(reader.fieldnames or ())
+
+        if missing:
+            raise exc.DataValidationError(
+                f"Missing columns {sorted(missing)} in URL list {path}"
+            )
+
+        return {
+            row[DataColumns.STOCK_CODE]: row[URL_COLUMN]
+            for row in reader
+            if row[DataColumns.STOCK_CODE] and row[URL_COLUMN]
+        }
+
+
+class UrlIndex:
+    """
+    Index of canonical URLs of stock pages by stock code, used in place
+    of URL built from company name. Codes are matched case-insensitively.
+    Index can be updated concurrently by multiple drivers.
+
+    Example
+    -------
+    >>> index = UrlIndex("url_index.csv")
+    >>> index.resolve(request)
+    >>> index.add("BT.A", driver.current_url)
+    >>> index.save()
+    """
+
+    def __init__(self, path: PathType | None = None) -> None:
+        """
+        Loads index from file, if it exists.
+
+        Parameters
+        ----------
+        path : PathType | None, optional
+            Path to the CSV file, in which index is kept between runs,
+            by default None, which means index is kept in memory only.
+        """
+        self.path = None if path is None else Path(path)
+        self._urls: dict[str, str] = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+        if self.path is not None and self.path.exists():
+            self.update(read_urls(self.path))
+            self._changed = False
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return self._key(stock_code) in self._urls
+
+    def get(self, stock_code: str) -> str | None:
+        """
+        Returns indexed URL of the stock page, None if stock is not indexed.
+        """
+        return self._urls.get(self._key(stock_code))
+
+    def resolve(self, request: StockRequest) -> str:
+        """
+        Returns URL of the stock page of the request, indexed URL if known,
+        otherwise URL built from company name (see `parse_url`).
+        """
+        return self.get(request.stock_code) or parse_url(request)
+
+    def add(self, stock_code: str, url: str) -> None:
+        """
+        Adds URL of the stock page to the index, replacing previous one.
+
+        Parameters
+        ----------
+        stock_code : str
+            Stock code (ticker symbol) of the stock.
+        url : str
+            Canonical URL of the stock page, e.g. URL of loaded page.
+        """
+        key = self._key(stock_code)
+
+        with self._lock:
+            if self._urls.get(key) != url:
+                self._urls[key] = url
+                self._changed = True
+
+    def update(self, urls: dict[str, str]) -> int:
+        """
+        Adds URLs to the index, e.g. read from reference list with `read_urls`,
+        replacing previous ones.
+
+        Parameters
+        ----------
+        urls : dict[str, str]
+            Mapping of stock codes to URLs of their pages.
+
+        Returns
+        -------
+        int
+            Number of added or changed URLs.
+        """
+        before = len(self._urls)
+        changed = sum(self.get(code) not in (None, url) for code, url in urls.items())
+
+        for stock_code, url in urls.items():
+            self.add(stock_code, url)
+
+        return len(self._urls) - before + changed
+
+    def save(self) -> None:
+        """
+        Saves index to its file, if it was changed since it was loaded.
+        File is replaced atomically, so it's never left partially written.
+        """
+        if self.path is None or not self._changed:
+            return
+
+        with self._lock:
+            rows = sorted(self._urls.items())
+            self._changed = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+
+        with open(temporary, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(URL_INDEX_COLUMNS)
+            writer.writerows(rows)
+
+        temporary.replace(self.path)
+
+    @staticmethod
+    def _key(stock_code: str) -> str:
+        return stock_code.strip().upper()
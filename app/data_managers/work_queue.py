@@ -0,0 +1,227 @@
+"""
+Module with work queue backed by SQLite file, used to split scraping
+of one input between multiple processes or machines sharing a volume.
+Workers claim batches of requests with time limited leases,
+requests of expired leases are returned to the queue.
+"""
+
+import sqlite3
+import time
+from contextlib import closing
+from typing import Callable
+
+import pandas as pd
+
+import app.constants as const
+from app.constants import DataColumns
+from app.data_managers import sqlite
+from app.models.pydantic_models import StockRequest, StockResponse
+from app.types import PathType
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    company_name TEXT NOT NULL,
+    stock_code TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);
+"""
+
+
+class WorkQueue:
+    """
+    Queue of stock requests stored in SQLite database in WAL mode,
+    safe to be used concurrently by multiple processes.
+    Task ids follow order of enqueued requests, so exported results
+    keep order of the input.
+
+    Example
+    -------
+    >>> queue = WorkQueue("queue.db")
+    >>> queue.enqueue(requests)
+    >>> batch = queue.claim(worker="host-1", size=10)
+    >>> queue.complete(worker="host-1", results=[(task_id, response), ...])
+    >>> queue.export()
+    """
+
+    def __init__(
+        self,
+        path: PathType,
+        lease: float = const.DEFAULT_LEASE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Opens queue database, creating it if it does not exist.
+
+        Parameters
+        ----------
+        path : PathType
+            Path to the SQLite database file.
+        lease : float, optional
+            Time in seconds for which claimed tasks are reserved for the worker,
+            by default `DEFAULT_LEASE`.
+        clock : Callable[[], float], optional
+            Wall clock in seconds, shared by all workers, by default `time.time`.
+        """
+        self.path = path
+        self.lease = lease
+        self._clock = clock
+
+        with closing(sqlite.connect(self.path)) as connection:
+            connection.executescript(SCHEMA)
+
+    def enqueue(self, requests: list[StockRequest]) -> int:
+        """
+        Adds requests to the queue as pending tasks.
+
+        Parameters
+        ----------
+        requests : list[StockRequest]
+            Requests to be scraped.
+
+        Returns
+        -------
+        int
+            Number of enqueued tasks.
+        """
+        with sqlite.transaction(self.path) as connection:
+            connection.executemany(
+                "INSERT INTO tasks (company_name, stock_code) VALUES (?, ?)",
+                [(r.company_name, r.stock_code) for r in requests],
+            )
+        return len(requests)
+
+    def claim(self, worker: str, size: int) -> list[tuple[int, StockRequest]]:
+        """
+        Leases batch of pending tasks to the worker. Tasks of expired leases
+        are returned to the queue before claiming.
+
+        Parameters
+        ----------
+        worker : str
+            Unique identifier of the worker.
+        size : int
+            Maximum number of tasks to claim.
+
+        Returns
+        -------
+        list[tuple[int, StockRequest]]
+            Ids of claimed tasks and their requests. Empty if there are
+            no pending tasks left.
+        """
+        now = self._clock()
+
+        with sqlite.transaction(self.path) as connection:
+            self._requeue_expired(connection, now)
+            rows = connection.execute(
+                "SELECT id, company_name, stock_code FROM tasks "
+                "WHERE status = ? ORDER BY id LIMIT ?",
+                (PENDING, size),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE tasks SET status = ?, worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                [(LEASED, worker, now + self.lease, row[0]) for row in rows],
+            )
+
+        return [
+            (task_id, StockRequest(company_name=name, stock_code=code))
+            for task_id, name, code in rows
+        ]
+
+    def complete(self, worker: str, results: list[tuple[int, StockResponse]]) -> int:
+        """
+        Stores responses of tasks leased by the worker and marks them as done.
+        Responses for tasks whose lease was taken over by another worker
+        are ignored, so each task is written once.
+
+        Parameters
+        ----------
+        worker : str
+            Unique identifier of the worker.
+        results : list[tuple[int, StockResponse]]
+            Ids of tasks and their responses.
+
+        Returns
+        -------
+        int
+            Number of tasks marked as done.
+        """
+        with sqlite.transaction(self.path) as connection:
+            cursor = connection.executemany(
+                "UPDATE tasks SET status = ?, timestamp = ?, value = ?, "
+                "lease_expires = NULL WHERE id = ? AND worker = ? AND status = ?",
+                [
+                    (DONE, r.timestamp, r.value, task_id, worker, LEASED)
+                    for task_id, r in results
+                ],
+            )
+            return cursor.rowcount
+
+    def requeue_expired(self) -> int:
+        """
+        Returns tasks of expired leases to the queue.
+
+        Returns
+        -------
+        int
+            Number of requeued tasks.
+        """
+        with sqlite.transaction(self.path) as connection:
+            return self._requeue_expired(connection, self._clock())
+
+    def counts(self) -> dict[str, int]:
+        """
+        Returns number of tasks in each status.
+
+        Returns
+        -------
+        dict[str, int]
+            Number of pending, leased and done tasks.
+        """
+        with closing(sqlite.connect(self.path)) as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+
+        return {PENDING: 0, LEASED: 0, DONE: 0} | dict(rows)
+
+    def export(self) -> pd.DataFrame:
+        """
+        Exports results of all tasks in order of enqueued requests.
+        Tasks that were not done are exported without timestamp and value,
+        like failed responses.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the same columns as output of the scraper.
+        """
+        columns = [
+            DataColumns.COMPANY_NAME,
+            DataColumns.STOCK_CODE,
+            DataColumns.TIMESTAMP,
+            DataColumns.VALUE,
+        ]
+        with closing(sqlite.connect(self.path)) as connection:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(columns)} FROM tasks ORDER BY id", connection
+            )
+
+    def _requeue_expired(self, connection: sqlite3.Connection, now: float) -> int:
+        cursor = connection.execute(
+            "UPDATE tasks SET status = ?, worker = NULL, lease_expires = NULL "
+            "WHERE status = ? AND lease_expires < ?",
+            (PENDING, LEASED, now),
+        )
+        return cursor.rowcount
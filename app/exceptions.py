@@ -27,3 +27,28 @@ class PageLoadError(ScrapingError):
     - Network issues
     - Website structure changed and informations cannot be found
     """
+
+
+class PageLoadTimeoutError(PageLoadError):
+    """
+    Raised when required elements of a web page were not found within the timeout,
+    which usually means the website responds slowly or throttles requests.
+    """
+
+
+class ProfileUnavailableError(LSEError):
+    """Raised when all browser profiles of the pool are in use."""
+
+
+class EndpointUnavailableError(LSEError):
+    """
+    Raised when no remote WebDriver endpoint is healthy and has free capacity
+    to start a browser.
+    """
+
+
+class BrowserBackendError(LSEError):
+    """
+    Raised when browser backend is unknown or doesn't support requested
+    feature, e.g. reading network traffic.
+    """
@@ -1,6 +1,167 @@
-"""Module for project custom logging setup."""
+"""
+Module for project custom logging setup.
+Records are passed through a queue to handlers running in a background
+thread, so scraping never waits for log I/O. Errors of the same class
+are sampled: only the first few are emitted, the rest are counted
+and summarized when logging is shut down.
+"""
 
 import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Self
+
+import app.constants as const
 
 NAME = "scraper"
 logger = logging.getLogger(NAME)
+
+# attribute of log record grouping sampled errors, set with `extra`
+ERROR_CLASS = "error_class"
+
+
+class ErrorSampler(logging.Filter):
+    """
+    Filter passing only the first `sample` records of each error class.
+    Records are grouped by `error_class` attribute, usually set with
+    `extra={ERROR_CLASS: type(error).__name__}`; records without it always pass.
+    Filter is cheap and runs before message is formatted, so suppressed
+    records cost no formatting nor I/O.
+
+    Example
+    -------
+    >>> sampler = ErrorSampler(sample=5)
+    >>> logger.addFilter(sampler)
+    >>> logger.error("Failed %s", code, extra={ERROR_CLASS: "PageLoadError"})
+    >>> sampler.log_summary()  # 412 × PageLoadError, first 5 shown
+    """
+
+    def __init__(self, sample: int = const.LOG_ERROR_SAMPLE) -> None:
+        """
+        Parameters
+        ----------
+        sample : int, optional
+            Number of records of each error class passed,
+            by default `LOG_ERROR_SAMPLE`.
+        """
+        super().__init__()
+        self.sample = sample
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        error_class = getattr(record, ERROR_CLASS, None)
+
+        if error_class is None:
+            return True
+
+        with self._lock:
+            count = self._counts.get(error_class, 0) + 1
+            self._counts[error_class] = count
+
+        return count <= self.sample
+
+    def counts(self) -> dict[str, int]:
+        """Returns number of records of each error class, sorted by class."""
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def log_summary(self) -> None:
+        """Logs number of records of each error class, which was sampled."""
+        for error_class, count in self.counts().items():
+            if count > self.sample:
+                logger.warning(
+                    "%d × %s, first %d shown", count, error_class, self.sample
+                )
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler, which enqueues records as they are, unlike `QueueHandler`,
+    which formats message and traceback in the thread, which logs.
+    Records are formatted by handlers of the listener instead.
+    Arguments of the message must not be changed after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class QueueLogging:
+    """
+    Logging setup of the run, which emits records of project logger
+    in background thread through `DeferredQueueHandler` and `QueueListener`.
+    Records are formatted by the listener, so only cheap record creation
+    happens in the thread, which logs. Errors are sampled with `ErrorSampler`.
+    Should be used as context manager, so queued records are flushed
+    and summary of sampled errors is logged at the end.
+
+    Example
+    -------
+    >>> with QueueLogging(level="INFO", sample=5, path=Path("run.log")):
+    ...     main(...)
+    """
+
+    def __init__(
+        self,
+        level: str = const.LOG_LEVEL,
+        sample: int = const.LOG_ERROR_SAMPLE,
+        path: Path | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        level : str, optional
+            Minimum level of emitted records, by default `LOG_LEVEL`.
+        sample : int, optional
+            Number of records of each error class emitted,
+            by default `LOG_ERROR_SAMPLE`.
+        path : Path | None, optional
+            File to which records are appended, by default None,
+            which means records are written to standard error only.
+        """
+        self.level = level
+        self.path = path
+        self.sampler = ErrorSampler(sample)
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._handler = DeferredQueueHandler(self._queue)
+        self._listener: QueueListener | None = None
+        self._propagate = logger.propagate
+        self._level = logger.level
+
+    def __enter__(self) -> Self:
+        handlers: list[logging.Handler] = [logging.StreamHandler(sys.stderr)]
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handlers.append(logging.FileHandler(self.path, encoding="utf-8"))
+
+        formatter = logging.Formatter(const.LOG_FORMAT)
+
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        self._listener = QueueListener(self._queue, *handlers)
+        self._listener.start()
+
+        logger.addHandler(self._handler)
+        logger.addFilter(self.sampler)
+        logger.setLevel(self.level)
+        logger.propagate = False
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.sampler.log_summary()
+        logger.removeFilter(self.sampler)
+        logger.removeHandler(self._handler)
+        logger.setLevel(self._level)
+        logger.propagate = self._propagate
+
+        if self._listener is not None:
+            self._listener.stop()  # flushes queued records
+
+            for handler in self._listener.handlers:
+                handler.close()
@@ -0,0 +1,135 @@
+"""
+Module with metrics collected during a single scraping run.
+Components update counters and gauges while running, summary is logged
+at the end of the run. Startup of the run is traced by `StartupTimeline`.
+"""
+
+import threading
+import time
+from typing import Any, Callable
+
+from app.logging import logger
+
+
+class RunMetrics:
+    """
+    Thread-safe container of run metrics. Counters accumulate
+    number of events, gauges hold the last reported value of a quantity.
+
+    Example
+    -------
+    >>> metrics = RunMetrics()
+    >>> metrics.increment("pages_loaded")
+    >>> metrics.set_gauge("concurrency", 4)
+    >>> metrics.summary()
+    {'pages_loaded': 1, 'concurrency': 4}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, float] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """
+        Increments counter of given name, counters start from zero.
+
+        Parameters
+        ----------
+        name : str
+            Name of the counter.
+        value : int, optional
+            Value to add to the counter, by default 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Sets current value of gauge of given name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the gauge.
+        value : float
+            Current value of measured quantity.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def counter(self, name: str) -> int:
+        """Returns current value of the counter, zero if it was never incremented."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def gauge(self, name: str) -> float | None:
+        """Returns current value of the gauge, None if it was never set."""
+        with self._lock:
+            return self._gauges.get(name)
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns snapshot of all metrics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Counters and gauges by name, sorted alphabetically.
+        """
+        with self._lock:
+            metrics = self._counters | self._gauges
+        return dict(sorted(metrics.items()))
+
+    def log_summary(self) -> None:
+        """Logs snapshot of all metrics in single line."""
+        summary = ", ".join(f"{name}={value}" for name, value in self.summary().items())
+        logger.info("Run metrics: %s", summary)
+
+
+class StartupTimeline:
+    """
+    Thread-safe record of startup events of the run, e.g. input read
+    or browsers started, with time in seconds since the timeline was created.
+    Events happen in different threads, so logged timeline shows,
+    which of them overlapped and what the first scrape waited for.
+    Only the first occurrence of each event is recorded.
+
+    Example
+    -------
+    >>> timeline = StartupTimeline()
+    >>> timeline.mark("input_read")
+    >>> timeline.mark("browsers_ready")
+    >>> timeline.log()  # Startup timeline: input_read=0.05s, browsers_ready=2.31s
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Parameters
+        ----------
+        clock : Callable[[], float], optional
+            Monotonic clock in seconds, by default `time.monotonic`.
+        """
+        self._clock = clock
+        self._start = clock()
+        self._lock = threading.Lock()
+        self._events: dict[str, float] = {}
+
+    def mark(self, event: str) -> None:
+        """Records that event happened now, unless it was recorded before."""
+        offset = self._clock() - self._start
+
+        with self._lock:
+            self._events.setdefault(event, offset)
+
+    def events(self) -> dict[str, float]:
+        """Returns time in seconds since start of each event, ordered by time."""
+        with self._lock:
+            return dict(sorted(self._events.items(), key=lambda item: item[1]))
+
+    def log(self) -> None:
+        """Logs all events ordered by time in single line."""
+        events = ", ".join(
+            f"{name}={offset:.2f}s" for name, offset in self.events().items()
+        )
+        logger.info("Startup timeline: %s", events)
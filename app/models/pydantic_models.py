@@ -32,10 +32,41 @@ class StockRequest(BaseModel):
     stock_code: str
 
 
+class RawStockResponse(BaseModel):
+    """
+    Model representing stock data as scraped, before its price is converted.
+    Price text is converted to number in pounds for all responses at once,
+    see `parse_responses`.
+
+    Parameters
+    ----------
+    company_name : str
+        Name of the company whose stock data was scraped.
+    stock_code : str
+        Stock code (ticker symbol) of the stock that was scraped.
+    timestamp : str
+        Timestamp indicated by LSE website when scraped stock value was last updated.
+    value : str
+        Price as displayed by LSE website, e.g. `1,383.20`.
+    currency : str | None
+        Unit of the price, e.g. `GBX` for pence or `GBP` for pounds,
+        None if it was not displayed.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    company_name: str
+    stock_code: str
+    timestamp: str
+    value: str
+    currency: str | None = None
+
+
 class StockResponse(BaseModel):
     """
     Model representing the response after scraping stock data.
     Contains the original request data along with the scraped value and timestamp.
+    Value is price in pounds.
 
     Parameters
     ----------
@@ -47,7 +78,7 @@ class StockResponse(BaseModel):
         Timestamp indicated by LSE website when scraped stock value was last updated.
         If scraping failed, this will be None.
     value : float | None
-        Scraped value of the stock. If scraping failed, this will be None.
+        Scraped value of the stock in pounds. If scraping failed, this will be None.
     """
 
     model_config = ConfigDict(extra="forbid", frozen=True)
@@ -2,9 +2,9 @@
 Module defining soupsavvy models or selectors for scraping stock data.
 """
 
-from soupsavvy import ClassSelector, IdSelector, TypeSelector
+from soupsavvy import ClassSelector, IdSelector, SelfSelector, TypeSelector
 from soupsavvy.models import BaseModel
-from soupsavvy.operations import Operation, Text
+from soupsavvy.operations import Operation, SkipNone, Text
 
 import app.constants as consts
 
@@ -13,22 +13,24 @@ class StockScraperModel(BaseModel):
     """
     Model for scraping all necessary data about a stock from LSE website.
     Blueprint for finding inormation on the page.
+    Price is kept as displayed, it's converted to number for all stocks at once,
+    see `parse_responses`.
 
     Parameters
     ----------
-    value : float
-        Scraped stock value.
+    value : str
+        Scraped stock price text, e.g. `1,383.20`.
+    currency : str | None
+        Unit of the price, e.g. `GBX` for pence, None if page does not show it.
     timestamp : str
         Timestamp on LSE website when scraped stock value was last updated.
     """
 
     __scope__ = IdSelector(consts.STOCK_SCOPE_ID)
 
-    value = (
-        ClassSelector(consts.PRICE_TAG_CLASS)
-        | Text()
-        | Operation(str.replace, ",", "")
-        | Operation(float)
+    value = ClassSelector(consts.PRICE_TAG_CLASS) | Text() | Operation(str.strip)
+    currency = ClassSelector(consts.CURRENCY_TAG_CLASS) | SkipNone(
+        Text() | Operation(str.strip)
     )
     timestamp = (
         (
@@ -38,3 +40,35 @@ class StockScraperModel(BaseModel):
         | Text()
         | Operation(str.strip)
     )
+
+
+class ListingRowModel(BaseModel):
+    """
+    Model for scraping single row of paginated listing of instruments on LSE website
+    (e.g. price explorer). Scope is the row element itself, so each row
+    is found separately and malformed rows can be skipped.
+
+    Parameters
+    ----------
+    stock_code : str
+        Stock code (ticker symbol) of the instrument.
+    value : str
+        Scraped stock price text, e.g. `1,383.20`.
+    currency : str | None
+        Unit of the price, e.g. `GBX` for pence, None if listing does not show it.
+    timestamp : str
+        Timestamp on LSE website when scraped stock value was last updated.
+    """
+
+    __scope__ = SelfSelector()
+
+    stock_code = (
+        ClassSelector(consts.LISTING_CODE_CLASS) | Text() | Operation(str.strip)
+    )
+    value = ClassSelector(consts.LISTING_PRICE_CLASS) | Text() | Operation(str.strip)
+    currency = ClassSelector(consts.LISTING_CURRENCY_CLASS) | SkipNone(
+        Text() | Operation(str.strip)
+    )
+    timestamp = (
+        ClassSelector(consts.LISTING_TIMESTAMP_CLASS) | Text() | Operation(str.strip)
+    )
@@ -0,0 +1,216 @@
+"""
+Module with pipeline running stages of a run, e.g. reading, validation,
+scraping and saving, at the same time in separate threads.
+Stages are connected with bounded queues: when a stage is slower than
+the previous one, its queue fills up and the previous stage waits,
+so backpressure propagates upstream instead of work piling up in memory.
+Depth of each queue is recorded in run metrics: the bottleneck is the stage
+behind the last queue, which is mostly full, as queues before it are full
+only because of backpressure.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable
+
+import app.constants as const
+from app.metrics import RunMetrics
+
+# marks end of items passed between stages
+END = object()
+
+Stage = tuple[str, Callable[[Any], Any]]
+
+
+class StageQueue:
+    """
+    Bounded queue of items waiting for a stage, which records its depth.
+    Depth is sampled whenever an item is put, including the item, so it's 1
+    if the stage was waiting for it. `publish` sets maximum
+    and mean as gauges `pipeline_{name}_queue_max` and `pipeline_{name}_queue_mean`.
+    """
+
+    def __init__(self, name: str, maxsize: int, metrics: RunMetrics) -> None:
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the stage, which consumes items of the queue.
+        maxsize : int
+            Maximum number of items waiting in the queue.
+        metrics : RunMetrics
+            Metrics of the run, in which depth of the queue is recorded.
+        """
+        self.name = name
+        self.metrics = metrics
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._samples = 0
+        self._total = 0
+        self._max = 0
+
+    def put(self, item: Any, timeout: float) -> None:
+        """Puts item to the queue, raises `queue.Full` after timeout."""
+        self._queue.put(item, timeout=timeout)
+        depth = self._queue.qsize()
+
+        with self._lock:
+            self._samples += 1
+            self._total += depth
+            self._max = max(self._max, depth)
+
+    def get(self, timeout: float) -> Any:
+        """Gets item from the queue, raises `queue.Empty` after timeout."""
+        return self._queue.get(timeout=timeout)
+
+    def publish(self) -> None:
+        """Sets maximum and mean depth of the queue as gauges of run metrics."""
+        with self._lock:
+            mean = self._total / self._samples if self._samples else 0.0
+            self.metrics.set_gauge(f"pipeline_{self.name}_queue_max", self._max)
+            self.metrics.set_gauge(f"pipeline_{self.name}_queue_mean", round(mean, 2))
+
+
+class Pipeline:
+    """
+    Runs source of items and stages, each in its own thread, connected with
+    `StageQueue`s. Each item of the source is passed through stages in order,
+    result of a stage is item of the next one, result of the last stage is dropped.
+    If source or any stage fails, all threads stop and the error is raised.
+
+    Example
+    -------
+    >>> pipeline = Pipeline(
+    ...     [("validate", parse_requests), ("scrape", scrape), ("save", save)],
+    ...     metrics=metrics,
+    ... )
+    >>> pipeline.run(reader.read_chunks(path, size=100))
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        metrics: RunMetrics | None = None,
+        maxsize: int = const.PIPELINE_QUEUE_SIZE,
+        poll_interval: float = const.PIPELINE_POLL_INTERVAL,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        stages : list[Stage]
+            Name and function of each stage, in order.
+        metrics : RunMetrics | None, optional
+            Metrics of the run, in which depth of queues is recorded.
+        maxsize : int, optional
+            Maximum number of items waiting for each stage,
+            by default `PIPELINE_QUEUE_SIZE`.
+        poll_interval : float, optional
+            Time in seconds after which blocked thread checks,
+            if pipeline was stopped, by default `PIPELINE_POLL_INTERVAL`.
+        """
+        self.stages = stages
+        self.metrics = metrics or RunMetrics()
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._errors: list[BaseException] = []
+
+    def run(self, source: Iterable[Any]) -> None:
+        """
+        Passes all items of the source through stages and waits until
+        the last stage processed all of them.
+
+        Parameters
+        ----------
+        source : Iterable[Any]
+            Items of the first stage, iterated in separate thread.
+
+        Raises
+        ------
+        BaseException
+            The first error raised by the source or any of stages.
+        """
+        self._stopped.clear()
+        self._errors.clear()
+        queues = [
+            StageQueue(name, self.maxsize, self.metrics) for name, _ in self.stages
+        ]
+        threads = [self._start("source", self._produce, source, queues[0])]
+
+        for (name, func), inbox, outbox in zip(
+            self.stages, queues, [*queues[1:], None]
+        ):
+            threads.append(self._start(name, self._consume, func, inbox, outbox))
+
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            self._stopped.set()
+
+            for stage_queue in queues:
+                stage_queue.publish()
+
+        if self._errors:
+            raise self._errors[0]
+
+    def _start(
+        self, name: str, target: Callable[..., None], *args: Any
+    ) -> threading.Thread:
+        """Starts thread running target, which stops pipeline if it fails."""
+        thread = threading.Thread(
+            target=self._guard,
+            args=(target, *args),
+            name=f"pipeline-{name}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _guard(self, target: Callable[..., None], *args: Any) -> None:
+        try:
+            target(*args)
+        except BaseException as e:
+            self._errors.append(e)
+            self._stopped.set()
+
+    def _produce(self, source: Iterable[Any], outbox: StageQueue) -> None:
+        for item in source:
+            if not self._put(outbox, item):
+                return
+
+        self._put(outbox, END)
+
+    def _consume(
+        self,
+        func: Callable[[Any], Any],
+        inbox: StageQueue,
+        outbox: StageQueue | None,
+    ) -> None:
+        while (item := self._get(inbox)) is not END:
+            result = func(item)
+
+            if outbox is not None and not self._put(outbox, result):
+                return
+
+        if outbox is not None:
+            self._put(outbox, END)
+
+    def _put(self, stage_queue: StageQueue, item: Any) -> bool:
+        """Puts item, waiting while queue is full. Returns False if stopped."""
+        while not self._stopped.is_set():
+            try:
+                stage_queue.put(item, timeout=self.poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, stage_queue: StageQueue) -> Any:
+        """Gets item, waiting while queue is empty. Returns `END` if stopped."""
+        while not self._stopped.is_set():
+            try:
+                return stage_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+        return END
@@ -6,29 +6,542 @@ CLI Arguments
 ----------------
 --input: Path to the input CSV file containing stock codes and company names.
 --output: Path to the output file where results will be saved.
+--browser: Browser on which pages are scraped: chrome, chrome-headless-shell
+    or firefox.
+--browser-binary: Path to chrome-headless-shell executable, by default found on PATH.
+--tabs: Number of browser tabs loading stock pages concurrently.
+--network: Read stock data from page's JSON traffic instead of rendered page.
+--bulk: Answer requests from paginated listing pages, scrape only missing stocks.
+--deadline: Time in ISO 8601 format, e.g. 16:30, after which no more pages
+    are loaded and output is saved, with unscraped stocks saved as failed.
+    Time without date, which has already passed today, means tomorrow.
+    Stocks are scraped in order of optional priority column of the input,
+    then starting with the most stale according to --since output.
+--chunk-size: Number of input rows in each chunk, which is read, scraped and saved
+    while the next chunk is read and the previous one is saved.
+    Stocks are ordered by priority within each chunk, so it can't be
+    combined with --deadline.
+--preflight: Reject requests redirected to price explorer with lightweight HTTP
+    requests before loading them in browser.
+--workers: Maximum number of browsers scraping concurrently.
+--rate: Maximum number of page loads per second sent to a single host.
+--remote: Remote WebDriver endpoint `URL[=CAPACITY]`, e.g. Selenium standalone
+    container, on which browsers are started instead of locally. Can be repeated,
+    browsers are spread across endpoints by their free capacity and health.
+--recycle-pages: Number of pages after which browser is restarted.
+--recycle-memory: Memory in MB of browser processes, above which it's restarted.
+--profiles: Directory of persistent browser profiles keeping disk cache between runs.
+--no-profiles: Start browsers with temporary profiles.
+--cache-size: Maximum size in MB of disk cache of each browser profile.
+--url-index: CSV file with canonical URLs of stock pages, updated with URLs
+    of successfully loaded pages.
+--no-url-index: Always build URLs of stock pages from company names.
+--import-urls: CSV file with stock code and url columns imported to URL index.
+--log-level: Minimum level of logged messages.
+--log-file: File to which log is appended, besides standard error.
+--log-sample: Number of logged errors of each class, the rest is only counted.
+--parse-timestamps: Save timestamps as ISO 8601 datetimes with UTC offset.
+--since: Path to output of the previous run, only rows whose value or timestamp
+    changed since then are saved.
+--record: Directory where stock data section of each scraped page is saved,
+    or snapshot store with `.db` suffix keeping deduplicated pages of every run.
+--replay: Parse stock data from pages recorded in directory or snapshot store,
+    without browser.
+--snapshot-run: Replay the latest snapshots not newer than given run.
+--keep-runs: Number of the latest runs kept in snapshot store.
+--snapshot-max-age: Age in days after which snapshots are removed from the store.
+--processes: Number of processes parsing recorded pages in replay mode.
+
+Work queue modes, splitting one input between processes sharing a volume:
+--queue: Path to SQLite work queue.
+--enqueue: Add requests from input to the queue.
+--worker: Scrape requests claimed from the queue until there are none left.
+--finalize: Export results of the queue to output.
+
+Sharding, splitting one input between independent processes without shared state:
+--shard: Scrape only requests of shard `i/n`, assigned by hash of stock code.
+    Output holds all rows of the shard, so it can't be combined with --since.
+--merge: Merge outputs of all shards, ordered by shard index, into output
+    in order of the input.
+
+Aggregation of prices collected by repeated runs:
+--aggregate: Outputs of runs aggregated into open, high, low and close price,
+    percentage change and staleness of each stock per interval, saved to output.
+--interval: Length of aggregation interval, e.g. 1min, 15min or 1h.
 
 Scrapes information for provided in input data stocks and saves results in a CSV file
 of identical structure as input.
 """
 
 import argparse
+import os
+import socket
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import compress
 from pathlib import Path
+from typing import Any, Callable, Generator, Iterable, Self
 
+import numpy as np
 import pandas as pd
 
 import app.constants as consts
 import app.exceptions as exc
+from app.config import ScrapeConfig
+from app.constants import DataColumns
+from app.data_managers.aggregation import (
+    aggregate_ohlc,
+    parse_interval,
+    read_observations,
+)
 from app.data_managers.output_saver import CSVSaver
-from app.data_managers.parsers import parse_requests
+from app.data_managers.page_store import DirectoryPageStore, IPageStore
+from app.data_managers.delta import changed_rows, previous_timestamps, read_previous
+from app.data_managers.parsers import (
+    parse_priorities,
+    parse_requests,
+    parse_responses,
+    parse_timestamps,
+)
 from app.data_managers.reader import LSEDataReader
-from app.logging import logger
-from app.models.pydantic_models import FailedStockResponse, StockResponse
-from app.scraping.selenium_utils import get_driver
+from app.data_managers.result_buffer import ResultBuffer
+from app.data_managers.sharding import merge_shards, parse_shard, shard_mask
+from app.data_managers.snapshot_store import SnapshotStore
+from app.data_managers.url_index import UrlIndex, read_urls
+from app.data_managers.work_queue import LEASED, PENDING, WorkQueue
+from app.logging import ERROR_CLASS, QueueLogging, logger
+from app.metrics import RunMetrics, StartupTimeline
+from app.models.pydantic_models import (
+    FailedStockResponse,
+    RawStockResponse,
+    StockRequest,
+    StockResponse,
+)
+from app.pipeline import Pipeline
+from app.scraping.browsers import get_backend
+from app.scraping.endpoints import EndpointPool, parse_endpoint
+from app.scraping.listing import ListingIndex
+from app.scraping.planning import Deadline, parse_deadline, priority_order
+from app.scraping.preflight import PreflightChecker
+from app.scraping.profiles import ProfilePool
+from app.scraping.replay import replay
+from app.scraping.scheduler import (
+    AdaptiveConcurrency,
+    HostRateLimiter,
+    ScrapeScheduler,
+)
+from app.scraping.selenium_utils import (
+    BaseLSEDriver,
+    ScrapeOutcome,
+    get_driver,
+    get_remote_driver,
+)
+from app.scraping.supervisor import DriverSupervisor
+
+
+def scrape(
+    driver: DriverSupervisor,
+    requests: list[StockRequest],
+    tabs: int = consts.DEFAULT_TABS,
+    bulk: bool = False,
+    scheduler: ScrapeScheduler | None = None,
+    metrics: RunMetrics | None = None,
+    preflight: PreflightChecker | None = None,
+    deadline: Deadline | None = None,
+    listing: ListingIndex | None = None,
+) -> list[StockResponse]:
+    """
+    Scrapes all requests with given driver. Requests that failed to be scraped
+    are logged and replaced with `FailedStockResponse`. Prices of all scraped
+    requests are converted to pounds at once, when scraping is finished.
+
+    Parameters
+    ----------
+    driver : DriverSupervisor
+        Supervised driver used for scraping.
+    requests : list[StockRequest]
+        Requests to be scraped.
+    tabs : int, optional
+        Number of browser tabs loading pages concurrently, by default 1.
+    bulk : bool, optional
+        Whether to answer requests from paginated listing first, by default False.
+        Only stocks missing from the listing are scraped from their pages.
+    scheduler : ScrapeScheduler | None, optional
+        Scheduler scraping stock pages concurrently with multiple drivers,
+        by default None, which means pages are scraped with `driver` only.
+    metrics : RunMetrics | None, optional
+        Metrics of the run updated with number of scraped and failed stocks.
+    preflight : PreflightChecker | None, optional
+        Checker rejecting invalid requests before they are loaded in browser,
+        by default None, which means all requests are loaded.
+    deadline : Deadline | None, optional
+        Deadline after which no more pages are loaded, by default None.
+        Requests not scraped before deadline are replaced
+        with `FailedStockResponse`.
+    listing : ListingIndex | None, optional
+        Listing scraped before, used in bulk mode instead of scraping it again,
+        by default None.
+
+    Returns
+    -------
+    list[StockResponse]
+        Responses in the same order as requests.
+    """
+    metrics = metrics or RunMetrics()
+    responses: dict[int, StockResponse | RawStockResponse] = {}
+
+    if bulk:
+        if listing is None:
+            listing = _scrape_listing(driver)
+
+        for index, request in enumerate(requests):
+            response = listing.get(request)
+
+            if response is not None:
+                responses[index] = response
+
+        metrics.increment("responses_from_listing", len(responses))
+
+    pending = [index for index in range(len(requests)) if index not in responses]
+
+    if preflight is not None:
+        rejected = preflight.run([requests[index] for index in pending])
+
+        for position, error in rejected:
+            index = pending[position]
+            responses[index] = _to_response(requests[index], error, metrics)
+            metrics.increment("preflight_rejected")
+
+        pending = [index for index in pending if index not in responses]
+
+    remaining = [requests[index] for index in pending]
+    outcomes: Iterable[tuple[int, ScrapeOutcome]]
+
+    if scheduler is not None:
+        outcomes = scheduler.run(remaining, deadline=deadline)
+    elif tabs > 1:
+        outcomes = driver.scrape_many(remaining, tabs=tabs)
+    else:
+        outcomes = enumerate(_scrape_one(driver, request) for request in remaining)
+
+    if deadline is not None and deadline.expired():
+        outcomes = ()
+
+    try:
+        for position, outcome in outcomes:
+            index = pending[position]
+            responses[index] = _to_response(requests[index], outcome, metrics)
+
+            if deadline is not None and deadline.expired():
+                break
+    finally:
+        # stops dispatching of remaining requests by drivers or scheduler
+        if isinstance(outcomes, Generator):
+            outcomes.close()
+
+    skipped = [index for index in range(len(requests)) if index not in responses]
+
+    if skipped and deadline is not None:
+        logger.warning("Deadline reached, %d requests not scraped", len(skipped))
+        metrics.increment("deadline_skipped", len(skipped))
+
+    for index in skipped:
+        responses[index] = FailedStockResponse(
+            company_name=requests[index].company_name,
+            stock_code=requests[index].stock_code,
+        )
+
+    return _parse_prices([responses[index] for index in range(len(requests))], metrics)
+
+
+def _to_response(
+    request: StockRequest, outcome: ScrapeOutcome, metrics: RunMetrics
+) -> StockResponse | RawStockResponse:
+    """Converts outcome of scraping to response, logging and replacing failures."""
+    if isinstance(outcome, exc.ScrapingError):
+        logger.error(
+            "Error scraping %s: %s",
+            request.stock_code,
+            outcome,
+            extra={ERROR_CLASS: type(outcome).__name__},
+        )
+        metrics.increment("responses_failed")
+        return FailedStockResponse(
+            company_name=request.company_name,
+            stock_code=request.stock_code,
+        )
+
+    return outcome
+
+
+def _parse_prices(
+    responses: list[StockResponse | RawStockResponse], metrics: RunMetrics
+) -> list[StockResponse]:
+    """
+    Converts prices of all scraped responses in single pass, see `parse_responses`.
+    Prices, which could not be parsed, are logged together and their responses
+    are replaced with `FailedStockResponse`.
+    """
+    raws = {
+        position: response
+        for position, response in enumerate(responses)
+        if isinstance(response, RawStockResponse)
+    }
+    parsed, failures = parse_responses(list(raws.values()))
+
+    if failures:
+        logger.error(
+            "Failed to parse prices of %d stocks: %s",
+            len(failures),
+            ", ".join(f"{code}={text!r}" for code, text in failures.items()),
+        )
+        metrics.increment("responses_failed", len(failures))
+
+    metrics.increment("responses_scraped", len(parsed) - len(failures))
+    converted = dict(zip(raws, parsed))
+
+    return [
+        converted[position] if isinstance(response, RawStockResponse) else response
+        for position, response in enumerate(responses)
+    ]
+
+
+def _scrape_listing(driver: DriverSupervisor) -> ListingIndex:
+    """Scrapes listing pages, returning empty index if it failed."""
+    try:
+        return driver.scrape_listing()
+    except exc.ScrapingError as e:
+        logger.error("Error scraping listing, falling back to stock pages: %s", e)
+        return ListingIndex()
+
+
+def _scrape_one(driver: DriverSupervisor, request: StockRequest) -> ScrapeOutcome:
+    """Scrapes single request, returning error instead of raising it."""
+    try:
+        return driver.scrape(request)
+    except exc.ScrapingError as e:
+        return e
+
+
+class ScrapeSession:
+    """
+    Drivers used for scraping during a run, created according to config.
+    Main driver is always started, with multiple workers it's shared
+    with scheduler, which starts the rest of drivers on demand.
+    Each driver is managed by supervisor, which restarts its browser
+    when it's recycled or crashed, and keeps its own persistent profile.
+    With remote endpoints in config, browsers are started on them instead
+    of locally, with temporary profiles of remote machines.
+    Should be used as context manager, so all browsers are closed
+    and profiles released at the end.
+    """
+
+    def __init__(self, config: ScrapeConfig, metrics: RunMetrics) -> None:
+        self.config = config
+        self.metrics = metrics
+        self.profiles: ProfilePool | None = None
+        self.recorder: IPageStore | None = None
+        self.urls: UrlIndex | None = None
+        self.endpoints: EndpointPool | None = None
+        self.listing: ListingIndex | None = None
+        workers = config.workers
+
+        if config.remote:
+            self.endpoints = EndpointPool(config.remote)
+            workers = min(workers, self.endpoints.capacity)
+
+        if config.url_index is not None:
+            self.urls = UrlIndex(config.url_index)
+
+            if config.url_reference is not None:
+                added = self.urls.update(read_urls(config.url_reference))
+                logger.info("Imported %d URLs from %s", added, config.url_reference)
+
+        if config.record_dir is not None:
+            self.recorder = open_page_store(config.record_dir)
+
+        if config.profiles_dir is not None and self.endpoints is None:
+            profiles_dir = config.profiles_dir
+
+            if config.browser != consts.BROWSER_CHROME:
+                profiles_dir = profiles_dir / config.browser
+
+            self.profiles = ProfilePool(profiles_dir)
+            self.profiles.cleanup()
+
+        self.driver = self._supervise(self._driver_factory(tabs=config.tabs))
+        self.scheduler: ScrapeScheduler | None = None
+        self.preflight: PreflightChecker | None = None
+
+        if config.preflight:
+            self.preflight = PreflightChecker(urls=self.urls)
+
+        if workers > 1:
+            self.scheduler = ScrapeScheduler(
+                driver_factory=partial(self._supervise, self._driver_factory()),
+                concurrency=AdaptiveConcurrency(maximum=workers),
+                limiter=HostRateLimiter(rate=config.rate_limit),
+                metrics=metrics,
+                drivers=[self.driver],
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def _driver_factory(self, **kwargs: Any) -> Callable[..., BaseLSEDriver]:
+        """
+        Returns function starting driver with browser options of config,
+        on remote endpoint if any is configured, otherwise locally.
+        """
+        kwargs.update(
+            headless=self.config.headless,
+            capture_network=self.config.capture_network,
+            browser=get_backend(self.config.browser, self.config.browser_binary),
+        )
+
+        if self.endpoints is not None:
+            return partial(get_remote_driver, self.endpoints, **kwargs)
+        return partial(get_driver, **kwargs)
+
+    def _supervise(
+        self, driver_factory: Callable[..., BaseLSEDriver]
+    ) -> DriverSupervisor:
+        """
+        Starts driver managed by supervisor with recycling limits of config.
+        Profile is reserved for the supervisor, so restarted browsers
+        reuse its warm cache.
+        """
+        if self.profiles is not None:
+            driver_factory = partial(
+                driver_factory,
+                profile_dir=self.profiles.acquire(),
+                cache_size=int(self.config.cache_size * consts.MEGABYTE),
+            )
+
+        if self.recorder is not None:
+            driver_factory = partial(driver_factory, recorder=self.recorder)
+
+        if self.urls is not None:
+            driver_factory = partial(driver_factory, urls=self.urls)
+
+        return DriverSupervisor(
+            driver_factory,
+            max_pages=self.config.recycle_pages,
+            max_memory=int(self.config.recycle_memory * consts.MEGABYTE),
+            metrics=self.metrics,
+        )
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
+    def scrape(
+        self,
+        requests: list[StockRequest],
+        bulk: bool | None = None,
+        deadline: Deadline | None = None,
+    ) -> list[StockResponse]:
+        """
+        Scrapes requests with drivers of the session, see `scrape`.
+        Bulk mode follows config, unless specified explicitly.
+        Listing is scraped once per session, when it's first needed,
+        so requests scraped in chunks share it.
+        """
+        bulk = self.config.bulk if bulk is None else bulk
 
-def main(input_path: Path, output_path: Path, headless: bool = True) -> None:
+        if bulk and self.listing is None:
+            self.listing = _scrape_listing(self.driver)
+
+        return scrape(
+            self.driver,
+            requests,
+            tabs=self.config.tabs,
+            bulk=bulk,
+            scheduler=self.scheduler,
+            metrics=self.metrics,
+            preflight=self.preflight,
+            deadline=deadline,
+            listing=self.listing,
+        )
+
+    def close(self) -> None:
+        """
+        Quits all drivers of the session and releases their profiles.
+        URL index is saved and snapshots outside of retention policy
+        of config are removed.
+        """
+        if self.scheduler is not None:
+            self.scheduler.close()
+
+        self.driver.quit()
+
+        if self.preflight is not None:
+            self.preflight.close()
+
+        if self.profiles is not None:
+            self.profiles.release_all()
+
+        if self.urls is not None:
+            self.urls.save()
+
+        if isinstance(self.recorder, SnapshotStore):
+            removed = self.recorder.prune(
+                keep_runs=self.config.keep_runs,
+                max_age=(
+                    None
+                    if self.config.snapshot_max_age is None
+                    else self.config.snapshot_max_age * consts.DAY
+                ),
+            )
+            logger.info("Removed %d snapshots outside of retention policy", removed)
+
+
+def open_page_store(path: Path, run: str | None = None) -> IPageStore:
+    """
+    Opens page store at given path, snapshot store if path has `.db` suffix,
+    otherwise directory of HTML files.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the directory or SQLite database of snapshot store.
+    run : str | None, optional
+        Run of snapshot store, see `SnapshotStore`, by default current run.
+
+    Returns
+    -------
+    IPageStore
+        Page store at the path.
+    """
+    if path.suffix == consts.SNAPSHOT_SUFFIX:
+        return SnapshotStore(path, run=run)
+    return DirectoryPageStore(path)
+
+
+def main(
+    input_path: Path,
+    output_path: Path,
+    config: ScrapeConfig | None = None,
+    shard: tuple[int, int] | None = None,
+    since: Path | None = None,
+    parsed_timestamps: bool = False,
+    replay_dir: Path | None = None,
+    processes: int | None = None,
+    replay_run: str | None = None,
+    deadline: Deadline | None = None,
+    chunk_size: int | None = None,
+) -> None:
     """
     Main function to run the scraping process.
+    Requests are scraped in order of descending priority from optional
+    priority column of the input, then starting with stocks updated
+    the longest time ago according to previous output, if provided.
+
+    Input is read, validated, scraped and saved in chunks by stages of
+    `Pipeline`, which run concurrently: while one chunk is scraped,
+    the next one is read and validated and the previous one is saved.
+    Requests are ordered within each chunk. Browsers are started in background
+    as soon as the run starts, so they start while input is read and validated.
 
     Parameters
     ----------
@@ -36,44 +549,765 @@ def main(input_path: Path, output_path: Path, headless: bool = True) -> None:
         Path to the input CSV file containing stock codes and company names.
     output_path : Path
         Path to the output file where results will be saved.
-    headless : bool, optional
-        Whether to run the browser in headless mode (default is True).
+    config : ScrapeConfig | None, optional
+        Configuration of drivers and scraping strategy, default if not provided.
+    shard : tuple[int, int] | None, optional
+        Index of the shard and total number of shards, if provided only
+        requests of this shard are scraped, by default None.
+    since : Path | None, optional
+        Path to output of the previous run, if provided only rows
+        which changed since then are saved and the most stale stocks
+        are scraped first, by default None.
+    parsed_timestamps : bool, optional
+        Whether to save timestamps as timezone-aware datetimes
+        instead of raw LSE strings, by default False.
+    replay_dir : Path | None, optional
+        Directory or snapshot store with pages recorded during previous runs,
+        if provided stock data is parsed from them without browser,
+        by default None.
+    processes : int | None, optional
+        Number of processes parsing recorded pages, by default number of CPUs.
+    replay_run : str | None, optional
+        Run of snapshot store, whose snapshots are replayed, by default
+        the latest snapshot of each stock.
+    deadline : Deadline | None, optional
+        Deadline after which no more pages are loaded and output is saved,
+        by default None. Stocks not scraped before it are saved as failed.
+    chunk_size : int | None, optional
+        Number of input rows in each chunk, by default None, which means
+        whole input is single chunk and stages run one after another.
+        Can't be combined with `deadline`, as requests are ordered
+        only within chunks.
+
+    Raises
+    ------
+    ValueError
+        If both `deadline` and `chunk_size` are provided.
     """
+    if deadline is not None and chunk_size is not None:
+        raise ValueError("Deadline cannot be combined with processing in chunks")
+
+    metrics = RunMetrics()
+    timeline = StartupTimeline()
+    source: IPageStore | Future[ScrapeSession]
+
+    if replay_dir is None:
+        source = start_session(config or ScrapeConfig(), metrics, timeline)
+    else:
+        source = open_page_store(replay_dir, replay_run)
+
     reader = LSEDataReader()
-    data = reader.read(input_path)
-    requests = parse_requests(data)
-
-    driver = get_driver(headless=headless)
-    responses: list[StockResponse] = []
-
-    for request in requests:
-        try:
-            response = driver.scrape(request)
-        except exc.ScrapingError as e:
-            logger.error(f"Error scraping {request.stock_code}: {e}")
-            response = FailedStockResponse(
-                company_name=request.company_name,
-                stock_code=request.stock_code,
+    stages = _RunStages(
+        output_path=output_path,
+        source=source,
+        timeline=timeline,
+        metrics=metrics,
+        shard=shard,
+        since=since,
+        parsed_timestamps=parsed_timestamps,
+        processes=processes,
+        deadline=deadline,
+    )
+    pipeline = Pipeline(
+        [
+            ("validate", stages.validate),
+            ("scrape", stages.scrape),
+            ("save", stages.save),
+        ],
+        metrics=metrics,
+    )
+
+    try:
+        pipeline.run(reader.read_chunks(input_path, size=chunk_size))
+    finally:
+        stages.close()
+
+    if not stages.chunks:  # empty input, output has only header
+        stages.save(ResultBuffer().to_frame())
+
+    if shard is not None:
+        logger.info("Shard %d/%d: %d requests", *shard, stages.requests)
+
+    if since is not None:
+        logger.info(
+            "%d of %d rows changed since %s", stages.saved, stages.results, since
+        )
+
+    logger.info("Output saved to %s", output_path)
+    metrics.log_summary()
+
+
+def start_session(
+    config: ScrapeConfig, metrics: RunMetrics, timeline: StartupTimeline
+) -> Future[ScrapeSession]:
+    """
+    Starts scraping session in background thread, so its browsers start
+    while the run does other work, e.g. reads input. Start and end
+    of the startup are marked in the timeline.
+
+    Parameters
+    ----------
+    config : ScrapeConfig
+        Configuration of drivers and scraping strategy.
+    metrics : RunMetrics
+        Metrics of the run.
+    timeline : StartupTimeline
+        Timeline of the run, marked with `browsers_starting` and `browsers_ready`.
+
+    Returns
+    -------
+    Future[ScrapeSession]
+        Future of the session, raising error of the startup, if it failed.
+    """
+
+    def start() -> ScrapeSession:
+        timeline.mark("browsers_starting")
+        session = ScrapeSession(config, metrics)
+        timeline.mark("browsers_ready")
+        return session
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-start")
+    future = executor.submit(start)
+    executor.shutdown(wait=False)
+    return future
+
+
+class _RunStages:
+    """
+    Stages of `main`, validation, scraping and saving of chunks in order of input;
+    the browser session starts in background and scraping waits for it only
+    when the first chunk is scraped.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        source: IPageStore | Future[ScrapeSession],
+        timeline: StartupTimeline,
+        metrics: RunMetrics,
+        shard: tuple[int, int] | None,
+        since: Path | None,
+        parsed_timestamps: bool,
+        processes: int | None,
+        deadline: Deadline | None,
+    ) -> None:
+        self.output_path = output_path
+        self.source = source
+        self.timeline = timeline
+        self.metrics = metrics
+        self.shard = shard
+        self.since = since
+        self.previous: pd.DataFrame | None = None
+        self.parsed_timestamps = parsed_timestamps
+        self.processes = processes
+        self.deadline = deadline
+        self.saver = CSVSaver()
+        self.requests = 0
+        self.results = 0
+        self.saved = 0
+        self.chunks = 0
+
+    def validate(self, data: pd.DataFrame) -> tuple[list[StockRequest], list[int]]:
+        """
+        Validates requests of the chunk and orders them for scraping by priority,
+        then by staleness according to previous output. Returns ordered
+        requests and positions of requests of the chunk in that order.
+        """
+        self.timeline.mark("input_read")
+
+        if self.since is not None and self.previous is None:
+            self.previous = read_previous(self.since)
+
+        requests = parse_requests(data[DataColumns.USE_COLUMNS])
+        priorities = parse_priorities(data)
+
+        if self.shard is not None:
+            in_shard = shard_mask(requests, *self.shard)
+            requests = list(compress(requests, in_shard))
+            priorities = priorities[in_shard]
+
+        updated = None
+
+        if self.previous is not None:
+            codes = [request.stock_code for request in requests]
+            updated = previous_timestamps(codes, self.previous)
+
+        order = priority_order(priorities, updated)
+        self.requests += len(requests)
+        self.timeline.mark("requests_validated")
+        return [requests[i] for i in order], order
+
+    def scrape(self, chunk: tuple[list[StockRequest], list[int]]) -> pd.DataFrame:
+        """Scrapes or replays ordered requests, returns results in order of input."""
+        requests, order = chunk
+
+        if isinstance(self.source, Future):
+            session = self._wait_for_session(self.source)
+            scraped = session.scrape(requests, deadline=self.deadline)
+        else:
+            outcomes = replay(requests, self.source, processes=self.processes)
+            scraped = _parse_prices(
+                [
+                    _to_response(requests[index], outcome, self.metrics)
+                    for index, outcome in outcomes
+                ],
+                self.metrics,
             )
-        responses.append(response)
 
-    driver.quit()
+        results = ResultBuffer(capacity=len(requests))
+
+        for position in np.argsort(order):
+            results.append_response(scraped[position])
+
+        self.results += len(results)
+        return results.to_frame()
+
+    def save(self, output: pd.DataFrame) -> None:
+        """
+        Saves results of the chunk, appending them to results of previous chunks.
+        Only rows changed since previous output are saved, if it's provided.
+        """
+        if self.previous is not None:
+            changed = changed_rows(output, self.previous)
+            self.metrics.increment("rows_unchanged", len(output) - len(changed))
+            output = changed
+
+        if self.parsed_timestamps:
+            timestamps = parse_timestamps(output[DataColumns.TIMESTAMP])
+            output = output.assign(**{DataColumns.TIMESTAMP: timestamps})
+
+        self.saver.save(data=output, path=self.output_path, append=self.chunks > 0)
+        self.saved += len(output)
+        self.chunks += 1
+
+    def close(self) -> None:
+        """Closes scraping session, waiting until its browsers are started."""
+        if isinstance(self.source, Future) and self.source.exception() is None:
+            self.source.result().close()
+
+    def _wait_for_session(self, session: Future[ScrapeSession]) -> ScrapeSession:
+        """
+        Waits until session started in background is ready. The first wait
+        is recorded in metrics and startup timeline is logged after it.
+        """
+        if "scrape_started" in self.timeline.events():
+            return session.result()
+
+        start = time.monotonic()
+        started = session.result()
+        self.metrics.set_gauge(
+            "startup_wait_seconds", round(time.monotonic() - start, 2)
+        )
+        self.timeline.mark("scrape_started")
+        self.timeline.log()
+        return started
+
+
+def enqueue(input_path: Path, queue_path: Path) -> None:
+    """
+    Reads and validates input data and adds its requests to the work queue.
+
+    Parameters
+    ----------
+    input_path : Path
+        Path to the input CSV file containing stock codes and company names.
+    queue_path : Path
+        Path to the SQLite database of the work queue.
+    """
+    reader = LSEDataReader()
+    data = reader.read(input_path)
+    requests = parse_requests(data[DataColumns.USE_COLUMNS])
+
+    count = WorkQueue(queue_path).enqueue(requests)
+    logger.info("Enqueued %d requests to %s", count, queue_path)
+
+
+def work(
+    queue_path: Path,
+    config: ScrapeConfig | None = None,
+    batch_size: int = consts.DEFAULT_BATCH_SIZE,
+    lease: float = consts.DEFAULT_LEASE,
+    worker_id: str | None = None,
+) -> None:
+    """
+    Runs queue worker, which claims batches of requests from the work queue,
+    scrapes them and writes responses back, until queue has no pending requests.
+    Bulk mode is not used by workers, as each batch would walk whole listing.
+
+    Parameters
+    ----------
+    queue_path : Path
+        Path to the SQLite database of the work queue.
+    config : ScrapeConfig | None, optional
+        Configuration of drivers and scraping strategy, default if not provided.
+    batch_size : int, optional
+        Number of requests claimed at once (default is `DEFAULT_BATCH_SIZE`).
+    lease : float, optional
+        Time in seconds after which unfinished claimed requests are returned
+        to the queue (default is `DEFAULT_LEASE`).
+    worker_id : str | None, optional
+        Unique identifier of the worker, by default built from host name and pid.
+    """
+    config = config or ScrapeConfig()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    metrics = RunMetrics()
+    queue = WorkQueue(queue_path, lease=lease)
+
+    with ScrapeSession(config, metrics) as session:
+        while batch := queue.claim(worker=worker_id, size=batch_size):
+            ids = [task_id for task_id, _ in batch]
+            responses = session.scrape([r for _, r in batch], bulk=False)
+            queue.complete(worker=worker_id, results=list(zip(ids, responses)))
+            metrics.increment("batches_completed")
+
+    logger.info("Worker %s finished, no pending requests in queue", worker_id)
+    metrics.log_summary()
 
-    output = pd.DataFrame([s.model_dump() for s in responses])
+
+def finalize(queue_path: Path, output_path: Path) -> None:
+    """
+    Exports results of all requests in the work queue to the output file,
+    in order in which they were enqueued. Requests that were not scraped
+    are saved without timestamp and value, like failed ones.
+
+    Parameters
+    ----------
+    queue_path : Path
+        Path to the SQLite database of the work queue.
+    output_path : Path
+        Path to the output file where results will be saved.
+    """
+    queue = WorkQueue(queue_path)
+    counts = queue.counts()
+    unfinished = counts[PENDING] + counts[LEASED]
+
+    if unfinished:
+        logger.warning("%d requests in queue were not scraped", unfinished)
+
+    saver = CSVSaver()
+    saver.save(data=queue.export(), path=output_path)
+
+    logger.info("Output saved to %s", output_path)
+
+
+def merge(input_path: Path, shard_paths: list[Path], output_path: Path) -> None:
+    """
+    Merges outputs of shards into single output in order of the input.
+
+    Parameters
+    ----------
+    input_path : Path
+        Path to the input file, which was split into shards.
+    shard_paths : list[Path]
+        Paths to output files of all shards, ordered by shard index.
+    output_path : Path
+        Path to the output file where merged results will be saved.
+    """
+    rows = merge_shards(input_path, shard_paths, output_path)
+    logger.info(
+        "Merged %d rows of %d shards to %s", rows, len(shard_paths), output_path
+    )
+
+
+def aggregate(
+    observation_paths: list[Path],
+    output_path: Path,
+    interval: pd.Timedelta = pd.Timedelta(consts.AGGREGATION_INTERVAL),
+) -> None:
+    """
+    Aggregates prices collected by repeated runs into intervals,
+    see `aggregate_ohlc`, and saves them to the output file.
+
+    Parameters
+    ----------
+    observation_paths : list[Path]
+        Paths to output files of runs, in any order.
+    output_path : Path
+        Path to the output file where aggregated intervals will be saved.
+    interval : pd.Timedelta, optional
+        Length of the interval, by default `AGGREGATION_INTERVAL`.
+    """
+    observations = read_observations(observation_paths)
+    output = aggregate_ohlc(observations, interval)
 
     saver = CSVSaver()
     saver.save(data=output, path=output_path)
 
-    logger.info(f"Output saved to {output_path}")
+    logger.info(
+        "Aggregated %d observations into %d intervals, saved to %s",
+        len(observations),
+        len(output),
+        output_path,
+    )
 
 
-if __name__ == "__main__":  # pragma: no cover
+def build_parser() -> argparse.ArgumentParser:
+    """Builds parser of command line arguments."""
     parser = argparse.ArgumentParser(description="Scrape LSE stock prices")
-    parser.add_argument("--input", type=Path, required=True, help="Path to input CSV")
-    parser.add_argument("--output", type=Path, required=True, help="Output file")
+    parser.add_argument("--input", type=Path, help="Path to input CSV")
+    parser.add_argument("--output", type=Path, help="Output file")
     parser.add_argument(
         "--show", action="store_true", help="Run browser in visible mode"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--browser",
+        choices=consts.BROWSERS,
+        default=consts.BROWSER_CHROME,
+        help="Browser on which pages are scraped",
+    )
+    parser.add_argument(
+        "--browser-binary",
+        type=Path,
+        help="Path to chrome-headless-shell executable, by default found on PATH",
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=consts.DEFAULT_TABS,
+        help="Number of browser tabs loading pages concurrently",
+    )
+    parser.add_argument(
+        "--network",
+        action="store_true",
+        help="Read prices from page's JSON traffic, fall back to parsing the page",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Answer requests from listing pages, scrape only missing stocks",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=parse_deadline,
+        help="Stop loading pages and save output at time, e.g. 16:30",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Number of input rows read, scraped and saved at once by concurrent "
+        "stages, by default whole input",
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Reject invalid stock pages with HTTP requests before loading them",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=consts.DEFAULT_WORKERS,
+        help="Maximum number of browsers scraping concurrently",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=consts.DEFAULT_RATE_LIMIT,
+        help="Maximum number of page loads per second sent to a single host",
+    )
+    parser.add_argument(
+        "--remote",
+        type=parse_endpoint,
+        action="append",
+        metavar="URL[=CAPACITY]",
+        help="Start browsers on remote WebDriver endpoint, can be repeated",
+    )
+    parser.add_argument(
+        "--recycle-pages",
+        type=int,
+        default=consts.RECYCLE_PAGES,
+        help="Number of pages after which browser is restarted",
+    )
+    parser.add_argument(
+        "--recycle-memory",
+        type=float,
+        default=consts.RECYCLE_MEMORY_MB,
+        help="Memory in MB of browser processes, above which browser is restarted",
+    )
+    profiles = parser.add_mutually_exclusive_group()
+    profiles.add_argument(
+        "--profiles",
+        type=Path,
+        default=Path(consts.PROFILES_DIR),
+        help="Directory of persistent browser profiles keeping disk cache",
+    )
+    profiles.add_argument(
+        "--no-profiles",
+        action="store_true",
+        help="Start browsers with temporary profiles",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=consts.DISK_CACHE_SIZE_MB,
+        help="Maximum size in MB of disk cache of each browser profile",
+    )
+    url_index = parser.add_mutually_exclusive_group()
+    url_index.add_argument(
+        "--url-index",
+        type=Path,
+        default=Path(consts.URL_INDEX_FILE),
+        help="CSV file with canonical URLs of stock pages, updated after scraping",
+    )
+    url_index.add_argument(
+        "--no-url-index",
+        action="store_true",
+        help="Always build URLs of stock pages from company names",
+    )
+    parser.add_argument(
+        "--import-urls",
+        type=Path,
+        metavar="CSV",
+        help="Import stock code and url columns of CSV file to URL index",
+    )
+
+    queue = parser.add_argument_group("work queue")
+    queue.add_argument("--queue", type=Path, help="Path to SQLite work queue")
+    mode = queue.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--enqueue", action="store_true", help="Add input requests to the queue"
+    )
+    mode.add_argument(
+        "--worker", action="store_true", help="Scrape requests from the queue"
+    )
+    mode.add_argument(
+        "--finalize", action="store_true", help="Export queue results to output"
+    )
+    queue.add_argument(
+        "--batch-size",
+        type=int,
+        default=consts.DEFAULT_BATCH_SIZE,
+        help="Number of requests claimed by worker at once",
+    )
+    queue.add_argument(
+        "--lease",
+        type=float,
+        default=consts.DEFAULT_LEASE,
+        help="Seconds after which unfinished claimed requests are requeued",
+    )
+
+    logs = parser.add_argument_group("logging")
+    logs.add_argument(
+        "--log-level",
+        choices=consts.LOG_LEVELS,
+        default=consts.LOG_LEVEL,
+        help="Minimum level of logged messages",
+    )
+    logs.add_argument(
+        "--log-file",
+        type=Path,
+        help="File to which log is appended, besides standard error",
+    )
+    logs.add_argument(
+        "--log-sample",
+        type=int,
+        default=consts.LOG_ERROR_SAMPLE,
+        metavar="N",
+        help="Number of logged errors of each class, the rest is only counted",
+    )
 
-    main(input_path=args.input, output_path=args.output, headless=not args.show)
+    output = parser.add_argument_group("output")
+    output.add_argument(
+        "--parse-timestamps",
+        action="store_true",
+        help="Save timestamps as ISO 8601 datetimes with UTC offset",
+    )
+    output.add_argument(
+        "--since",
+        type=Path,
+        metavar="PREVIOUS_OUTPUT",
+        help="Save only rows changed since output of the previous run",
+    )
+
+    recording = parser.add_argument_group("record and replay")
+    recording.add_argument(
+        "--record",
+        type=Path,
+        metavar="PATH",
+        help="Save stock data section of each scraped page to directory "
+        "or to snapshot store with .db suffix",
+    )
+    recording.add_argument(
+        "--replay",
+        type=Path,
+        metavar="PATH",
+        help="Parse pages recorded in directory or snapshot store instead of scraping",
+    )
+    recording.add_argument(
+        "--snapshot-run",
+        metavar="RUN",
+        help="Replay the latest snapshots not newer than run, e.g. 20260101T120000Z",
+    )
+    recording.add_argument(
+        "--keep-runs",
+        type=int,
+        help="Number of the latest runs kept in snapshot store",
+    )
+    recording.add_argument(
+        "--snapshot-max-age",
+        type=float,
+        metavar="DAYS",
+        help="Age in days after which snapshots are removed from snapshot store",
+    )
+    recording.add_argument(
+        "--processes",
+        type=int,
+        help="Number of processes parsing recorded pages, by default CPU count",
+    )
+
+    sharding = parser.add_argument_group("sharding")
+    sharding.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Scrape only shard i/n of the input, e.g. 0/4",
+    )
+    sharding.add_argument(
+        "--merge",
+        type=Path,
+        nargs="+",
+        metavar="SHARD_OUTPUT",
+        help="Merge shard outputs, ordered by shard index, in order of input",
+    )
+
+    aggregation = parser.add_argument_group("aggregation")
+    aggregation.add_argument(
+        "--aggregate",
+        type=Path,
+        nargs="+",
+        metavar="RUN_OUTPUT",
+        help="Aggregate prices of outputs of runs into OHLC intervals",
+    )
+    aggregation.add_argument(
+        "--interval",
+        type=parse_interval,
+        default=consts.AGGREGATION_INTERVAL,
+        help="Length of aggregation interval, e.g. 1min, 15min or 1h",
+    )
+    return parser
+
+
+def cli(argv: list[str] | None = None) -> None:
+    """
+    Parses command line arguments and runs selected mode.
+
+    Parameters
+    ----------
+    argv : list[str] | None, optional
+        Command line arguments, by default taken from `sys.argv`.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.network and args.browser == consts.BROWSER_FIREFOX:
+        parser.error("--network is not supported by firefox")
+
+    config = ScrapeConfig(
+        headless=not args.show,
+        browser=args.browser,
+        browser_binary=args.browser_binary,
+        tabs=args.tabs,
+        capture_network=args.network,
+        bulk=args.bulk,
+        preflight=args.preflight,
+        workers=args.workers,
+        rate_limit=args.rate,
+        remote=dict(args.remote or ()),
+        recycle_pages=args.recycle_pages,
+        recycle_memory=args.recycle_memory,
+        profiles_dir=None if args.no_profiles else args.profiles,
+        cache_size=args.cache_size,
+        url_index=None if args.no_url_index else args.url_index,
+        url_reference=args.import_urls,
+        record_dir=args.record,
+        keep_runs=args.keep_runs,
+        snapshot_max_age=args.snapshot_max_age,
+    )
+    queue_mode = args.enqueue or args.worker or args.finalize
+
+    if queue_mode and args.queue is None:
+        parser.error("--queue is required in work queue modes")
+
+    if args.merge and (queue_mode or args.shard):
+        parser.error("--merge cannot be combined with other modes")
+
+    if args.aggregate and (queue_mode or args.merge or args.shard or args.replay):
+        parser.error("--aggregate cannot be combined with other modes")
+
+    if args.shard and args.since:
+        # merge expects output of each shard to hold all its input rows
+        parser.error("--shard cannot be combined with --since")
+
+    if args.import_urls and args.no_url_index:
+        parser.error("--import-urls cannot be combined with --no-url-index")
+
+    if args.deadline and (queue_mode or args.merge or args.replay):
+        parser.error("--deadline cannot be combined with queue, merge or replay")
+
+    if args.replay and (queue_mode or args.merge or args.record):
+        parser.error("--replay cannot be combined with queue, merge or record")
+
+    if args.log_sample < 0:
+        parser.error("--log-sample cannot be negative")
+
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    if args.chunk_size is not None and args.deadline:
+        # requests are ordered within chunks, so later chunks could hold
+        # the most important requests skipped at deadline
+        parser.error("--chunk-size cannot be combined with --deadline")
+
+    with QueueLogging(level=args.log_level, sample=args.log_sample, path=args.log_file):
+        _run_mode(parser, args, config)
+
+
+def _run_mode(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, config: ScrapeConfig
+) -> None:
+    """Runs mode selected by validated command line arguments."""
+    if args.enqueue:
+        if args.input is None:
+            parser.error("--input is required to enqueue requests")
+        enqueue(input_path=args.input, queue_path=args.queue)
+    elif args.worker:
+        work(
+            queue_path=args.queue,
+            config=config,
+            batch_size=args.batch_size,
+            lease=args.lease,
+        )
+    elif args.finalize:
+        if args.output is None:
+            parser.error("--output is required to finalize the queue")
+        finalize(queue_path=args.queue, output_path=args.output)
+    elif args.merge:
+        if args.input is None or args.output is None:
+            parser.error("--input and --output are required to merge shards")
+        merge(input_path=args.input, shard_paths=args.merge, output_path=args.output)
+    elif args.aggregate:
+        if args.output is None:
+            parser.error("--output is required to aggregate outputs")
+        aggregate(
+            observation_paths=args.aggregate,
+            output_path=args.output,
+            interval=args.interval,
+        )
+    else:
+        if args.input is None or args.output is None:
+            parser.error("--input and --output are required")
+        main(
+            input_path=args.input,
+            output_path=args.output,
+            config=config,
+            shard=args.shard,
+            since=args.since,
+            parsed_timestamps=args.parse_timestamps,
+            replay_dir=args.replay,
+            processes=args.processes,
+            replay_run=args.snapshot_run,
+            deadline=args.deadline,
+            chunk_size=args.chunk_size,
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    cli()
@@ -0,0 +1,271 @@
+"""
+Module with browser backends, on which drivers scrape LSE website:
+Chrome, chrome-headless-shell and Firefox with geckodriver.
+Backend builds new options of its browser for each driver, so arguments
+of one driver never leak into defaults of the next one, and connection
+to remote WebDriver endpoint running its browser.
+"""
+
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+from sys import platform
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+import app.constants as const
+import app.exceptions as exc
+
+
+class IBrowserBackend(ABC):
+    """
+    Interface of browser backend. Builds options of the browser configured
+    for LSE scraping, options shared by all browsers are set by `options`,
+    browser specific ones by subclasses.
+    """
+
+    name: str
+    # whether browser exposes JSON responses of the page, see `BaseLSEDriver`
+    network_capture: bool = False
+
+    def options(
+        self,
+        headless: bool = True,
+        tabs: int = 1,
+        capture_network: bool = False,
+        profile_dir: Path | None = None,
+        cache_size: int = const.DISK_CACHE_SIZE_MB * const.MEGABYTE,
+    ) -> ArgOptions:
+        """
+        Builds new options of the browser.
+
+        Parameters
+        ----------
+        headless : bool, optional
+            Whether to run the browser in headless mode, by default True.
+        tabs : int, optional
+            Number of tabs driver is going to use in `scrape_many`, by default 1.
+            For more than one tab, page load strategy is set to `none`.
+        capture_network : bool, optional
+            Whether stock data is read from JSON responses of the page,
+            by default False.
+        profile_dir : Path | None, optional
+            Directory of persistent browser profile, by default None,
+            which means temporary profile is used.
+        cache_size : int, optional
+            Maximum size of disk cache in bytes, by default `DISK_CACHE_SIZE_MB`.
+
+        Returns
+        -------
+        ArgOptions
+            Options of the browser, not shared with any other driver.
+
+        Raises
+        ------
+        exc.BrowserBackendError
+            If network capture is requested from browser, which doesn't support it.
+        """
+        if capture_network and not self.network_capture:
+            raise exc.BrowserBackendError(
+                f"Reading network traffic is not supported by {self.name}"
+            )
+
+        opts = self._options(headless, capture_network, profile_dir, cache_size)
+
+        if tabs > 1:
+            # page loads are awaited by polling tabs in `BaseLSEDriver.scrape_many`
+            opts.page_load_strategy = "none"
+
+        return opts
+
+    @abstractmethod
+    def _options(
+        self,
+        headless: bool,
+        capture_network: bool,
+        profile_dir: Path | None,
+        cache_size: int,
+    ) -> ArgOptions:
+        """
+        Builds browser specific options, see `options`.
+        Must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def connection(self, url: str) -> RemoteConnection:
+        """
+        Returns connection to remote WebDriver endpoint running the browser.
+        Must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class ChromeBackend(IBrowserBackend):
+    """Backend of Chrome browser started with chromedriver."""
+
+    name = const.BROWSER_CHROME
+    network_capture = True
+
+    def _options(
+        self,
+        headless: bool,
+        capture_network: bool,
+        profile_dir: Path | None,
+        cache_size: int,
+    ) -> ChromeOptions:
+        opts = ChromeOptions()
+
+        if capture_network:
+            opts.set_capability("goog:loggingPrefs", const.CHROME_PERFORMANCE_LOGGING)
+
+        args = list(const.CHROME_DEFAULT_ARGS)
+
+        if headless:
+            args.append("--headless")
+
+        if platform == "linux":  # pragma: no cover
+            args.extend(const.CHROME_LINUX_ARGS)
+
+        if profile_dir is not None:
+            args.extend(
+                [
+                    f"--user-data-dir={profile_dir.resolve()}",
+                    f"--disk-cache-dir={(profile_dir / const.PROFILE_CACHE_DIR).resolve()}",
+                    f"--disk-cache-size={cache_size}",
+                ]
+            )
+
+        for arg in args:
+            opts.add_argument(arg)
+
+        for key, value in const.CHROME_EXPERIMENTAL.items():
+            opts.add_experimental_option(key, value)
+
+        return opts
+
+    def connection(self, url: str) -> RemoteConnection:
+        return ChromiumRemoteConnection(
+            remote_server_addr=url,
+            vendor_prefix="goog",
+            browser_name=ChromeOptions().capabilities["browserName"],
+        )
+
+
+class HeadlessShellBackend(ChromeBackend):
+    """
+    Backend of chrome-headless-shell, Chrome build without UI, which is
+    always headless and starts faster with less memory than full Chrome.
+    Driven by chromedriver like Chrome, binary is looked up on PATH
+    unless given explicitly.
+    """
+
+    name = const.BROWSER_HEADLESS_SHELL
+
+    def __init__(self, binary: Path | None = None) -> None:
+        """
+        Parameters
+        ----------
+        binary : Path | None, optional
+            Path to chrome-headless-shell executable, by default None,
+            which means `HEADLESS_SHELL_BINARY` found on PATH.
+        """
+        self.binary = binary
+
+    def _options(
+        self,
+        headless: bool,
+        capture_network: bool,
+        profile_dir: Path | None,
+        cache_size: int,
+    ) -> ChromeOptions:
+        # shell has no visible mode, so headless switch is not needed
+        opts = super()._options(False, capture_network, profile_dir, cache_size)
+        binary = str(self.binary or const.HEADLESS_SHELL_BINARY)
+        opts.binary_location = shutil.which(binary) or binary
+        return opts
+
+
+class FirefoxBackend(IBrowserBackend):
+    """
+    Backend of Firefox browser started with geckodriver. Firefox doesn't
+    expose JSON responses of the page, so network capture is not supported.
+    """
+
+    name = const.BROWSER_FIREFOX
+
+    def _options(
+        self,
+        headless: bool,
+        capture_network: bool,
+        profile_dir: Path | None,
+        cache_size: int,
+    ) -> FirefoxOptions:
+        opts = FirefoxOptions()
+
+        if headless:
+            opts.add_argument("-headless")
+
+        for key, value in const.FIREFOX_PREFERENCES.items():
+            opts.set_preference(key, value)
+
+        if profile_dir is not None:
+            opts.add_argument("-profile")
+            opts.add_argument(str(profile_dir.resolve()))
+            opts.set_preference(
+                "browser.cache.disk.parent_directory",
+                str((profile_dir / const.PROFILE_CACHE_DIR).resolve()),
+            )
+            opts.set_preference("browser.cache.disk.smart_size.enabled", False)
+            opts.set_preference(
+                "browser.cache.disk.capacity", cache_size // const.KILOBYTE
+            )
+
+        return opts
+
+    def connection(self, url: str) -> RemoteConnection:
+        return FirefoxRemoteConnection(remote_server_addr=url)
+
+
+BACKENDS: dict[str, type[IBrowserBackend]] = {
+    const.BROWSER_CHROME: ChromeBackend,
+    const.BROWSER_HEADLESS_SHELL: HeadlessShellBackend,
+    const.BROWSER_FIREFOX: FirefoxBackend,
+}
+
+
+def get_backend(name: str, binary: Path | None = None) -> IBrowserBackend:
+    """
+    Returns backend of browser of given name, see `BACKENDS`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the browser, e.g. `chrome`.
+    binary : Path | None, optional
+        Path to executable of chrome-headless-shell, by default looked up on PATH.
+        Ignored by other backends, which are found by Selenium Manager.
+
+    Returns
+    -------
+    IBrowserBackend
+        Backend of the browser.
+
+    Raises
+    ------
+    exc.BrowserBackendError
+        If there is no backend of given name.
+    """
+    if name not in BACKENDS:
+        raise exc.BrowserBackendError(
+            f"Unknown browser {name!r}, expected one of {list(BACKENDS)}"
+        )
+
+    if name == const.BROWSER_HEADLESS_SHELL:
+        return HeadlessShellBackend(binary)
+    return BACKENDS[name]()
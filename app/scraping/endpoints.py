@@ -0,0 +1,245 @@
+"""
+Module with pool of remote WebDriver endpoints, e.g. Selenium standalone
+containers on other machines, so browsers are not limited by CPU and memory
+of the machine coordinating the run. Each new browser is started
+on the healthy endpoint with the most free capacity.
+"""
+
+import threading
+import time
+from typing import Callable, Collection, TypeVar
+
+import app.constants as const
+import app.exceptions as exc
+from app.logging import logger
+
+T = TypeVar("T")
+
+
+def parse_endpoint(value: str) -> tuple[str, int]:
+    """
+    Parses remote endpoint specification in format `URL[=CAPACITY]`,
+    where capacity is number of browsers endpoint runs at once.
+
+    Parameters
+    ----------
+    value : str
+        Endpoint specification, e.g. `http://10.0.0.2:4444=4`.
+
+    Returns
+    -------
+    tuple[str, int]
+        URL of the endpoint and its capacity, by default `REMOTE_CAPACITY`.
+
+    Raises
+    ------
+    ValueError
+        If capacity is not positive integer.
+    """
+    url, separator, capacity = value.rpartition("=")
+
+    if not separator:
+        return value, const.REMOTE_CAPACITY
+
+    if not capacity.isdigit() or int(capacity) < 1:
+        raise ValueError(f"Capacity of endpoint must be positive integer: {value}")
+
+    return url, int(capacity)
+
+
+class RemoteEndpoint:
+    """State of single endpoint of the pool."""
+
+    def __init__(self, url: str, capacity: int) -> None:
+        self.url = url
+        self.capacity = capacity
+        self.in_use = 0
+        self.failures = 0
+        self.down_until = 0.0
+
+    @property
+    def free(self) -> int:
+        """Number of browsers, which can be started on the endpoint."""
+        return self.capacity - self.in_use
+
+
+class EndpointPool:
+    """
+    Pool of remote WebDriver endpoints with limited capacity.
+    Browsers are spread across endpoints: each one is started on the endpoint
+    with the most free slots, ties are broken by order of endpoints.
+
+    Endpoint, which failed `failure_threshold` times in a row, e.g. browser
+    could not be started or stopped responding, is considered down
+    and is not used for `cooldown` seconds.
+
+    Example
+    -------
+    >>> pool = EndpointPool({"http://10.0.0.2:4444": 4, "http://10.0.0.3:4444": 2})
+    >>> endpoint = pool.acquire()
+    >>> driver = RemoteLSEDriver(endpoint, options)
+    >>> pool.release(endpoint)
+    """
+
+    def __init__(
+        self,
+        endpoints: dict[str, int],
+        failure_threshold: int = const.REMOTE_FAILURE_THRESHOLD,
+        cooldown: float = const.REMOTE_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        endpoints : dict[str, int]
+            Capacity of each endpoint by its URL.
+        failure_threshold : int, optional
+            Number of consecutive failures, after which endpoint is down,
+            by default `REMOTE_FAILURE_THRESHOLD`.
+        cooldown : float, optional
+            Time in seconds for which endpoint is down, by default `REMOTE_COOLDOWN`.
+        clock : Callable[[], float], optional
+            Monotonic clock in seconds, by default `time.monotonic`.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._endpoints = {
+            url: RemoteEndpoint(url, capacity) for url, capacity in endpoints.items()
+        }
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    @property
+    def capacity(self) -> int:
+        """Total number of browsers all endpoints run at once."""
+        return sum(endpoint.capacity for endpoint in self._endpoints.values())
+
+    def acquire(self, exclude: Collection[str] = ()) -> str:
+        """
+        Reserves slot of the healthy endpoint with the most free capacity.
+
+        Parameters
+        ----------
+        exclude : Collection[str], optional
+            URLs of endpoints, which should not be used, by default none.
+
+        Returns
+        -------
+        str
+            URL of the endpoint.
+
+        Raises
+        ------
+        exc.EndpointUnavailableError
+            If no endpoint is healthy and has free capacity.
+        """
+        now = self._clock()
+
+        with self._lock:
+            available = [
+                endpoint
+                for endpoint in self._endpoints.values()
+                if endpoint.free > 0
+                and endpoint.down_until <= now
+                and endpoint.url not in exclude
+            ]
+
+            if not available:
+                raise exc.EndpointUnavailableError(
+                    f"None of {len(self)} remote endpoints is healthy "
+                    "and has free capacity"
+                )
+
+            endpoint = max(available, key=lambda endpoint: endpoint.free)
+            endpoint.in_use += 1
+            return endpoint.url
+
+    def release(self, url: str) -> None:
+        """
+        Releases slot of the endpoint reserved by `acquire`.
+
+        Parameters
+        ----------
+        url : str
+            URL of the endpoint.
+        """
+        with self._lock:
+            endpoint = self._endpoints[url]
+            endpoint.in_use = max(0, endpoint.in_use - 1)
+
+    def report(self, url: str, ok: bool) -> None:
+        """
+        Records outcome of using the endpoint. Success resets failures,
+        endpoint is down after `failure_threshold` consecutive failures.
+
+        Parameters
+        ----------
+        url : str
+            URL of the endpoint.
+        ok : bool
+            Whether endpoint worked, e.g. browser started and responded.
+        """
+        with self._lock:
+            endpoint = self._endpoints[url]
+
+            if ok:
+                endpoint.failures = 0
+                return
+
+            endpoint.failures += 1
+
+            if endpoint.failures >= self.failure_threshold:
+                endpoint.down_until = self._clock() + self.cooldown
+                endpoint.failures = 0
+                logger.warning("Remote endpoint %s is down for %ss", url, self.cooldown)
+
+    def start(self, connect: Callable[[str], T]) -> tuple[str, T]:
+        """
+        Connects to the endpoint with the most free capacity, e.g. starts
+        browser on it. If connecting fails, failure is reported and next
+        endpoint is tried, until each of available endpoints was tried once.
+
+        Parameters
+        ----------
+        connect : Callable[[str], T]
+            Function connecting to the endpoint of given URL.
+
+        Returns
+        -------
+        tuple[str, T]
+            URL of the endpoint, whose slot is reserved, and result of `connect`.
+
+        Raises
+        ------
+        exc.EndpointUnavailableError
+            If no endpoint is available or connecting to all of them failed.
+        """
+        tried: set[str] = set()
+        last: Exception | None = None
+
+        while True:
+            try:
+                url = self.acquire(exclude=tried)
+            except exc.EndpointUnavailableError:
+                if not tried:
+                    raise
+                raise exc.EndpointUnavailableError(
+                    f"Failed to connect to any of remote endpoints {sorted(tried)}"
+                ) from last
+
+            tried.add(url)
+
+            try:
+                connected = connect(url)
+            except Exception as e:
+                logger.error("Failed to connect to remote endpoint %s: %s", url, e)
+                self.report(url, ok=False)
+                self.release(url)
+                last = e
+                continue
+
+            self.report(url, ok=True)
+            return url, connected
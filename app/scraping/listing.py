@@ -0,0 +1,145 @@
+"""
+Module with in-memory index of stock data scraped from paginated listing pages.
+Listing shows prices of many instruments per page, so single walk through it
+can answer most of the requests without loading their stock pages.
+"""
+
+from soupsavvy import ClassSelector
+from soupsavvy.exceptions import BaseModelException
+from soupsavvy.interfaces import IElement
+
+import app.constants as const
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.models.soupsavvy_models import ListingRowModel
+
+row_selector = ClassSelector(const.LISTING_ROW_CLASS)
+next_page_selector = ClassSelector(const.LISTING_NEXT_CLASS)
+empty_selector = ClassSelector(const.LISTING_EMPTY_CLASS)
+
+
+def parse_listing(element: IElement) -> list[ListingRowModel]:
+    """
+    Scrapes all rows of listing page. Rows that cannot be scraped are skipped.
+
+    Parameters
+    ----------
+    element : IElement
+        Root element of the listing page.
+
+    Returns
+    -------
+    list[ListingRowModel]
+        Scraped rows in order of appearance on the page.
+    """
+    rows: list[ListingRowModel] = []
+
+    for tag in row_selector.find_all(element):
+        try:
+            row = ListingRowModel.find(tag)
+        except BaseModelException:
+            continue
+
+        if row is not None:
+            rows.append(row)
+
+    return rows
+
+
+def has_next_page(element: IElement) -> bool:
+    """
+    Checks whether listing page links to the next page, which is not
+    the case on the last page or when listing has no rows.
+
+    Parameters
+    ----------
+    element : IElement
+        Root element of the listing page.
+
+    Returns
+    -------
+    bool
+        True if pagination has link to the next page, False otherwise.
+    """
+    if empty_selector.find(element) is not None:
+        return False
+
+    return next_page_selector.find(element) is not None
+
+
+class ListingIndex:
+    """
+    Index of stock data scraped from listing pages by stock code.
+    Codes are matched case-insensitively.
+
+    Example
+    -------
+    >>> index = ListingIndex()
+    >>> index.update(parse_listing(element))
+    >>> index.get(request)
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[str, ListingRowModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return self._key(stock_code) in self._rows
+
+    def update(self, rows: list[ListingRowModel]) -> int:
+        """
+        Adds scraped listing rows to the index. Rows of already indexed
+        stock codes are ignored, as they were seen on one of previous pages.
+
+        Parameters
+        ----------
+        rows : list[ListingRowModel]
+            Rows scraped from the listing page.
+
+        Returns
+        -------
+        int
+            Number of new stock codes added to the index.
+        """
+        added = 0
+
+        for row in rows:
+            key = self._key(row.stock_code)
+
+            if key not in self._rows:
+                self._rows[key] = row
+                added += 1
+
+        return added
+
+    def get(self, request: StockRequest) -> RawStockResponse | None:
+        """
+        Answers request from the index.
+
+        Parameters
+        ----------
+        request : StockRequest
+            Request for stock data.
+
+        Returns
+        -------
+        RawStockResponse | None
+            Response with indexed data or None if stock is not in the index.
+        """
+        row = self._rows.get(self._key(request.stock_code))
+
+        if row is None:
+            return None
+
+        return RawStockResponse(
+            company_name=request.company_name,
+            stock_code=request.stock_code,
+            timestamp=row.timestamp,
+            value=row.value,
+            currency=row.currency,
+        )
+
+    @staticmethod
+    def _key(stock_code: str) -> str:
+        return stock_code.strip().upper()
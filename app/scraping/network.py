@@ -0,0 +1,144 @@
+"""
+Utilities for extracting stock data from JSON responses the LSE page fetches
+in the background. Entries come from Chrome performance log, which records
+DevTools network events, so price can be read as soon as its response arrives,
+without waiting for the page to render it.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+from urllib.parse import parse_qsl, unquote, urlsplit
+from zoneinfo import ZoneInfo
+
+import app.constants as const
+
+RESPONSE_RECEIVED = "Network.responseReceived"
+
+
+def iter_json_responses(
+    entries: Iterable[dict[str, Any]], stock_code: str
+) -> Iterator[str]:
+    """
+    Finds JSON responses related to given stock in Chrome performance log entries.
+
+    Parameters
+    ----------
+    entries : Iterable[dict[str, Any]]
+        Entries of Chrome performance log, as returned by `get_log("performance")`.
+    stock_code : str
+        Stock code, which must be whole segment of path or query value
+        of url of the response, so e.g. `XD` doesn't match `/alldata/XDX`.
+
+    Yields
+    ------
+    str
+        DevTools request ids of matching responses, in order of arrival.
+    """
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+
+        if message.get("method") != RESPONSE_RECEIVED:
+            continue
+
+        params = message["params"]
+        response = params["response"]
+
+        if "json" not in response.get("mimeType", ""):
+            continue
+
+        if not _url_refers_to(response["url"], stock_code):
+            continue
+
+        yield params["requestId"]
+
+
+def extract_price(payload: Any, stock_code: str) -> tuple[str, str, str | None] | None:
+    """
+    Searches JSON payload for object containing price and timestamp of given stock.
+    Objects are accepted only if their stock code key equals `stock_code`,
+    objects without the key can't be attributed to the stock and are skipped.
+
+    Parameters
+    ----------
+    payload : Any
+        Decoded JSON response body.
+    stock_code : str
+        Stock code of the requested stock.
+
+    Returns
+    -------
+    tuple[str, str, str | None] | None
+        Timestamp formatted like on the LSE page, price text and its currency
+        if the object has one, or None if payload does not contain price
+        of the stock.
+    """
+    for obj in _iter_objects(payload):
+        price = _first_present(obj, const.PRICE_JSON_KEYS)
+        timestamp = _first_present(obj, const.TIMESTAMP_JSON_KEYS)
+
+        if price is None or timestamp is None:
+            continue
+
+        code = obj.get(const.CODE_JSON_KEY)
+
+        if code is None or str(code).upper() != stock_code.upper():
+            continue
+
+        currency = obj.get(const.CURRENCY_JSON_KEY)
+        return (
+            format_timestamp(str(timestamp)),
+            str(price),
+            None if currency is None else str(currency),
+        )
+
+    return None
+
+
+def format_timestamp(raw: str) -> str:
+    """
+    Formats ISO timestamp from JSON payload the same way LSE page displays it
+    (e.g. "14.09.25 13:03:33 BST"), so output does not depend on extraction mode.
+    Timestamps that are not in ISO format are returned unchanged.
+    """
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        return raw
+
+    timezone = ZoneInfo(const.LSE_TIMEZONE)
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone)
+
+    return parsed.astimezone(timezone).strftime(const.LSE_TIMESTAMP_FORMAT)
+
+
+def _url_refers_to(url: str, stock_code: str) -> bool:
+    """Returns whether stock code is whole path segment or query value of url."""
+    parts = urlsplit(url)
+    values = [unquote(segment) for segment in parts.path.split("/")]
+    values.extend(value for _, value in parse_qsl(parts.query))
+    return stock_code.upper() in (value.upper() for value in values)
+
+
+def _iter_objects(payload: Any) -> Iterator[dict[str, Any]]:
+    """Yields all JSON objects nested in payload, depth-first."""
+    if isinstance(payload, dict):
+        yield payload
+        children: Iterable[Any] = payload.values()
+    elif isinstance(payload, list):
+        children = payload
+    else:
+        return
+
+    for child in children:
+        yield from _iter_objects(child)
+
+
+def _first_present(obj: dict[str, Any], keys: list[str]) -> Any:
+    """Returns value of the first key present in object and not null."""
+    for key in keys:
+        if obj.get(key) is not None:
+            return obj[key]
+    return None
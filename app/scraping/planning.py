@@ -0,0 +1,113 @@
+"""
+Module planning scraping of the run: order in which requests are scraped
+and deadline, after which no new requests are started. Requests with
+the highest priority and the most stale data are scraped first, so the most
+important part of the output is ready, when the run is stopped at deadline.
+"""
+
+import time
+from datetime import datetime, time as clock_time, timedelta
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+class Deadline:
+    """
+    Point in time, after which no new requests should be scraped.
+
+    Example
+    -------
+    >>> deadline = Deadline(time.time() + 60)
+    >>> deadline.expired()
+    False
+    """
+
+    def __init__(self, at: float, clock: Callable[[], float] = time.time) -> None:
+        """
+        Parameters
+        ----------
+        at : float
+            Deadline as POSIX timestamp in seconds.
+        clock : Callable[[], float], optional
+            Wall clock in seconds, by default `time.time`.
+        """
+        self.at = at
+        self._clock = clock
+
+    def remaining(self) -> float:
+        """Returns time in seconds left until deadline, negative if expired."""
+        return self.at - self._clock()
+
+    def expired(self) -> bool:
+        """Returns whether deadline has passed."""
+        return self.remaining() <= 0
+
+
+def parse_deadline(value: str, now: datetime | None = None) -> Deadline:
+    """
+    Parses deadline in ISO 8601 format, either date and time or time only,
+    which means the next occurrence of the time: today, or tomorrow if the time
+    has already passed today, e.g. run started at 23:00 with deadline 01:00.
+    Time without UTC offset is local time.
+
+    Parameters
+    ----------
+    value : str
+        Deadline, e.g. `2025-09-14T16:30` or `16:30`.
+    now : datetime | None, optional
+        Current time, which time only deadline follows, by default
+        current local time, or time in zone of the deadline if it has offset.
+
+    Returns
+    -------
+    Deadline
+        Parsed deadline.
+
+    Raises
+    ------
+    ValueError
+        If value is not valid ISO 8601 date and time or time.
+    """
+    try:
+        at = datetime.fromisoformat(value)
+    except ValueError:
+        time_of_day = clock_time.fromisoformat(value)
+        now = now or datetime.now(time_of_day.tzinfo)
+        at = datetime.combine(now.date(), time_of_day)
+
+        if at <= now:
+            at += timedelta(days=1)
+
+    return Deadline(at.timestamp())
+
+
+def priority_order(
+    priorities: np.ndarray, updated: pd.Series | None = None
+) -> list[int]:
+    """
+    Orders requests by descending priority, then by time of their last update,
+    starting with the least recently updated. Requests never updated
+    are the most stale. Ties keep order of the input.
+
+    Parameters
+    ----------
+    priorities : np.ndarray
+        Priority of each request, higher is scraped earlier.
+    updated : pd.Series | None, optional
+        Timezone-aware time of the last update of each request, NaT if unknown,
+        by default None, which means requests are ordered by priority only.
+
+    Returns
+    -------
+    list[int]
+        Indexes of requests in order in which they should be scraped.
+    """
+    keys = [-np.asarray(priorities, dtype=float)]
+
+    if updated is not None:
+        # NaT is the smallest integer, so unknown updates go first
+        keys.insert(0, updated.array.asi8)
+
+    return np.lexsort(keys).tolist()
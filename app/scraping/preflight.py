@@ -0,0 +1,143 @@
+"""
+Module with pre-flight check of stock pages, run before scraping them
+with browser. Stock URLs are requested concurrently over pooled keep-alive
+HTTP connections, without rendering, and requests redirected to price explorer,
+because their stock code and company name do not match, are rejected up front.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Self, Sequence
+from urllib.parse import urlsplit
+
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
+
+import app.constants as const
+import app.exceptions as exc
+from app.data_managers.parsers import parse_url
+from app.data_managers.url_index import UrlIndex
+from app.models.pydantic_models import StockRequest
+from app.scraping.scheduler import HostRateLimiter
+
+
+def _strip_url(url: str) -> str:
+    """Returns URL without query, fragment and trailing slash."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}".rstrip("/")
+
+
+class PreflightChecker:
+    """
+    Checks stock pages with lightweight HEAD requests sent concurrently
+    through shared session, which keeps connections to the host alive.
+    Only requests, which are certainly invalid, are rejected. If page could not
+    be checked, e.g. due to network error, request is passed to browser.
+
+    Example
+    -------
+    >>> with PreflightChecker(workers=8) as checker:
+    ...     for index, error in checker.run(requests):
+    ...         ...
+    """
+
+    def __init__(
+        self,
+        workers: int = const.PREFLIGHT_WORKERS,
+        timeout: float = const.PREFLIGHT_TIMEOUT,
+        limiter: HostRateLimiter | None = None,
+        session: Session | None = None,
+        urls: UrlIndex | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        workers : int, optional
+            Number of concurrent requests and size of connection pool,
+            by default `PREFLIGHT_WORKERS`.
+        timeout : float, optional
+            Time in seconds after which request is abandoned,
+            by default `PREFLIGHT_TIMEOUT`.
+        limiter : HostRateLimiter | None, optional
+            Rate limiter of requests, by default `PREFLIGHT_RATE_LIMIT`
+            requests per second to a single host.
+        session : Session | None, optional
+            HTTP session used for requests, by default new session
+            with connection pool of `workers` connections.
+        urls : UrlIndex | None, optional
+            Index of URLs of stock pages, by default None,
+            which means URLs are built from company names.
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.limiter = limiter or HostRateLimiter(rate=const.PREFLIGHT_RATE_LIMIT)
+
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        self.session = session
+        self.urls = urls
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def check(self, request: StockRequest) -> exc.PageLoadError | None:
+        """
+        Checks whether stock page of the request exists.
+
+        Parameters
+        ----------
+        request : StockRequest
+            Request to be checked.
+
+        Returns
+        -------
+        exc.PageLoadError | None
+            Error if page redirects to price explorer, None otherwise.
+        """
+        url = parse_url(request) if self.urls is None else self.urls.resolve(request)
+        self.limiter.acquire(url)
+
+        try:
+            response = self.session.head(
+                url, allow_redirects=True, timeout=self.timeout
+            )
+        except RequestException:
+            return None
+
+        if _strip_url(response.url) == const.LSEWebsite.PRICE_EXPLORER_URL:
+            return exc.PageLoadError(
+                f"Stock details page not found on LSE website for url: {url}"
+            )
+        return None
+
+    def run(
+        self, requests: Sequence[StockRequest]
+    ) -> Iterator[tuple[int, exc.PageLoadError]]:
+        """
+        Checks all requests concurrently.
+
+        Parameters
+        ----------
+        requests : Sequence[StockRequest]
+            Requests to be checked.
+
+        Yields
+        ------
+        tuple[int, PageLoadError]
+            Index of rejected request in `requests` and reason of rejection,
+            in order of requests.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for index, error in enumerate(executor.map(self.check, requests)):
+                if error is not None:
+                    yield index, error
+
+    def close(self) -> None:
+        """Closes pooled connections of the session."""
+        self.session.close()
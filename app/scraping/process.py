@@ -0,0 +1,61 @@
+"""
+Module with utilities for inspecting processes of the browser.
+Processes are read from `/proc` filesystem, available on Linux only.
+"""
+
+import os
+from pathlib import Path
+
+PROC = Path("/proc")
+
+
+def process_tree_rss(pid: int, proc: Path = PROC) -> int:
+    """
+    Returns resident memory of the process and all its descendants.
+    Chrome runs each renderer in separate process, all started
+    by the browser process, which is a child of chromedriver.
+
+    Parameters
+    ----------
+    pid : int
+        Id of the root process of the tree.
+    proc : Path, optional
+        Path to the proc filesystem, by default `/proc`.
+
+    Returns
+    -------
+    int
+        Resident set size in bytes, 0 if processes cannot be inspected.
+    """
+    children: dict[int, list[int]] = {}
+
+    try:
+        entries = [entry for entry in proc.iterdir() if entry.name.isdigit()]
+    except OSError:  # no proc filesystem on this platform
+        return 0
+
+    for entry in entries:
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:  # process exited in the meantime
+            continue
+
+        # command name in parentheses may contain spaces, parent id follows state
+        parent = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(parent, []).append(int(entry.name))
+
+    total = 0
+    stack = [pid]
+
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+
+        try:
+            pages = int((proc / str(current) / "statm").read_text().split()[1])
+        except OSError:
+            continue
+
+        total += pages * os.sysconf("SC_PAGE_SIZE")
+
+    return total
@@ -0,0 +1,204 @@
+"""
+Module with pool of persistent browser profiles. Each running browser gets
+its own profile directory, so concurrent browsers do not share one profile,
+while static assets of the website stay in profile's disk cache between runs.
+"""
+
+import os
+import shutil
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import app.constants as const
+import app.exceptions as exc
+from app.logging import logger
+from app.types import PathType
+
+
+class ProfilePool:
+    """
+    Pool of numbered profile directories under common root, shared by
+    all processes using the same root. Profile is reserved with lock file
+    holding host name and pid of its owner, locks of processes that no longer
+    run on this host are taken over.
+
+    Unused profiles are rotated: profiles not used for `max_age` seconds
+    are removed by `cleanup`, so disk cache does not grow stale indefinitely.
+
+    Example
+    -------
+    >>> pool = ProfilePool("driver_profiles")
+    >>> profile = pool.acquire()
+    >>> driver = get_driver(profile_dir=profile)
+    >>> pool.release(profile)
+    """
+
+    def __init__(
+        self,
+        root: PathType = const.PROFILES_DIR,
+        max_profiles: int = const.MAX_PROFILES,
+        max_age: float = const.PROFILE_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        root : PathType, optional
+            Directory containing profiles, by default `PROFILES_DIR`.
+        max_profiles : int, optional
+            Maximum number of profiles in use at once, by default `MAX_PROFILES`.
+        max_age : float, optional
+            Time in seconds since the last use, after which profile is removed
+            by `cleanup`, by default `PROFILE_MAX_AGE`.
+        clock : Callable[[], float], optional
+            Wall clock in seconds, by default `time.time`.
+        """
+        self.root = Path(root)
+        self.max_profiles = max_profiles
+        self.max_age = max_age
+        self._clock = clock
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._acquired: list[Path] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Path:
+        """
+        Reserves free profile with the lowest number, creating it if needed.
+        Reusing low numbers keeps caches of the same profiles warm.
+
+        Returns
+        -------
+        Path
+            Path to the reserved profile directory.
+
+        Raises
+        ------
+        exc.ProfileUnavailableError
+            If all profiles are in use.
+        """
+        for index in range(self.max_profiles):
+            profile = self.root / f"{const.PROFILE_PREFIX}{index}"
+
+            if self._try_lock(profile):
+                self._mark_used(profile)
+
+                with self._lock:
+                    self._acquired.append(profile)
+
+                return profile
+
+        raise exc.ProfileUnavailableError(
+            f"All {self.max_profiles} browser profiles in {self.root} are in use"
+        )
+
+    def release(self, profile: Path) -> None:
+        """
+        Releases reserved profile, so it can be used by other browsers.
+
+        Parameters
+        ----------
+        profile : Path
+            Path to the profile directory returned by `acquire`.
+        """
+        with self._lock:
+            if profile in self._acquired:
+                self._acquired.remove(profile)
+
+        self._mark_used(profile)
+        (profile / const.PROFILE_LOCK_FILE).unlink(missing_ok=True)
+
+    def release_all(self) -> None:
+        """Releases all profiles reserved by this pool."""
+        with self._lock:
+            acquired = list(self._acquired)
+
+        for profile in acquired:
+            self.release(profile)
+
+    def cleanup(self) -> int:
+        """
+        Removes profiles, which are not in use and were not used
+        for longer than `max_age` or exceed `max_profiles` limit.
+
+        Returns
+        -------
+        int
+            Number of removed profiles.
+        """
+        if not self.root.is_dir():
+            return 0
+
+        removed = 0
+        now = self._clock()
+
+        for profile in self.root.glob(f"{const.PROFILE_PREFIX}*"):
+            index = profile.name.removeprefix(const.PROFILE_PREFIX)
+            expired = now - self._last_used(profile) > self.max_age
+            excess = not index.isdigit() or int(index) >= self.max_profiles
+
+            if (expired or excess) and self._try_lock(profile):
+                shutil.rmtree(profile, ignore_errors=True)
+                removed += 1
+
+        if removed:
+            logger.info(
+                "Removed %d unused browser profiles from %s", removed, self.root
+            )
+
+        return removed
+
+    def _mark_used(self, profile: Path) -> None:
+        """Marks time of the last use of the profile, used by rotation."""
+        marker = profile / const.PROFILE_USED_FILE
+        marker.touch()
+        now = self._clock()
+        os.utime(marker, (now, now))
+
+    def _last_used(self, profile: Path) -> float:
+        """Returns time of the last use of the profile."""
+        marker = profile / const.PROFILE_USED_FILE
+        return (marker if marker.exists() else profile).stat().st_mtime
+
+    def _try_lock(self, profile: Path) -> bool:
+        """
+        Creates lock file of the profile, taking over locks of dead processes.
+        Returns False if profile is locked by running process.
+        """
+        profile.mkdir(parents=True, exist_ok=True)
+        lock = profile / const.PROFILE_LOCK_FILE
+
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not self._is_stale(lock):
+                return False
+
+            lock.unlink(missing_ok=True)
+            return self._try_lock(profile)
+
+        with os.fdopen(fd, "w") as file:
+            file.write(self._owner)
+
+        return True
+
+    def _is_stale(self, lock: Path) -> bool:
+        """Checks if owner of the lock is process no longer running on this host."""
+        try:
+            host, _, pid = lock.read_text().rpartition(":")
+        except FileNotFoundError:  # released in the meantime
+            return True
+
+        if host != socket.gethostname() or not pid.isdigit():
+            return False
+
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:  # process exists, owned by another user
+            return False
+
+        return False
@@ -0,0 +1,114 @@
+"""
+Module replaying scraping over pages recorded during previous runs.
+Recorded HTML is parsed with the same scraper model as live pages,
+using BeautifulSoup instead of browser, in a pool of processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, Sequence
+
+from bs4 import BeautifulSoup
+from soupsavvy import to_soupsavvy
+from soupsavvy.exceptions import BaseModelException
+
+import app.constants as const
+import app.exceptions as exc
+from app.data_managers.page_store import IPageStore
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.models.soupsavvy_models import StockScraperModel
+from app.scraping.selenium_utils import ScrapeOutcome
+
+
+def parse_page(request: StockRequest, html: str) -> RawStockResponse:
+    """
+    Extracts stock data from recorded HTML of the stock page.
+
+    Parameters
+    ----------
+    request : StockRequest
+        Request of the stock, which page was recorded.
+    html : str
+        Recorded HTML of the page.
+
+    Returns
+    -------
+    RawStockResponse
+        Response with stock data extracted from the page.
+
+    Raises
+    ------
+    exc.ElementNotFoundError
+        If scraping with soupsavvy model fails.
+    """
+    element = to_soupsavvy(BeautifulSoup(html, const.REPLAY_HTML_PARSER))
+
+    try:
+        scraped = StockScraperModel.find(element)
+    except BaseModelException as e:
+        raise exc.ElementNotFoundError(
+            f"Error scraping data for {request.stock_code}: {e}"
+        ) from e
+
+    return RawStockResponse(
+        company_name=request.company_name,
+        stock_code=request.stock_code,
+        timestamp=scraped.timestamp,
+        value=scraped.value,
+        currency=scraped.currency,
+    )
+
+
+def replay_one(store: IPageStore, request: StockRequest) -> ScrapeOutcome:
+    """
+    Scrapes single request from its recorded page,
+    returning error instead of raising it.
+    """
+    html = store.load(request.stock_code)
+
+    if html is None:
+        return exc.PageLoadError(f"No recorded page for {request.stock_code}")
+
+    try:
+        return parse_page(request, html)
+    except exc.ScrapingError as e:
+        return e
+
+
+def replay(
+    requests: Sequence[StockRequest],
+    store: IPageStore,
+    processes: int | None = None,
+) -> Iterator[tuple[int, ScrapeOutcome]]:
+    """
+    Scrapes all requests from pages recorded in the store.
+
+    Parameters
+    ----------
+    requests : Sequence[StockRequest]
+        Requests to be scraped.
+    store : IPageStore
+        Store with recorded pages, must be picklable to be sent to workers.
+    processes : int | None, optional
+        Number of worker processes, by default number of CPUs.
+        With single process, pages are parsed in the current process.
+
+    Yields
+    ------
+    tuple[int, RawStockResponse | ScrapingError]
+        Index of the request in `requests` and either scraped response
+        or error that occurred while scraping it, in order of requests.
+    """
+    processes = processes or os.cpu_count() or 1
+    scrape = partial(replay_one, store)
+
+    if processes == 1:
+        yield from enumerate(map(scrape, requests))
+        return
+
+    # pages are small, so requests are sent to workers in large chunks
+    chunksize = max(1, min(const.REPLAY_CHUNK_SIZE, len(requests) // processes))
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        yield from enumerate(executor.map(scrape, requests, chunksize=chunksize))
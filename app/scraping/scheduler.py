@@ -0,0 +1,408 @@
+"""
+Module with scheduler running scraping concurrently on multiple drivers.
+Requests to each host are rate limited with token bucket and number
+of concurrently scraped pages is adjusted with AIMD
+(additive increase, multiplicative decrease) controller.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Iterator, Protocol, Sequence
+from urllib.parse import urlparse
+
+import app.constants as const
+import app.exceptions as exc
+from app.data_managers.parsers import parse_url
+from app.metrics import RunMetrics
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.scraping.planning import Deadline
+from app.scraping.selenium_utils import ScrapeOutcome
+
+
+class IScraper(Protocol):
+    """Interface of driver used by the scheduler."""
+
+    def scrape(self, request: StockRequest) -> RawStockResponse: ...
+
+    def quit(self) -> None: ...
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter. Tokens are refilled at constant `rate` per second
+    up to `capacity`, each acquired request consumes one token.
+
+    Example
+    -------
+    >>> bucket = TokenBucket(rate=2, capacity=1)
+    >>> bucket.acquire()  # returns immediately
+    >>> bucket.acquire()  # waits 0.5 second for the next token
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initializes full bucket.
+
+        Parameters
+        ----------
+        rate : float
+            Number of tokens refilled per second.
+        capacity : float, optional
+            Maximum number of tokens, which limits size of bursts, by default 1.
+        clock : Callable[[], float], optional
+            Monotonic clock in seconds, by default `time.monotonic`.
+        sleep : Callable[[float], None], optional
+            Function waiting given number of seconds, by default `time.sleep`.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Takes one token from the bucket, waiting until it's available.
+
+        Returns
+        -------
+        float
+            Time in seconds spent waiting for the token.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            # token is reserved up front, so concurrent callers queue up fairly
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if wait:
+            self._sleep(wait)
+
+        return wait
+
+
+class HostRateLimiter:
+    """
+    Rate limiter keeping separate token bucket for each host.
+    Hosts are extracted from urls of requests.
+    """
+
+    def __init__(
+        self, rate: float, burst: float = const.RATE_LIMIT_BURST, **kwargs: Any
+    ) -> None:
+        """
+        Parameters
+        ----------
+        rate : float
+            Maximum number of requests per second sent to a single host.
+        burst : float, optional
+            Maximum number of requests sent to a single host at once,
+            by default `RATE_LIMIT_BURST`.
+        kwargs : Any
+            Extra arguments passed to each `TokenBucket`.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._kwargs = kwargs
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """
+        Waits until request to the host of the url is allowed.
+
+        Parameters
+        ----------
+        url : str
+            Url of the request.
+
+        Returns
+        -------
+        float
+            Time in seconds spent waiting.
+        """
+        host = urlparse(url).netloc
+
+        with self._lock:
+            bucket = self._buckets.get(host)
+
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst, **self._kwargs)
+                self._buckets[host] = bucket
+
+        return bucket.acquire()
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller of number of concurrently scraped pages.
+    Limit grows by one per `limit` fast successful page loads and is multiplied
+    by `decrease` factor after page load timeout or when share of failures
+    in the recent window of outcomes exceeds `error_threshold`.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        initial: int | None = None,
+        slow_threshold: float = const.SLOW_PAGE_LOAD,
+        decrease: float = const.CONCURRENCY_DECREASE,
+        window: int = const.ERROR_WINDOW,
+        error_threshold: float = const.ERROR_THRESHOLD,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        maximum : int
+            Maximum number of concurrently scraped pages.
+        minimum : int, optional
+            Minimum number of concurrently scraped pages, by default 1.
+        initial : int | None, optional
+            Initial limit, by default equal to `minimum`.
+        slow_threshold : float, optional
+            Duration in seconds of page load above which success
+            does not increase the limit, by default `SLOW_PAGE_LOAD`.
+        decrease : float, optional
+            Factor multiplying the limit on back off, by default `CONCURRENCY_DECREASE`.
+        window : int, optional
+            Number of recent outcomes used to detect spike of errors,
+            by default `ERROR_WINDOW`.
+        error_threshold : float, optional
+            Share of failures in full window causing back off,
+            by default `ERROR_THRESHOLD`.
+        """
+        self.maximum = maximum
+        self.minimum = min(minimum, maximum)
+        self.slow_threshold = slow_threshold
+        self.decrease = decrease
+        self.error_threshold = error_threshold
+        self._limit = float(initial or self.minimum)
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Current number of pages allowed to be scraped concurrently."""
+        return int(self._limit)
+
+    def record(self, duration: float, error: exc.ScrapingError | None = None) -> int:
+        """
+        Adjusts the limit based on outcome of single scraping.
+
+        Parameters
+        ----------
+        duration : float
+            Time in seconds scraping took.
+        error : ScrapingError | None, optional
+            Error raised while scraping, None if it succeeded.
+
+        Returns
+        -------
+        int
+            Limit after adjustment.
+        """
+        with self._lock:
+            self._outcomes.append(error is not None)
+
+            if isinstance(error, exc.PageLoadTimeoutError) or self._is_error_spike():
+                self._limit = max(self.minimum, self._limit * self.decrease)
+                self._outcomes.clear()
+            elif error is None and duration < self.slow_threshold:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+
+            return self.limit
+
+    def _is_error_spike(self) -> bool:
+        """Checks if share of failures in full window exceeds the threshold."""
+        if len(self._outcomes) < (self._outcomes.maxlen or 0):
+            return False
+        return sum(self._outcomes) / len(self._outcomes) > self.error_threshold
+
+
+class ScrapeScheduler:
+    """
+    Scrapes requests concurrently with multiple drivers, each one used
+    by its own worker thread. Number of active workers is limited by
+    `AdaptiveConcurrency` controller and requests to each host by
+    `HostRateLimiter`. Current limits are reported to run metrics.
+
+    Drivers are created lazily with `driver_factory`, only when limit
+    allows more workers than there are drivers already. Drivers provided
+    in `drivers` are used first and are not closed by the scheduler.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], IScraper],
+        concurrency: AdaptiveConcurrency,
+        limiter: HostRateLimiter,
+        metrics: RunMetrics | None = None,
+        drivers: Sequence[IScraper] = (),
+    ) -> None:
+        self.concurrency = concurrency
+        self.limiter = limiter
+        self.metrics = metrics or RunMetrics()
+        self._factory = driver_factory
+        self._idle: list[IScraper] = list(drivers)
+        self._created: list[IScraper] = []
+        self._lock = threading.Lock()
+
+    def run(
+        self, requests: Sequence[StockRequest], deadline: Deadline | None = None
+    ) -> Iterator[tuple[int, ScrapeOutcome]]:
+        """
+        Scrapes all requests concurrently. When generator is closed early,
+        no more requests are started and requests in progress are finished.
+
+        Parameters
+        ----------
+        requests : Sequence[StockRequest]
+            Requests to be scraped.
+        deadline : Deadline | None, optional
+            Deadline after which no more requests are started, by default None.
+            Requests, which were not started, are not yielded.
+
+        Yields
+        ------
+        tuple[int, RawStockResponse | ScrapingError]
+            Index of the request in `requests` and either scraped response
+            or error that occurred while scraping it, in order of completion.
+        """
+        pending = deque(enumerate(requests))
+        results: queue.Queue[tuple[int, ScrapeOutcome] | None] = queue.Queue()
+        condition = threading.Condition()
+        active = [0]
+
+        def work() -> None:
+            driver: IScraper | None = None
+
+            try:
+                while True:
+                    with condition:
+                        while pending and active[0] >= self.concurrency.limit:
+                            condition.wait()
+
+                        if deadline is not None and deadline.expired():
+                            pending.clear()
+
+                        if not pending:
+                            break
+
+                        index, request = pending.popleft()
+                        active[0] += 1
+
+                    outcome: ScrapeOutcome
+
+                    try:
+                        if driver is None:
+                            driver = self._take_driver()
+                    except Exception as e:  # browser failed to start
+                        outcome = exc.ScrapingError(f"Failed to start driver: {e}")
+                    else:
+                        outcome = self._scrape(driver, request)
+                    finally:
+                        with condition:
+                            active[0] -= 1
+                            condition.notify_all()
+
+                    results.put((index, outcome))
+            finally:
+                if driver is not None:
+                    self._return_driver(driver)
+
+                results.put(None)  # worker finished, also when it failed
+
+        workers = [
+            threading.Thread(target=work, daemon=True)
+            for _ in range(min(self.concurrency.maximum, len(requests)))
+        ]
+        self._report()
+
+        for worker in workers:
+            worker.start()
+
+        try:
+            finished = 0
+
+            while finished < len(workers):
+                result = results.get()
+
+                if result is None:
+                    finished += 1
+                else:
+                    yield result
+        finally:
+            with condition:
+                pending.clear()
+                condition.notify_all()
+
+            for worker in workers:
+                worker.join()
+
+    def close(self) -> None:
+        """Quits all drivers created by the scheduler."""
+        with self._lock:
+            for driver in self._created:
+                driver.quit()
+            self._created.clear()
+
+    def _scrape(self, driver: IScraper, request: StockRequest) -> ScrapeOutcome:
+        """Scrapes single request and reports its outcome to the controller."""
+        self.limiter.acquire(parse_url(request))
+        start = time.monotonic()
+        outcome: ScrapeOutcome
+
+        try:
+            outcome = driver.scrape(request)
+        except exc.ScrapingError as e:
+            outcome = e
+        except Exception as e:  # e.g. WebDriverException, request fails alone
+            outcome = exc.ScrapingError(f"Failed to scrape {request.stock_code}: {e}")
+            outcome.__cause__ = e
+
+        error = outcome if isinstance(outcome, exc.ScrapingError) else None
+        self.concurrency.record(time.monotonic() - start, error)
+
+        if isinstance(error, exc.PageLoadTimeoutError):
+            self.metrics.increment("page_load_timeouts")
+
+        self._report()
+        return outcome
+
+    def _report(self) -> None:
+        """Reports current limits to run metrics."""
+        self.metrics.set_gauge("concurrency", self.concurrency.limit)
+        self.metrics.set_gauge("rate_limit_per_host", self.limiter.rate)
+
+    def _take_driver(self) -> IScraper:
+        """Takes idle driver or creates a new one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+
+        driver = self._factory()
+
+        with self._lock:
+            self._created.append(driver)
+
+        self.metrics.increment("drivers_started")
+        return driver
+
+    def _return_driver(self, driver: IScraper) -> None:
+        """Puts driver back to idle drivers, so it can be used in the next run."""
+        with self._lock:
+            self._idle.append(driver)
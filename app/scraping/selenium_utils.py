@@ -1,15 +1,24 @@
 """
 Utilities for setting up and using Selenium WebDriver
 to scrape stock data from the LSE website.
+Drivers run browser of any backend of `app.scraping.browsers`,
+either locally or on remote WebDriver endpoint.
 """
 
-from sys import platform
-from typing import Self
+import base64
+import json
+import time
+from collections import deque
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator, Self, Sequence
 
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver import Chrome
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver import Chrome, Firefox, Remote
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from soupsavvy.exceptions import BaseModelException
@@ -17,21 +26,58 @@ from soupsavvy.implementation.selenium import SeleniumElement
 
 import app.constants as const
 import app.exceptions as exc
-from app.data_managers.parsers import parse_url
-from app.models.pydantic_models import StockRequest, StockResponse
+from app.data_managers.page_store import IPageStore
+from app.data_managers.parsers import parse_listing_url, parse_url
+from app.data_managers.url_index import UrlIndex
+from app.models.pydantic_models import RawStockResponse, StockRequest
 from app.models.soupsavvy_models import StockScraperModel
+from app.scraping.browsers import ChromeBackend, IBrowserBackend
+from app.scraping.endpoints import EndpointPool
+from app.scraping.listing import ListingIndex, has_next_page, parse_listing
+from app.scraping.network import extract_price, iter_json_responses
+from app.scraping.process import process_tree_rss
 
 page_loaded_condition = EC.presence_of_element_located((By.ID, const.STOCK_SCOPE_ID))
+listing_loaded_condition = EC.any_of(
+    EC.presence_of_element_located((By.CLASS_NAME, const.LISTING_ROW_CLASS)),
+    EC.presence_of_element_located((By.CLASS_NAME, const.LISTING_EMPTY_CLASS)),
+)
+
+# clears current document, so stale stock data is not read before new page commits,
+# and marks its window, which is replaced by window of the new page
+NAVIGATE_SCRIPT = """
+window.lseNavigationPending = true;
+document.documentElement.innerHTML = "";
+window.location.href = arguments[0];
+"""
+NAVIGATION_PENDING_SCRIPT = "return window.lseNavigationPending === true;"
+
+ScrapeOutcome = RawStockResponse | exc.ScrapingError
 
 
-class LSEDriver(Chrome):
+class BaseLSEDriver(Remote):
     """
-    Custom Selenium WebDriver for scraping LSE stock data.
+    Base of Selenium WebDriver for scraping LSE stock data.
     Inludes extra functionality specific to LSE website
-    for navigating and extracting stock information.
+    for navigating and extracting stock information, shared by drivers
+    of local browser (`LSEDriver`) and remote one (`RemoteLSEDriver`).
+
+    When `capture_network` is set, stock data is read from JSON responses
+    the page fetches in the background, recorded in Chrome performance log
+    (see `get_driver`). Page is parsed only if no matching response is seen.
+
+    When `recorder` is set, stock data section of each parsed page is saved
+    in it before parsing, so it can be replayed later without browser.
+
+    When `urls` is set, stock pages are loaded from URLs indexed in it,
+    and URL of each successfully loaded stock page is added to it.
     """
 
-    def scrape(self, request: StockRequest) -> StockResponse:
+    capture_network: bool = False
+    recorder: IPageStore | None = None
+    urls: UrlIndex | None = None
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
         """
         Scrapes stock data for the given StockRequest object.
 
@@ -42,8 +88,8 @@ class LSEDriver(Chrome):
 
         Returns
         -------
-        StockResponse
-            StockResponse object with scraped data.
+        RawStockResponse
+            RawStockResponse object with scraped data, price is not converted.
 
         Notes
         -----
@@ -57,30 +103,390 @@ class LSEDriver(Chrome):
         exc.ScrapingError
             If required elements cannot be found on the page.
         """
-        url = parse_url(request)
-        self._navigate_to_stock_page(url)
+        url = self._resolve_url(request)
+
+        if not self.capture_network:
+            self._navigate_to_stock_page(url)
+            self._index_url(request)
+            return self._extract_response(request, url)
+
+        self.get_log("performance")  # drop entries of previously loaded pages
+        self._navigate_to_stock_page(url, wait=False)
+        response = self._wait_for_network_response(request, url)
+        self._index_url(request)
+        return response
+
+    def scrape_many(
+        self,
+        requests: Sequence[StockRequest],
+        tabs: int = const.DEFAULT_TABS,
+        timeout: float = const.DEFAULT_TIMEOUT,
+    ) -> Iterator[tuple[int, ScrapeOutcome]]:
+        """
+        Scrapes stock data for multiple requests using several tabs of the browser.
+        Navigation is started in all tabs at once and data is harvested
+        from whichever tab finishes loading first, so page loads overlap.
+        Freed tab immediately starts loading next pending request.
+
+        Parameters
+        ----------
+        requests : Sequence[StockRequest]
+            Requests to be scraped.
+        tabs : int, optional
+            Number of tabs loading pages concurrently, by default `DEFAULT_TABS`.
+        timeout : float, optional
+            Time in seconds after which loading page is considered failed,
+            by default `DEFAULT_TIMEOUT`.
+
+        Yields
+        ------
+        tuple[int, RawStockResponse | ScrapingError]
+            Index of the request in `requests` and either scraped response
+            or error that occurred while scraping it, in order of completion.
+
+        Notes
+        -----
+        Driver should be created with page load strategy `none`
+        (see `get_driver`), otherwise switching between tabs waits
+        for each page to fully load and loads are harvested one after another.
+        Method opens extra tabs and closes them when finished.
+        Data is always parsed from the page, regardless of `capture_network`.
+        """
+        pending = deque(enumerate(requests))
+        handles = self._open_tabs(min(tabs, len(pending)))
+        in_flight: dict[str, tuple[int, StockRequest, str, float]] = {}
+
+        try:
+            for handle in handles:
+                yield from self._dispatch(handle, pending, in_flight)
+
+            while in_flight:
+                for handle in list(in_flight):
+                    index, request, url, started = in_flight[handle]
+                    self.switch_to.window(handle)
+
+                    outcome: ScrapeOutcome | None
+
+                    try:
+                        outcome = self._harvest(request, url, started, timeout)
+                    except exc.ScrapingError as e:
+                        outcome = e
+
+                    if outcome is None:
+                        continue
+
+                    del in_flight[handle]
+                    yield index, outcome
+                    yield from self._dispatch(handle, pending, in_flight)
+
+                time.sleep(const.TAB_POLL_INTERVAL)
+        finally:
+            self._close_tabs(handles)
+
+    def scrape_listing(
+        self,
+        max_pages: int = const.MAX_LISTING_PAGES,
+        timeout: float = const.DEFAULT_TIMEOUT,
+    ) -> ListingIndex:
+        """
+        Walks through paginated listing of instruments and indexes
+        their stock data by stock code. Walk stops at the page without link
+        to the next page, at empty listing or page with rows already seen,
+        or after `max_pages` pages. Page, which shows neither rows nor empty
+        listing within `timeout`, also ends the walk.
+
+        Parameters
+        ----------
+        max_pages : int, optional
+            Maximum number of listing pages to load, by default `MAX_LISTING_PAGES`.
+        timeout : float, optional
+            Time in seconds to wait for rows of the page, by default `DEFAULT_TIMEOUT`.
+
+        Returns
+        -------
+        ListingIndex
+            Index of stock data scraped from listing pages.
+
+        Raises
+        -------
+        exc.PageLoadError
+            If navigation to any of the listing pages failed.
+        """
+        index = ListingIndex()
+
+        for page in range(1, max_pages + 1):
+            self._start_navigation(parse_listing_url(page))
+
+            try:
+                WebDriverWait(self, timeout).until(listing_loaded_condition)
+            except TimeoutException:
+                break  # page did not render listing, e.g. its markup changed
+
+            element = self._get_element()
+
+            if not index.update(parse_listing(element)):
+                break  # page is empty or repeats already indexed rows
+
+            if not has_next_page(element):
+                break  # last page of listing
+
+        return index
+
+    def is_alive(self) -> bool:
+        """
+        Checks whether browser still responds to commands.
+        Crashed browser or lost chromedriver session makes every command fail.
+
+        Returns
+        -------
+        bool
+            True if browser responds, False otherwise.
+        """
+        try:
+            self.current_window_handle
+        except Exception:  # session lost, chromedriver or Chrome crashed
+            return False
+        return True
+
+    def memory_usage(self) -> int:
+        """
+        Returns resident memory of processes of the browser.
+
+        Returns
+        -------
+        int
+            Resident set size in bytes, 0 if processes cannot be inspected.
+        """
+        return 0
+
+    def get_log(self, log_type: str) -> Any:
+        """Returns new entries of the log of given type, e.g. `performance`."""
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> Any:
+        """Executes Chrome DevTools Protocol command, returns its result."""
+        params = {"cmd": cmd, "params": cmd_args}
+        return self.execute("executeCdpCommand", params)["value"]
+
+    def _dispatch(
+        self,
+        handle: str,
+        pending: deque[tuple[int, StockRequest]],
+        in_flight: dict[str, tuple[int, StockRequest, str, float]],
+    ) -> Iterator[tuple[int, ScrapeOutcome]]:
+        """
+        Starts navigation to the next pending request in given tab.
+        Requests for which navigation could not be started are yielded as failed.
+        """
+        self.switch_to.window(handle)
+
+        while pending:
+            index, request = pending.popleft()
+            url = self._resolve_url(request)
+
+            try:
+                self._start_navigation(url)
+            except exc.PageLoadError as e:
+                yield index, e
+                continue
+
+            in_flight[handle] = (index, request, url, time.monotonic())
+            return
+
+    def _harvest(
+        self, request: StockRequest, url: str, started: float, timeout: float
+    ) -> RawStockResponse | None:
+        """
+        Checks state of the page in current tab. Returns scraped response
+        if stock data is present or None if page is still loading.
+
+        Raises
+        ------
+        exc.PageLoadError
+            If driver was redirected or page did not load within timeout.
+        """
+        # until new page commits, tab still shows url of the previous one,
+        # which may be price explorer the previous request was redirected to
+        committed = not self.execute_script(NAVIGATION_PENDING_SCRIPT)
+
+        if committed and not self._is_valid_stock_page():
+            raise exc.PageLoadError(
+                f"Stock details page not found on LSE website for url: {url}"
+            )
+
+        if not committed or not self.find_elements(By.ID, const.STOCK_SCOPE_ID):
+            if time.monotonic() - started > timeout:
+                raise exc.PageLoadTimeoutError(
+                    "Required web elements not found within the timeout period, "
+                    f"structure of the website may have changed for url: {url}"
+                )
+            return None
+
+        self._index_url(request)
+        return self._extract_response(request, url)
+
+    def _resolve_url(self, request: StockRequest) -> str:
+        """Returns URL of the stock page, indexed one if `urls` is set."""
+        if self.urls is None:
+            return parse_url(request)
+        return self.urls.resolve(request)
+
+    def _index_url(self, request: StockRequest) -> None:
+        """Adds URL of loaded stock page to `urls`, if it's set."""
+        if self.urls is not None:
+            self.urls.add(request.stock_code, self.current_url)
+
+    def _start_navigation(self, url: str) -> Self:
+        """
+        Starts navigation to the given URL in current tab without waiting
+        for the page to load.
+        """
+        try:
+            self.execute_script(NAVIGATE_SCRIPT, url)
+        except Exception as e:  # tab or Chrome crash
+            raise exc.PageLoadError(f"Failed to load {url}: {e}") from e
+        return self
+
+    def _open_tabs(self, n: int) -> list[str]:
+        """
+        Opens tabs, so there is `n` of them in total including current one.
+        Returns handles of all tabs, starting with current one.
+        """
+        handles = [self.current_window_handle]
+
+        for _ in range(n - 1):
+            self.switch_to.new_window("tab")
+            handles.append(self.current_window_handle)
+
+        return handles
+
+    def _close_tabs(self, handles: list[str]) -> Self:
+        """Closes all tabs opened by `_open_tabs`, switching back to the first one."""
+        for handle in handles[1:]:
+            self.switch_to.window(handle)
+            self.close()
+
+        self.switch_to.window(handles[0])
+        return self
+
+    def _extract_response(self, request: StockRequest, url: str) -> RawStockResponse:
+        """
+        Extracts stock data from currently loaded page into RawStockResponse.
+        Raises ElementNotFoundError if scraping with soupsavvy model fails.
+        """
         element = self._get_element()
 
+        if self.recorder is not None:
+            self._record(self.recorder, request)
+
         try:
             scraped = StockScraperModel.find(element)
         except BaseModelException as e:
             raise exc.ElementNotFoundError(f"Error scraping data for {url}: {e}") from e
 
-        response = scraped.migrate(
-            StockResponse,
+        # direct construction, migrate copies all scraper model attributes first
+        response = RawStockResponse(
             company_name=request.company_name,
             stock_code=request.stock_code,
+            timestamp=scraped.timestamp,
+            value=scraped.value,
+            currency=scraped.currency,
         )
         return response
 
-    def _navigate_to_stock_page(self, url: str) -> Self:
+    def _record(self, recorder: IPageStore, request: StockRequest) -> None:
+        """Saves stock data section of currently loaded page in the recorder."""
+        try:
+            node = self.find_element(By.ID, const.STOCK_SCOPE_ID)
+        except WebDriverException:  # nothing to record, parsing reports error
+            return
+
+        html = node.get_attribute("outerHTML")
+
+        if html is not None:
+            recorder.save(request.stock_code, html)
+
+    def _wait_for_network_response(
+        self,
+        request: StockRequest,
+        url: str,
+        timeout: float = const.DEFAULT_TIMEOUT,
+    ) -> RawStockResponse:
+        """
+        Waits until stock data arrives in one of JSON responses of the page.
+        Falls back to parsing the page, if it rendered stock data element
+        before any matching response was seen.
+        If neither happens within the timeout, raises PageLoadError.
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            scraped = self._read_network_log(request.stock_code)
+
+            if scraped is not None:
+                timestamp, value, currency = scraped
+                return RawStockResponse(
+                    company_name=request.company_name,
+                    stock_code=request.stock_code,
+                    timestamp=timestamp,
+                    value=value,
+                    currency=currency,
+                )
+
+            if self.find_elements(By.ID, const.STOCK_SCOPE_ID):
+                return self._extract_response(request, url)
+
+            if time.monotonic() > deadline:
+                raise exc.PageLoadTimeoutError(
+                    "Neither stock data response nor required web elements "
+                    f"were found within the timeout period for url: {url}"
+                )
+
+            time.sleep(const.NETWORK_POLL_INTERVAL)
+
+    def _read_network_log(self, stock_code: str) -> tuple[str, str, str | None] | None:
+        """
+        Reads new entries of performance log and searches bodies of JSON
+        responses related to the stock for its timestamp, price and currency.
+        """
+        entries = self.get_log("performance")
+
+        for request_id in iter_json_responses(entries, stock_code):
+            try:
+                body = self.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": request_id}
+                )
+            except WebDriverException:  # body is not available (anymore)
+                continue
+
+            text = body["body"]
+
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode()
+
+            try:
+                payload = json.loads(text)
+            except ValueError:
+                continue
+
+            scraped = extract_price(payload, stock_code)
+
+            if scraped is not None:
+                return scraped
+
+        return None
+
+    def _navigate_to_stock_page(self, url: str, wait: bool = True) -> Self:
         """
         Navigates to the stock details page for the given URL.
-        Checks if the page loaded correctly and expected elements are present.
+        Checks if the page loaded correctly and, if `wait` is set,
+        that expected elements are present.
         """
         try:
             self.get(url)
-        except Exception as e:  # network error, timeout, Chrome crash
+        except TimeoutException as e:
+            raise exc.PageLoadTimeoutError(f"Timed out loading {url}: {e}") from e
+        except Exception as e:  # network error, Chrome crash
             raise exc.PageLoadError(f"Failed to load {url}: {e}") from e
 
         if not self._is_valid_stock_page():
@@ -88,7 +494,8 @@ class LSEDriver(Chrome):
                 f"Stock details page not found on LSE website for url: {url}"
             )
 
-        self._wait_for_page_load()
+        if wait:
+            self._wait_for_page_load()
         return self
 
     def _get_element(self) -> SeleniumElement:
@@ -113,46 +520,232 @@ class LSEDriver(Chrome):
         try:
             WebDriverWait(self, timeout).until(page_loaded_condition)
         except TimeoutException:
-            raise exc.PageLoadError(
+            raise exc.PageLoadTimeoutError(
                 "Required web elements not found within the timeout period, "
                 "structure of the website may have changed for given stock."
             )
         return self
 
 
-def _build_chrome_options(headless: bool = True) -> Options:
-    """Build and return Chrome Options configured for LSE scraping."""
+def _service_memory(service: Service | None) -> int:
+    """Returns resident memory of local driver service and browser it started."""
+    process = service.process if service is not None else None
 
-    opts = Options()
-    args = const.CHROME_DEFAULT_ARGS
+    if process is None:
+        return 0
 
-    if headless:
-        args.append("--headless")
+    return process_tree_rss(process.pid)
 
-    if platform == "linux":  # pragma: no cover
-        args.extend(const.CHROME_LINUX_ARGS)
 
-    for arg in args:
-        opts.add_argument(arg)
+class LSEDriver(Chrome, BaseLSEDriver):
+    """
+    Driver of local Chrome browser or chrome-headless-shell started
+    with chromedriver, see `BaseLSEDriver` for scraping functionality.
+    """
 
-    for key, value in const.CHROME_EXPERIMENTAL.items():
-        opts.add_experimental_option(key, value)
+    def memory_usage(self) -> int:
+        """
+        Returns resident memory of chromedriver and all processes of the browser.
 
-    return opts
+        Returns
+        -------
+        int
+            Resident set size in bytes, 0 if processes cannot be inspected.
+        """
+        return _service_memory(self.service)
+
+
+class FirefoxLSEDriver(Firefox, BaseLSEDriver):
+    """
+    Driver of local Firefox browser started with geckodriver,
+    see `BaseLSEDriver` for scraping functionality.
+    Firefox has neither performance log nor Chrome DevTools Protocol,
+    so stock data is always parsed from the page.
+    """
+
+    def memory_usage(self) -> int:
+        """
+        Returns resident memory of geckodriver and all processes of the browser.
+
+        Returns
+        -------
+        int
+            Resident set size in bytes, 0 if processes cannot be inspected.
+        """
+        return _service_memory(self.service)
+
+
+# driver class running browser of each backend locally, by name of the backend
+LOCAL_DRIVERS: dict[str, Callable[..., LSEDriver | FirefoxLSEDriver]] = {
+    const.BROWSER_CHROME: LSEDriver,
+    const.BROWSER_HEADLESS_SHELL: LSEDriver,
+    const.BROWSER_FIREFOX: FirefoxLSEDriver,
+}
+
+
+class RemoteLSEDriver(BaseLSEDriver):
+    """
+    Driver of browser running on remote WebDriver endpoint,
+    e.g. Selenium standalone container or chromedriver on another machine,
+    see `BaseLSEDriver` for scraping functionality.
+
+    When `endpoints` is set, slot of the endpoint reserved for the driver
+    is released when driver quits, and browser, which no longer responded,
+    is reported as failure of the endpoint.
+    Memory of remote browser cannot be inspected, so it's never recycled
+    because of memory usage.
+    """
+
+    endpoints: EndpointPool | None = None
+    endpoint: str | None = None
+
+    def __init__(
+        self,
+        command_executor: str,
+        options: ArgOptions,
+        browser: IBrowserBackend | None = None,
+    ) -> None:
+        """
+        Starts new session of the browser on remote endpoint.
 
+        Parameters
+        ----------
+        command_executor : str
+            URL of remote WebDriver endpoint, e.g. `http://host:4444`.
+        options : ArgOptions
+            Options of the browser, see `IBrowserBackend.options`.
+        browser : IBrowserBackend | None, optional
+            Backend of the browser, by default Chrome.
+        """
+        connection = (browser or ChromeBackend()).connection(command_executor)
+        super().__init__(command_executor=connection, options=options)
+
+    def quit(self) -> None:
+        """Quits the browser and releases its slot of the endpoint."""
+        alive = self.is_alive()
+
+        try:
+            super().quit()
+        finally:
+            if self.endpoints is not None and self.endpoint is not None:
+                self.endpoints.report(self.endpoint, ok=alive)
+                self.endpoints.release(self.endpoint)
 
-def get_driver(headless: bool = True) -> LSEDriver:
+
+def get_driver(
+    headless: bool = True,
+    tabs: int = 1,
+    capture_network: bool = False,
+    profile_dir: Path | None = None,
+    cache_size: int = const.DISK_CACHE_SIZE_MB * const.MEGABYTE,
+    recorder: IPageStore | None = None,
+    urls: UrlIndex | None = None,
+    browser: IBrowserBackend | None = None,
+) -> LSEDriver | FirefoxLSEDriver:
     """
-    Sets up and returns a configured LSEDriver instance.
+    Sets up and returns a configured driver of local browser.
 
     Parameters
     ----------
     headless : bool, optional
         Whether to run the browser in headless mode, by default True.
+    tabs : int, optional
+        Number of tabs driver is going to use in `scrape_many`, by default 1.
+        For more than one tab, page load strategy is set to `none`.
+    capture_network : bool, optional
+        Whether to read stock data from JSON responses of the page
+        with fallback to parsing the page, by default False.
+    profile_dir : Path | None, optional
+        Directory of persistent browser profile, which keeps disk cache
+        between runs (see `ProfilePool`), by default None, which means
+        temporary profile is used.
+    cache_size : int, optional
+        Maximum size of disk cache in bytes, by default `DISK_CACHE_SIZE_MB`.
+    recorder : IPageStore | None, optional
+        Store in which parsed pages are recorded, by default None.
+    urls : UrlIndex | None, optional
+        Index of URLs of stock pages used and updated by driver, by default None,
+        which means URLs are built from company names.
+    browser : IBrowserBackend | None, optional
+        Backend of the browser, by default Chrome.
 
     Returns
     -------
-    LSEDriver - Configured Selenium WebDriver for LSE scraping.
+    LSEDriver | FirefoxLSEDriver - Configured Selenium WebDriver for LSE scraping.
+
+    Raises
+    ------
+    exc.BrowserBackendError
+        If network capture is requested from browser, which doesn't support it.
+    """
+    browser = browser or ChromeBackend()
+    opts = browser.options(
+        headless=headless,
+        tabs=tabs,
+        capture_network=capture_network,
+        profile_dir=profile_dir,
+        cache_size=cache_size,
+    )
+    driver = LOCAL_DRIVERS[browser.name](options=opts)
+    driver.capture_network = capture_network
+    driver.recorder = recorder
+    driver.urls = urls
+    return driver
+
+
+def get_remote_driver(
+    endpoints: EndpointPool,
+    headless: bool = True,
+    tabs: int = 1,
+    capture_network: bool = False,
+    recorder: IPageStore | None = None,
+    urls: UrlIndex | None = None,
+    browser: IBrowserBackend | None = None,
+) -> RemoteLSEDriver:
+    """
+    Starts browser on remote endpoint of the pool with the most free capacity
+    and returns its driver. If browser fails to start, next healthy
+    endpoint is tried. Browsers use temporary profiles of remote machine.
+
+    Parameters
+    ----------
+    endpoints : EndpointPool
+        Pool of remote WebDriver endpoints.
+    headless : bool, optional
+        Whether to run the browser in headless mode, by default True.
+    tabs : int, optional
+        Number of tabs driver is going to use in `scrape_many`, by default 1.
+    capture_network : bool, optional
+        Whether to read stock data from JSON responses of the page,
+        by default False. Endpoint must pass through Chrome DevTools commands.
+    recorder : IPageStore | None, optional
+        Store in which parsed pages are recorded, by default None.
+    urls : UrlIndex | None, optional
+        Index of URLs of stock pages used and updated by driver, by default None.
+    browser : IBrowserBackend | None, optional
+        Backend of the browser, by default Chrome. Endpoint must run the browser.
+
+    Returns
+    -------
+    RemoteLSEDriver - Configured remote Selenium WebDriver for LSE scraping.
+
+    Raises
+    ------
+    exc.EndpointUnavailableError
+        If no endpoint is healthy and has free capacity.
+    exc.BrowserBackendError
+        If network capture is requested from browser, which doesn't support it.
     """
-    opts = _build_chrome_options(headless=headless)
-    return LSEDriver(options=opts)
+    browser = browser or ChromeBackend()
+    opts = browser.options(
+        headless=headless, tabs=tabs, capture_network=capture_network
+    )
+    endpoint, driver = endpoints.start(
+        partial(RemoteLSEDriver, options=opts, browser=browser)
+    )
+    driver.endpoints = endpoints
+    driver.endpoint = endpoint
+    driver.capture_network = capture_network
+    driver.recorder = recorder
+    driver.urls = urls
+    return driver
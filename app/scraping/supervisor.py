@@ -0,0 +1,283 @@
+"""
+Module with supervisor managing lifecycle of the browser during long runs.
+Browser is restarted after given number of pages, when memory of its processes
+grows over the limit, or after it crashed. Request in flight during the crash
+is retried with the new browser.
+"""
+
+from typing import Callable, Iterator, Protocol, Sequence
+
+import app.constants as const
+import app.exceptions as exc
+from app.logging import logger
+from app.metrics import RunMetrics
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.scraping.listing import ListingIndex
+from app.scraping.selenium_utils import ScrapeOutcome
+
+RECYCLE_PAGES = "pages"
+RECYCLE_MEMORY = "memory"
+RECYCLE_CRASH = "crash"
+
+
+class ISupervisedDriver(Protocol):
+    """Interface of driver managed by the supervisor."""
+
+    def scrape(self, request: StockRequest) -> RawStockResponse: ...
+
+    def scrape_many(
+        self, requests: Sequence[StockRequest], tabs: int
+    ) -> Iterator[tuple[int, ScrapeOutcome]]: ...
+
+    def scrape_listing(self) -> ListingIndex: ...
+
+    def is_alive(self) -> bool: ...
+
+    def memory_usage(self) -> int: ...
+
+    def quit(self) -> None: ...
+
+
+def _scraping_error(error: Exception) -> exc.ScrapingError:
+    """
+    Returns error as ScrapingError, so callers handle it as failed request.
+    Other errors, e.g. WebDriverException, are wrapped with the original as cause.
+    """
+    if isinstance(error, exc.ScrapingError):
+        return error
+
+    wrapped = exc.ScrapingError(f"Browser error: {error}")
+    wrapped.__cause__ = error
+    return wrapped
+
+
+class DriverSupervisor:
+    """
+    Driver proxy, which restarts the browser when it needs to be recycled.
+    Before each page it checks number of pages loaded by current browser
+    and, every `memory_interval` pages, memory of its process tree.
+    Failed scraping with browser no longer responding is treated as crash,
+    browser is restarted and the request is scraped again.
+
+    Recycle events are counted in run metrics as `drivers_recycled`
+    and per reason as `drivers_recycled_<reason>`.
+
+    Example
+    -------
+    >>> supervisor = DriverSupervisor(get_driver, max_pages=100)
+    >>> supervisor.scrape(request)
+    >>> supervisor.quit()
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], ISupervisedDriver],
+        max_pages: int = const.RECYCLE_PAGES,
+        max_memory: int = const.RECYCLE_MEMORY,
+        memory_interval: int = const.MEMORY_CHECK_INTERVAL,
+        metrics: RunMetrics | None = None,
+    ) -> None:
+        """
+        Starts the first browser.
+
+        Parameters
+        ----------
+        driver_factory : Callable[[], ISupervisedDriver]
+            Function starting new browser.
+        max_pages : int, optional
+            Number of pages after which browser is restarted,
+            by default `RECYCLE_PAGES`.
+        max_memory : int, optional
+            Resident memory in bytes of browser processes, above which
+            browser is restarted, by default `RECYCLE_MEMORY`.
+        memory_interval : int, optional
+            Number of pages between memory checks, by default `MEMORY_CHECK_INTERVAL`.
+        metrics : RunMetrics | None, optional
+            Metrics of the run updated with recycle events.
+        """
+        self.max_pages = max_pages
+        self.max_memory = max_memory
+        self.memory_interval = memory_interval
+        self.metrics = metrics or RunMetrics()
+        self._factory = driver_factory
+        self._driver = driver_factory()
+        self._pages = 0
+        self._memory_checked = 0
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        """
+        Scrapes single request, see `LSEDriver.scrape`.
+        If browser crashed while scraping, request is retried once
+        with restarted browser.
+        """
+        self._recycle_if_needed()
+        self._pages += 1
+
+        try:
+            return self._driver.scrape(request)
+        except Exception as e:
+            if not self._crashed(e):
+                raise _scraping_error(e)
+
+        self.recycle(RECYCLE_CRASH)
+        self._pages += 1
+
+        try:
+            return self._driver.scrape(request)
+        except Exception as e:
+            raise _scraping_error(e)
+
+    def scrape_many(
+        self, requests: Sequence[StockRequest], tabs: int = const.DEFAULT_TABS
+    ) -> Iterator[tuple[int, ScrapeOutcome]]:
+        """
+        Scrapes multiple requests in tabs, see `LSEDriver.scrape_many`.
+        Requests are split into chunks, so browser is recycled between them.
+        Failed requests of chunk, during which browser crashed, are retried once
+        with restarted browser. Errors of the browser are not raised,
+        requests not finished because of them are yielded as failed.
+        """
+        start = 0
+
+        while start < len(requests):
+            try:
+                self._recycle_if_needed()
+            except exc.ScrapingError as e:
+                for index in range(start, len(requests)):
+                    yield index, e
+                return
+
+            size = max(1, self.max_pages - self._pages)
+            chunk = requests[start : start + size]
+            failed: dict[int, ScrapeOutcome] = {}
+            done: set[int] = set()
+
+            try:
+                for index, outcome in self._driver.scrape_many(chunk, tabs=tabs):
+                    self._pages += 1
+                    done.add(index)
+
+                    if isinstance(outcome, exc.PageLoadError):
+                        failed[index] = outcome
+                    else:
+                        yield start + index, outcome
+            except Exception as e:
+                error = (
+                    _scraping_error(e)
+                    if self._driver.is_alive()
+                    else exc.PageLoadError(f"Browser crashed: {e}")
+                )
+
+                for index in set(range(len(chunk))) - done:
+                    failed[index] = error
+
+            if failed and not self._driver.is_alive():
+                self._retry(chunk, failed, tabs)
+
+            for index, outcome in sorted(failed.items()):
+                yield start + index, outcome
+
+            start += len(chunk)
+
+    def scrape_listing(self) -> ListingIndex:
+        """
+        Scrapes paginated listing, see `LSEDriver.scrape_listing`.
+        If browser crashed while scraping, listing is scraped again
+        with restarted browser.
+        """
+        self._recycle_if_needed()
+
+        try:
+            return self._driver.scrape_listing()
+        except Exception as e:
+            if not self._crashed(e):
+                raise _scraping_error(e)
+
+        self.recycle(RECYCLE_CRASH)
+
+        try:
+            return self._driver.scrape_listing()
+        except Exception as e:
+            raise _scraping_error(e)
+
+    def recycle(self, reason: str) -> None:
+        """
+        Quits current browser and starts a new one.
+
+        Parameters
+        ----------
+        reason : str
+            Reason of recycling, reported in run metrics.
+
+        Raises
+        ------
+        exc.PageLoadError
+            If new browser failed to start, with the original error as cause.
+        """
+        logger.warning("Recycling browser after %d pages, %s", self._pages, reason)
+
+        try:
+            self._driver.quit()
+        except Exception as e:  # crashed browser may fail to quit cleanly
+            logger.error("Error quitting browser: %s", e)
+
+        try:
+            self._driver = self._factory()
+        except Exception as e:
+            raise exc.PageLoadError(f"Failed to restart browser: {e}") from e
+
+        self._pages = 0
+        self._memory_checked = 0
+        self.metrics.increment("drivers_recycled")
+        self.metrics.increment(f"drivers_recycled_{reason}")
+
+    def quit(self) -> None:
+        """Quits current browser."""
+        self._driver.quit()
+
+    def _retry(
+        self, chunk: Sequence[StockRequest], failed: dict[int, ScrapeOutcome], tabs: int
+    ) -> None:
+        """
+        Retries failed requests of chunk with restarted browser, replacing
+        their outcomes in `failed`. If restart or retry fails, requests
+        without new outcome fail with its error.
+        """
+        positions = list(failed)
+        retried: set[int] = set()
+
+        try:
+            self.recycle(RECYCLE_CRASH)
+            requests = [chunk[index] for index in positions]
+
+            for index, outcome in self._driver.scrape_many(requests, tabs=tabs):
+                self._pages += 1
+                failed[positions[index]] = outcome
+                retried.add(positions[index])
+        except Exception as e:
+            error = _scraping_error(e)
+
+            for index in set(positions) - retried:
+                failed[index] = error
+
+    def _recycle_if_needed(self) -> None:
+        """Recycles browser before the next page if it exceeded any of limits."""
+        if self._pages >= self.max_pages:
+            self.recycle(RECYCLE_PAGES)
+        elif self._pages - self._memory_checked >= self.memory_interval:
+            self._memory_checked = self._pages
+
+            if self._driver.memory_usage() > self.max_memory:
+                self.recycle(RECYCLE_MEMORY)
+
+    def _crashed(self, error: Exception) -> bool:
+        """
+        Checks if error was caused by crash of the browser.
+        Timeouts and missing elements mean that browser still responds.
+        """
+        if isinstance(error, exc.ScrapingError) and (
+            not isinstance(error, exc.PageLoadError)
+            or isinstance(error, exc.PageLoadTimeoutError)
+        ):
+            return False
+        return not self._driver.is_alive()
@@ -0,0 +1,97 @@
+"""
+Benchmark of browser backends, which scrapes the same watchlist with each
+of them and reports start time of the browser, pages per second
+and memory of browser processes, so the cheapest backend for the host
+can be picked with `--browser`. Memory is sampled after each page.
+Requires browsers of compared backends and access to the website.
+
+Usage
+-----
+python -m benchmarks.browsers --input watchlist.csv
+python -m benchmarks.browsers --input watchlist.csv --browsers chrome firefox
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import app.constants as const
+import app.exceptions as exc
+from app.constants import DataColumns
+from app.data_managers.parsers import parse_requests
+from app.data_managers.reader import LSEDataReader
+from app.models.pydantic_models import StockRequest
+from app.scraping.browsers import get_backend
+from app.scraping.selenium_utils import get_driver
+
+
+def measure(
+    browser: str, requests: list[StockRequest], binary: Path | None
+) -> dict[str, float]:
+    """Scrapes all requests with new browser of the backend, returns its measures."""
+    start = time.perf_counter()
+    driver = get_driver(browser=get_backend(browser, binary))
+    started = time.perf_counter() - start
+    failed = 0
+    memory: list[int] = []
+
+    try:
+        start = time.perf_counter()
+
+        for request in requests:
+            try:
+                driver.scrape(request)
+            except exc.ScrapingError:
+                failed += 1
+
+            memory.append(driver.memory_usage())
+
+        elapsed = time.perf_counter() - start
+    finally:
+        driver.quit()
+
+    return {
+        "startup": started,
+        "pages_per_second": len(requests) / elapsed,
+        "failed": failed,
+        "peak_memory_mb": max(memory, default=0) / const.MEGABYTE,
+        "mean_memory_mb": sum(memory) / len(memory) / const.MEGABYTE if memory else 0,
+    }
+
+
+def main(input_path: Path, browsers: list[str], binary: Path | None) -> None:
+    data = LSEDataReader().read(input_path)
+    requests = parse_requests(data[DataColumns.USE_COLUMNS])
+    print(f"{len(requests)} pages per browser")
+    print(
+        f"{'browser':<24}{'startup s':>10}{'pages/s':>10}{'failed':>8}"
+        f"{'peak MB':>10}{'mean MB':>10}"
+    )
+
+    for browser in browsers:
+        result = measure(browser, requests, binary)
+        print(
+            f"{browser:<24}{result['startup']:>10.2f}"
+            f"{result['pages_per_second']:>10.2f}{result['failed']:>8.0f}"
+            f"{result['peak_memory_mb']:>10.0f}{result['mean_memory_mb']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark browser backends")
+    parser.add_argument("--input", type=Path, required=True, help="Watchlist file")
+    parser.add_argument(
+        "--browsers",
+        nargs="+",
+        choices=const.BROWSERS,
+        default=const.BROWSERS,
+        help="Compared browsers, by default all",
+    )
+    parser.add_argument(
+        "--browser-binary",
+        type=Path,
+        help="Path to chrome-headless-shell executable, by default found on PATH",
+    )
+    args = parser.parse_args()
+
+    main(args.input, browsers=args.browsers, binary=args.browser_binary)
@@ -0,0 +1,87 @@
+"""
+Benchmark of response model construction from scraped data. Compares
+`migrate` from scraper model, direct validated construction and construction
+without validation (`model_construct`).
+
+Usage
+-----
+python -m benchmarks.models --rows 100000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from app.models.pydantic_models import (
+    FailedStockResponse,
+    RawStockResponse,
+    StockResponse,
+)
+from app.models.soupsavvy_models import StockScraperModel
+
+NAME = "Xylion Devices"
+CODE = "XD"
+
+
+def migrated(scraped: StockScraperModel) -> RawStockResponse:
+    return scraped.migrate(RawStockResponse, company_name=NAME, stock_code=CODE)
+
+
+def validated(scraped: StockScraperModel) -> RawStockResponse:
+    return RawStockResponse(
+        company_name=NAME,
+        stock_code=CODE,
+        timestamp=scraped.timestamp,
+        value=scraped.value,
+        currency=scraped.currency,
+    )
+
+
+def constructed(scraped: StockScraperModel) -> RawStockResponse:
+    return RawStockResponse.model_construct(
+        company_name=NAME,
+        stock_code=CODE,
+        timestamp=scraped.timestamp,
+        value=scraped.value,
+        currency=scraped.currency,
+    )
+
+
+def validated_failure(scraped: StockScraperModel) -> StockResponse:
+    return FailedStockResponse(company_name=NAME, stock_code=CODE)
+
+
+def constructed_failure(scraped: StockScraperModel) -> StockResponse:
+    return FailedStockResponse.model_construct(company_name=NAME, stock_code=CODE)
+
+
+def per_call(func: Callable[[StockScraperModel], object], rows: int) -> float:
+    """Returns average time of single call in microseconds."""
+    scraped = StockScraperModel(
+        value="160.35", currency="GBX", timestamp="14.09.25 13:03:33 BST"
+    )
+    start = time.perf_counter()
+
+    for _ in range(rows):
+        func(scraped)
+
+    return (time.perf_counter() - start) / rows * 1e6
+
+
+def main(rows: int) -> None:
+    for name, func in [
+        ("migrate", migrated),
+        ("validated", validated),
+        ("model_construct", constructed),
+        ("validated failure", validated_failure),
+        ("construct failure", constructed_failure),
+    ]:
+        print(f"{name:>18}: {per_call(func, rows):8.2f} us/response")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark response construction")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of rows")
+    args = parser.parse_args()
+
+    main(rows=args.rows)
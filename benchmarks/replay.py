@@ -0,0 +1,56 @@
+"""
+Benchmark of replaying recorded pages, parsing them with scraper model
+without browser. Compares parsing in the current process and in process pool.
+
+Usage
+-----
+python -m benchmarks.replay --pages 5000 --processes 4
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from app.data_managers.page_store import DirectoryPageStore
+from app.models.pydantic_models import StockRequest
+from app.scraping.replay import replay
+
+PAGE = Path("tests", "mock_data", "recorded", "XD.html")
+
+
+def pages_per_second(requests: list[StockRequest], root: str, processes: int) -> float:
+    store = DirectoryPageStore(root)
+    start = time.perf_counter()
+
+    for _ in replay(requests, store, processes=processes):
+        pass
+
+    return len(requests) / (time.perf_counter() - start)
+
+
+def main(pages: int, processes: int) -> None:
+    html = PAGE.read_text()
+    requests = [
+        StockRequest(stock_code=f"C{i}", company_name=f"Company {i}")
+        for i in range(pages)
+    ]
+
+    with tempfile.TemporaryDirectory() as root:
+        store = DirectoryPageStore(root)
+
+        for request in requests:
+            store.save(request.stock_code, html)
+
+        for n in sorted({1, processes}):
+            rate = pages_per_second(requests, root, n)
+            print(f"{n:>3} processes: {rate:10.0f} pages/s")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark replay of recorded pages")
+    parser.add_argument("--pages", type=int, default=5000, help="Number of pages")
+    parser.add_argument("--processes", type=int, default=4, help="Number of processes")
+    args = parser.parse_args()
+
+    main(pages=args.pages, processes=args.processes)
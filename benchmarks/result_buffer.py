@@ -0,0 +1,96 @@
+"""
+Benchmark comparing collection of scraping results into a list of pydantic models
+with collection into columnar `ResultBuffer`. Measures wall time and peak
+memory of building the output DataFrame.
+
+Usage
+-----
+python -m benchmarks.result_buffer --rows 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+import pandas as pd
+
+from app.data_managers.result_buffer import ResultBuffer
+from app.models.pydantic_models import FailedStockResponse, StockResponse
+
+N_STOCKS = 500
+
+
+def _responses(rows: int) -> list[StockResponse]:
+    """Creates synthetic responses, every tenth of them is failed."""
+    responses: list[StockResponse] = []
+
+    for i in range(rows):
+        code = f"C{i % N_STOCKS}"
+        name = f"Company {i % N_STOCKS}"
+
+        if i % 10 == 0:
+            responses.append(FailedStockResponse(company_name=name, stock_code=code))
+        else:
+            responses.append(
+                StockResponse(
+                    company_name=name,
+                    stock_code=code,
+                    timestamp=f"14.09.25 13:{i % 60:02d}:00 BST",
+                    value=float(i),
+                )
+            )
+    return responses
+
+
+def collect_models(responses: list[StockResponse]) -> pd.DataFrame:
+    collected: list[StockResponse] = []
+
+    for response in responses:
+        collected.append(response)
+
+    return pd.DataFrame([r.model_dump() for r in collected])
+
+
+def collect_buffer(responses: list[StockResponse]) -> pd.DataFrame:
+    buffer = ResultBuffer(capacity=len(responses))
+
+    for response in responses:
+        buffer.append_response(response)
+
+    return buffer.to_frame()
+
+
+def measure(func: Callable[[], object]) -> tuple[float, int]:
+    """
+    Returns wall time in seconds and peak traced memory in bytes of the call.
+    Both are measured in separate calls, as tracing distorts timings.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows: int) -> None:
+    responses = _responses(rows)
+
+    for name, func in [("models", collect_models), ("buffer", collect_buffer)]:
+        elapsed, peak = measure(lambda: func(responses))
+        print(f"{name:>8}: {elapsed:8.3f} s  peak {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark result collection")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows")
+    args = parser.parse_args()
+
+    main(rows=args.rows)
@@ -0,0 +1,261 @@
+"""
+Micro-benchmark suite of hot paths, which do not need browser: reading input,
+parsing requests and urls, scraping static HTML with scraper model,
+constructing responses, converting scraped prices and saving output.
+Each case runs over synthetic input of given number of rows and reports
+the best time per row of several repeats.
+
+Results are compared with baseline committed in `benchmarks/baseline.json`.
+Comparison fails, when any case is slower than baseline by more than tolerance.
+By default only small sizes are compared, so comparison is quick enough
+to gate changes, larger sizes of baseline can be selected with `--sizes`.
+Baseline depends on machine, so it should be updated with `--save` on the
+machine where comparison runs, whenever hot path gets intentionally slower.
+
+Usage
+-----
+python -m benchmarks.suite run --sizes 1000 10000 --save
+python -m benchmarks.suite compare --tolerance 0.3
+python -m benchmarks.suite compare --sizes 100000 1000000
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+from bs4 import BeautifulSoup
+from soupsavvy import to_soupsavvy
+
+from app.constants import DataColumns, REPLAY_HTML_PARSER
+from app.data_managers.output_saver import CSVSaver
+from app.data_managers.parsers import parse_requests, parse_responses, parse_url
+from app.data_managers.reader import LSEDataReader
+from app.models.pydantic_models import RawStockResponse, StockRequest, StockResponse
+from app.models.soupsavvy_models import StockScraperModel
+
+BASELINE = Path(__file__).with_name("baseline.json")
+PAGE = Path("tests", "mock_data", "recorded", "XD.html")
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+COMPARE_SIZES = [1_000, 10_000]
+TOLERANCE = 0.3
+RETRIES = 2
+
+# case prepares input of given size and returns function measured on it
+Case = Callable[[int, Path], Callable[[], object]]
+
+
+def _input(rows: int) -> pd.DataFrame:
+    """Creates synthetic input in format provided by client."""
+    return pd.DataFrame(
+        {
+            "Company Name": [f"Company {i}" for i in range(rows)],
+            "Stock Code": [f"C{i}" for i in range(rows)],
+            "Timestamp": "",
+            "Value": "",
+        }
+    )
+
+
+def _requests(rows: int) -> list[StockRequest]:
+    return [
+        StockRequest(stock_code=f"C{i}", company_name=f"Company {i}")
+        for i in range(rows)
+    ]
+
+
+def read_input(rows: int, tmp: Path) -> Callable[[], object]:
+    path = tmp / "input.csv"
+    _input(rows).to_csv(path, index=False)
+    reader = LSEDataReader()
+    return lambda: reader.read(path)
+
+
+def requests_from_frame(rows: int, tmp: Path) -> Callable[[], object]:
+    data = _input(rows)
+    data.columns = DataColumns.USE_COLUMNS + [DataColumns.TIMESTAMP, DataColumns.VALUE]
+    data = data[DataColumns.USE_COLUMNS]
+    return lambda: parse_requests(data)
+
+
+def urls(rows: int, tmp: Path) -> Callable[[], object]:
+    requests = _requests(rows)
+    return lambda: [parse_url(request) for request in requests]
+
+
+def scrape_static_html(rows: int, tmp: Path) -> Callable[[], object]:
+    element = to_soupsavvy(BeautifulSoup(PAGE.read_text(), REPLAY_HTML_PARSER))
+    return lambda: [StockScraperModel.find(element) for _ in range(rows)]
+
+
+def responses(rows: int, tmp: Path) -> Callable[[], object]:
+    requests = _requests(rows)
+    return lambda: [
+        StockResponse(
+            company_name=request.company_name,
+            stock_code=request.stock_code,
+            timestamp="14.09.25 13:03:33 BST",
+            value=160.35,
+        )
+        for request in requests
+    ]
+
+
+def prices(rows: int, tmp: Path) -> Callable[[], object]:
+    raws = [
+        RawStockResponse(
+            company_name=request.company_name,
+            stock_code=request.stock_code,
+            timestamp="14.09.25 13:03:33 BST",
+            value="1,383.20",
+            currency="GBX",
+        )
+        for request in _requests(rows)
+    ]
+    return lambda: parse_responses(raws)
+
+
+def save_output(rows: int, tmp: Path) -> Callable[[], object]:
+    data = pd.DataFrame(
+        {
+            DataColumns.COMPANY_NAME: [f"Company {i}" for i in range(rows)],
+            DataColumns.STOCK_CODE: [f"C{i}" for i in range(rows)],
+            DataColumns.TIMESTAMP: "14.09.25 13:03:33 BST",
+            DataColumns.VALUE: 160.35,
+        }
+    )
+    saver = CSVSaver()
+    return lambda: saver.save(data=data, path=tmp / "output.csv")
+
+
+# scraping single page does not depend on number of rows, so it is capped
+CASES: dict[str, tuple[Case, int]] = {
+    "LSEDataReader.read": (read_input, SIZES[-1]),
+    "parse_requests": (requests_from_frame, SIZES[-1]),
+    "parse_url": (urls, SIZES[-1]),
+    "StockScraperModel.find": (scrape_static_html, 10_000),
+    "StockResponse": (responses, SIZES[-1]),
+    "parse_responses": (prices, SIZES[-1]),
+    "CSVSaver.save": (save_output, SIZES[-1]),
+}
+
+
+def measure(case: Case, rows: int, repeat: int) -> float:
+    """
+    Returns the best time per row in microseconds of `repeat` runs.
+    Garbage collection is disabled while measuring, like in `timeit`.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        func = case(rows, Path(tmp))
+        best = float("inf")
+
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+
+            try:
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            finally:
+                gc.enable()
+
+    return best / rows * 1e6
+
+
+def run(names: list[str], sizes: list[int], repeat: int) -> dict[str, dict[str, float]]:
+    """Runs selected cases, returns time per row by case and size."""
+    results: dict[str, dict[str, float]] = {}
+
+    for name in names:
+        case, max_rows = CASES[name]
+        results[name] = {}
+
+        for rows in (size for size in sizes if size <= max_rows):
+            results[name][str(rows)] = measure(case, rows, repeat)
+            print(f"{name:>24} {rows:>9}: {results[name][str(rows)]:9.3f} us/row")
+
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[tuple[str, str]]:
+    """Returns case and size of results slower than baseline by more than tolerance."""
+    return [
+        (name, rows)
+        for name, times in results.items()
+        for rows, current in times.items()
+        if rows in baseline.get(name, {})
+        and current > baseline[name][rows] * (1 + tolerance)
+    ]
+
+
+def main(args: argparse.Namespace) -> int:
+    names = args.cases or list(CASES)
+
+    if args.command == "run":
+        results = run(names, args.sizes or SIZES, args.repeat)
+
+        if args.save:
+            machine = {"python": sys.version.split()[0], "machine": platform.machine()}
+            rounded = {
+                name: {rows: round(value, 4) for rows, value in times.items()}
+                for name, times in results.items()
+            }
+            document = {"machine": machine, "results": rounded}
+            args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+            print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["results"]
+    measured = {int(rows) for times in baseline.values() for rows in times}
+    sizes = sorted(measured.intersection(args.sizes or COMPARE_SIZES))
+    results = run([name for name in names if name in baseline], sizes, args.repeat)
+
+    # noisy measurements are repeated, so only persistent slowdown is reported
+    for _ in range(RETRIES):
+        for name, rows in compare(results, baseline, args.tolerance):
+            again = measure(CASES[name][0], int(rows), args.repeat)
+            results[name][rows] = min(results[name][rows], again)
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    for name, rows in regressions:
+        current, expected = results[name][rows], baseline[name][rows]
+        print(
+            f"REGRESSION {name} {rows} rows: {current:.3f} us/row, "
+            f"baseline {expected:.3f} us/row (+{current / expected - 1:.0%})"
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark non-browser hot paths")
+    parser.add_argument("command", choices=["run", "compare"])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), help="Cases")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        help="Rows, by default all sizes for run and 1000 and 10000 for compare",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repeats of each case")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Baseline")
+    parser.add_argument("--save", action="store_true", help="Save results as baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="Allowed slowdown relative to baseline, e.g. 0.3 for 30%%",
+    )
+    sys.exit(main(parser.parse_args()))
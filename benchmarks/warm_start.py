@@ -0,0 +1,52 @@
+"""
+Benchmark of first page load with cold and warm browser profile.
+Cold start uses empty profile, warm start reuses the same profile,
+so static assets of the page come from its disk cache.
+Requires Chrome and access to the website.
+
+Usage
+-----
+python -m benchmarks.warm_start --code XD --name "Xylion Devices" --runs 3
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from app.models.pydantic_models import StockRequest
+from app.scraping.profiles import ProfilePool
+from app.scraping.selenium_utils import get_driver
+
+
+def first_page(request: StockRequest, profile: Path) -> float:
+    """Returns time in seconds of scraping the first page by a new browser."""
+    driver = get_driver(profile_dir=profile)
+
+    try:
+        start = time.perf_counter()
+        driver.scrape(request)
+        return time.perf_counter() - start
+    finally:
+        driver.quit()
+
+
+def main(request: StockRequest, runs: int) -> None:
+    for run in range(runs):
+        with tempfile.TemporaryDirectory() as root:
+            pool = ProfilePool(root)
+            profile = pool.acquire()
+            cold = first_page(request, profile)
+            warm = first_page(request, profile)
+
+        print(f"run {run}: cold {cold:6.2f} s, warm {warm:6.2f} s")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark warm browser start")
+    parser.add_argument("--code", default="XD", help="Stock code")
+    parser.add_argument("--name", default="Xylion Devices", help="Company name")
+    parser.add_argument("--runs", type=int, default=3, help="Number of runs")
+    args = parser.parse_args()
+
+    main(StockRequest(stock_code=args.code, company_name=args.name), runs=args.runs)
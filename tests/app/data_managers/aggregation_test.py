@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.constants import DataColumns
+from app.data_managers.aggregation import (
+    OHLC_COLUMNS,
+    aggregate_ohlc,
+    parse_interval,
+    read_observations,
+)
+
+
+def observations(rows: list[tuple[str, str, float]]) -> pd.DataFrame:
+    """Builds observations from stock code, ISO timestamp and value of each row."""
+    codes, timestamps, values = zip(*rows)
+    return pd.DataFrame(
+        {
+            DataColumns.STOCK_CODE: list(codes),
+            DataColumns.TIMESTAMP: pd.to_datetime(list(timestamps), utc=True),
+            DataColumns.VALUE: list(values),
+        }
+    )
+
+
+class TestParseInterval:
+    """Test suite for the parse_interval function."""
+
+    def test_parses_interval(self):
+        """Test that interval is parsed as duration."""
+        assert parse_interval("15min") == pd.Timedelta(minutes=15)
+
+    @pytest.mark.parametrize("value", ["0min", "-1h", "often"])
+    def test_raises_error_for_invalid_interval(self, value: str):
+        """Test that interval must be positive duration."""
+        with pytest.raises(ValueError):
+            parse_interval(value)
+
+
+class TestReadObservations:
+    """Test suite for the read_observations function."""
+
+    def test_reads_outputs_of_runs(self, tmp_path: Path):
+        """
+        Test that outputs with timestamps in any format are combined,
+        dropping failed stocks.
+        """
+        first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+        first.write_text(
+            "Company Name,Stock Code,Timestamp,Value\n"
+            "Xylion Devices,XD,14.09.25 13:03:33 BST,160.35\n"
+            "Glencore plc,GLEN,,\n"
+        )
+        second.write_text(
+            "company_name,stock_code,timestamp,value\n"
+            "Xylion Devices,XD,2025-09-14T13:04:00+00:00,161.0\n"
+        )
+
+        result = read_observations([first, second])
+
+        assert result[DataColumns.STOCK_CODE].tolist() == ["XD", "XD"]
+        assert result[DataColumns.VALUE].tolist() == [160.35, 161.0]
+        assert result[DataColumns.TIMESTAMP].tolist() == [
+            pd.Timestamp("2025-09-14T12:03:33Z"),
+            pd.Timestamp("2025-09-14T13:04:00Z"),
+        ]
+
+
+class TestAggregateOHLC:
+    """Test suite for the aggregate_ohlc function."""
+
+    def test_aggregates_all_stocks_per_interval(self):
+        """
+        Test that each stock is aggregated per interval regardless of order
+        of observations, with change relative to close of previous interval.
+        """
+        data = observations(
+            [
+                ("BBB", "2025-09-14T12:10:00Z", 10.0),
+                ("AAA", "2025-09-14T12:40:00Z", 4.0),
+                ("AAA", "2025-09-14T12:00:00Z", 2.0),
+                ("AAA", "2025-09-14T12:20:00Z", 5.0),
+                ("AAA", "2025-09-14T12:20:00Z", 5.0),
+                ("AAA", "2025-09-14T14:30:00Z", 6.0),
+            ]
+        )
+
+        result = aggregate_ohlc(data, pd.Timedelta(hours=1))
+
+        assert result.columns.tolist() == OHLC_COLUMNS
+        assert result[DataColumns.STOCK_CODE].tolist() == ["AAA", "AAA", "BBB"]
+        assert result["interval"].tolist() == [
+            pd.Timestamp("2025-09-14T12:00:00Z"),
+            pd.Timestamp("2025-09-14T14:00:00Z"),
+            pd.Timestamp("2025-09-14T12:00:00Z"),
+        ]
+        assert result[["open", "high", "low", "close"]].values.tolist() == [
+            [2.0, 5.0, 2.0, 4.0],
+            [6.0, 6.0, 6.0, 6.0],
+            [10.0, 10.0, 10.0, 10.0],
+        ]
+        np.testing.assert_allclose(result["change_pct"], [np.nan, 50.0, np.nan])
+        assert result["observations"].tolist() == [3, 1, 1]
+        assert result["staleness"].tolist() == [1200.0, 1800.0, 3000.0]
+
+    def test_returns_empty_frame_without_observations(self):
+        """Test that no intervals are returned for empty observations."""
+        data = observations([("AAA", "2025-09-14T12:00:00Z", 1.0)]).iloc[:0]
+
+        result = aggregate_ohlc(data, pd.Timedelta(minutes=1))
+
+        assert result.empty
+        assert result.columns.tolist() == OHLC_COLUMNS
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.constants import DataColumns
+from app.data_managers.delta import changed_rows, previous_timestamps, read_previous
+
+TIMESTAMP = "14.09.25 13:03:33 BST"
+LATER = "14.09.25 14:03:33 BST"
+
+
+def output(rows: list[tuple[str, str | None, float]]) -> pd.DataFrame:
+    """Builds output frame from stock code, timestamp and value of each row."""
+    return pd.DataFrame(
+        [
+            {
+                DataColumns.COMPANY_NAME: f"Company {code}",
+                DataColumns.STOCK_CODE: code,
+                DataColumns.TIMESTAMP: timestamp,
+                DataColumns.VALUE: value,
+            }
+            for code, timestamp, value in rows
+        ]
+    )
+
+
+class TestChangedRows:
+    """Test suite for the changed_rows function."""
+
+    def test_selects_changed_and_new_rows(self):
+        """Test that only rows with changed value, timestamp or new stock are kept."""
+        previous = output(
+            [
+                ("AAA", TIMESTAMP, 1.0),
+                ("BBB", TIMESTAMP, 2.0),
+                ("CCC", TIMESTAMP, 3.0),
+                ("DDD", None, np.nan),
+            ]
+        )
+        current = output(
+            [
+                ("AAA", TIMESTAMP, 1.0),  # unchanged
+                ("BBB", TIMESTAMP, 2.5),  # value changed
+                ("CCC", LATER, 3.0),  # timestamp changed
+                ("DDD", None, np.nan),  # still failing
+                ("EEE", TIMESTAMP, 5.0),  # new stock
+                ("FFF", None, np.nan),  # new failing stock
+            ]
+        )
+
+        result = changed_rows(current, previous)
+
+        assert result[DataColumns.STOCK_CODE].tolist() == ["BBB", "CCC", "EEE", "FFF"]
+
+    def test_compares_timestamps_as_points_in_time(self):
+        """Test that the same time in different format is not a change."""
+        previous = output([("AAA", "2025-09-14 13:03:33+01:00", 1.0)])
+        current = output([("AAA", TIMESTAMP, 1.0)])
+
+        assert changed_rows(current, previous).empty
+
+    def test_compares_with_last_row_of_stock(self):
+        """Test that the last row of stock repeated in previous output is used."""
+        previous = output([("AAA", TIMESTAMP, 2.0), ("AAA", TIMESTAMP, 1.0)])
+        current = output([("AAA", TIMESTAMP, 1.0)])
+
+        assert changed_rows(current, previous).empty
+
+    def test_keeps_all_rows_without_previous_data(self):
+        """Test that all rows are changed if previous output is empty."""
+        current = output([("AAA", TIMESTAMP, 1.0), ("BBB", None, np.nan)])
+
+        result = changed_rows(current, output([]).reindex(columns=current.columns))
+
+        assert len(result) == 2
+
+
+class TestPreviousTimestamps:
+    """Test suite for the previous_timestamps function."""
+
+    def test_aligns_last_timestamps_with_stock_codes(self):
+        """Test that the last timestamp of each stock is returned, NaT if unknown."""
+        previous = output(
+            [("AAA", TIMESTAMP, 1.0), ("BBB", None, np.nan), ("AAA", LATER, 2.0)]
+        )
+
+        result = previous_timestamps(["CCC", "AAA", "BBB"], previous)
+
+        assert result.isna().tolist() == [True, False, True]
+        assert result[1] == pd.Timestamp("2025-09-14 14:03:33+01:00")
+
+
+class TestReadPrevious:
+    """Test suite for the read_previous function."""
+
+    def test_reads_compared_columns(self, tmp_path: Path):
+        """Test that stock code, timestamp and value are read with normalized names."""
+        path = tmp_path / "previous.csv"
+        output([("AAA", TIMESTAMP, 1.0)]).rename(
+            columns={DataColumns.STOCK_CODE: "Stock Code"}
+        ).to_csv(path, index=False)
+
+        result = read_previous(path)
+
+        assert result.columns.tolist() == [
+            DataColumns.STOCK_CODE,
+            DataColumns.TIMESTAMP,
+            DataColumns.VALUE,
+        ]
+        assert result.iloc[0].tolist() == ["AAA", TIMESTAMP, 1.0]
@@ -59,3 +59,16 @@ class TestCSVSaver:
 
         actual = pd.read_csv(full_path)
         pd.testing.assert_frame_equal(actual, data)
+
+    def test_save_appends_rows_without_header(
+        self, tmp_path: Path, mock_data: pd.DataFrame
+    ):
+        saver = CSVSaver()
+        path = tmp_path / "test_output.csv"
+
+        saver.save(data=mock_data, path=path)
+        saver.save(data=mock_data, path=path, append=True)
+
+        actual = pd.read_csv(path)
+        expected = pd.concat([mock_data, mock_data], ignore_index=True)
+        pd.testing.assert_frame_equal(actual, expected)
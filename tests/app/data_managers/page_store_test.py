@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from app.data_managers.page_store import DirectoryPageStore
+
+HTML = '<div id="ticker"><span class="price-tag">160.35</span></div>'
+
+
+class TestDirectoryPageStore:
+    """Test suite for the DirectoryPageStore class."""
+
+    def test_saves_and_loads_page(self, tmp_path: Path):
+        """Test that saved page is loaded by stock code and replaced by next save."""
+        store = DirectoryPageStore(tmp_path / "pages")
+        store.save("XD", "old")
+        store.save("XD", HTML)
+
+        assert store.load("XD") == HTML
+        assert [p.name for p in (tmp_path / "pages").iterdir()] == ["XD.html"]
+
+    def test_returns_none_for_missing_page(self, tmp_path: Path):
+        """Test that None is returned if page of the stock was not saved."""
+        assert DirectoryPageStore(tmp_path).load("XD") is None
+
+    def test_escapes_stock_code_in_file_name(self, tmp_path: Path):
+        """Test that stock code cannot point outside of the store directory."""
+        store = DirectoryPageStore(tmp_path / "pages")
+        store.save("../XD", HTML)
+
+        assert store.load("../XD") == HTML
+        assert not (tmp_path / "XD.html").exists()
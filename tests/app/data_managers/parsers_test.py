@@ -3,8 +3,21 @@ import pytest
 
 import app.exceptions as exc
 from app.constants import DataColumns, LSEWebsite
-from app.data_managers.parsers import parse_requests, parse_url
-from app.models.pydantic_models import StockRequest
+from app.data_managers.parsers import (
+    parse_listing_url,
+    parse_prices,
+    parse_priorities,
+    parse_requests,
+    parse_responses,
+    parse_timestamps,
+    parse_url,
+)
+from app.models.pydantic_models import (
+    FailedStockResponse,
+    RawStockResponse,
+    StockRequest,
+    StockResponse,
+)
 
 
 @pytest.fixture
@@ -86,3 +99,141 @@ class TestParseUrl:
             f"{LSEWebsite.BASE_URL}/{LSEWebsite.STOCK_ENDPOINT}/ABC/alpha-beta-corp"
         )
         assert url == expected_url
+
+
+class TestParseListingUrl:
+    """Test suite for the parse_listing_url function."""
+
+    def test_constructs_url_of_listing_page(self) -> None:
+        """Test that page number is passed as query parameter of price explorer."""
+
+        url = parse_listing_url(3)
+
+        assert url == f"{LSEWebsite.PRICE_EXPLORER_URL}?page=3"
+
+
+class TestParseTimestamps:
+    """Test suite for the parse_timestamps function."""
+
+    @pytest.mark.parametrize(
+        "timestamp, expected",
+        [
+            ("14.09.25 13:03:33 BST", "2025-09-14 13:03:33+01:00"),
+            ("14.01.25 10:00:00 GMT", "2025-01-14 10:00:00+00:00"),
+            # the same local time occurs twice when summer time ends
+            ("26.10.25 01:30:00 BST", "2025-10-26 01:30:00+01:00"),
+            ("26.10.25 01:30:00 GMT", "2025-10-26 01:30:00+00:00"),
+            ("2025-09-14T12:03:33Z", "2025-09-14 13:03:33+01:00"),
+        ],
+    )
+    def test_parses_timestamps_in_lse_timezone(self, timestamp: str, expected: str):
+        """Test that LSE and ISO 8601 timestamps are parsed into aware datetimes."""
+        result = parse_timestamps(pd.Series([timestamp]))
+
+        assert result.dt.tz is not None
+        assert result[0] == pd.Timestamp(expected)
+
+    def test_keeps_index_and_missing_values(self):
+        """
+        Test that result is aligned with input and missing or unparseable
+        timestamps are converted to NaT.
+        """
+        timestamps = pd.Series(
+            ["14.09.25 13:03:33 BST", None, "invalid", "14.09.25 13:03:33 BST"],
+            index=[3, 5, 7, 9],
+            name=DataColumns.TIMESTAMP,
+            dtype="category",
+        )
+
+        result = parse_timestamps(timestamps)
+
+        assert result.index.tolist() == [3, 5, 7, 9]
+        assert result.name == DataColumns.TIMESTAMP
+        assert result.isna().tolist() == [False, True, True, False]
+        assert result[3] == result[9]
+
+
+class TestParsePriorities:
+    """Test suite for the parse_priorities function."""
+
+    def test_parses_priorities_with_missing_as_zero(self, data: pd.DataFrame):
+        """Test that priorities are parsed as numbers, missing ones are 0."""
+        data[DataColumns.PRIORITY] = ["2", None]
+
+        assert parse_priorities(data).tolist() == [2.0, 0.0]
+
+    def test_defaults_to_zero_without_column(self, data: pd.DataFrame):
+        """Test that all priorities are 0 if input has no priority column."""
+        assert parse_priorities(data).tolist() == [0.0, 0.0]
+
+    def test_raises_error_for_invalid_priority(self, data: pd.DataFrame):
+        """Test that DataValidationError is raised for non-numeric priority."""
+        data[DataColumns.PRIORITY] = [1, "high"]
+
+        with pytest.raises(exc.DataValidationError):
+            parse_priorities(data)
+
+
+class TestParsePrices:
+    """Test suite for the parse_prices function."""
+
+    def test_converts_prices_to_pounds(self):
+        """
+        Test that prices with thousands separators are parsed, prices in pence
+        are divided by 100 and prices in pounds or without currency are kept.
+        """
+        prices = pd.Series([" 1,383.20 ", "160.35", "12.5", "7"], index=[2, 4, 6, 8])
+        currencies = pd.Series(["GBX", "GBp", "GBP", None], index=[2, 4, 6, 8])
+
+        result = parse_prices(prices, currencies)
+
+        assert result.index.tolist() == [2, 4, 6, 8]
+        assert result.tolist() == pytest.approx([13.832, 1.6035, 12.5, 7.0])
+
+    def test_converts_unparseable_prices_to_nan(self):
+        """Test that missing, non-numeric and infinite prices are NaN."""
+        prices = pd.Series(["n/a", None, "", "inf", "1.5"])
+        currencies = pd.Series(["GBX"] * 5)
+
+        result = parse_prices(prices, currencies)
+
+        assert result.isna().tolist() == [True, True, True, True, False]
+
+
+class TestParseResponses:
+    """Test suite for the parse_responses function."""
+
+    def test_converts_responses_and_reports_failures(self):
+        """
+        Test that responses are converted in order and responses with prices
+        that cannot be parsed are failed and reported together.
+        """
+        timestamp = "14.09.25 13:03:33 BST"
+        raws = [
+            RawStockResponse(
+                company_name=f"Company {code}",
+                stock_code=code,
+                timestamp=timestamp,
+                value=value,
+                currency="GBX",
+            )
+            for code, value in [("XD", "160.35"), ("FBT", "-"), ("ABC", "n/a")]
+        ]
+
+        responses, failures = parse_responses(raws)
+
+        assert responses == [
+            StockResponse(
+                company_name="Company XD",
+                stock_code="XD",
+                timestamp=timestamp,
+                value=1.6035,
+            ),
+            FailedStockResponse(company_name="Company FBT", stock_code="FBT"),
+            FailedStockResponse(company_name="Company ABC", stock_code="ABC"),
+        ]
+        assert failures == {"FBT": "-", "ABC": "n/a"}
+
+    def test_returns_nothing_for_no_responses(self):
+        """Test that empty sequence of responses is converted."""
+        assert parse_responses([]) == ([], {})
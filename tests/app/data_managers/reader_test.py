@@ -1,10 +1,12 @@
+import json
 import os
 from pathlib import Path
 
 import pandas as pd
 import pytest
-from pytest import FixtureRequest
+from pytest import FixtureRequest, MonkeyPatch
 
+import app.exceptions as exc
 from app.constants import DataColumns
 from app.data_managers.reader import LSEDataReader
 
@@ -195,6 +197,20 @@ class TestLSEDataReader:
         assert df.iloc[1][DataColumns.STOCK_CODE] == "FBT"
         assert df.iloc[1][DataColumns.COMPANY_NAME] == "Flobotics"
 
+    def test_keeps_optional_priority_column(self, tmp_path: Path) -> None:
+        """Test that optional priority column is read with normalized name."""
+        path = tmp_path / "input.csv"
+        path.write_text("Stock Code,Company Name,Priority\nABC,Alpha Beta Corp,2\n")
+
+        df = LSEDataReader().read(path)
+
+        assert list(df.columns) == [
+            DataColumns.COMPANY_NAME,
+            DataColumns.STOCK_CODE,
+            DataColumns.PRIORITY,
+        ]
+        assert df.iloc[0][DataColumns.PRIORITY] == 2
+
     def test_raises_error_for_nonexistent_file(self) -> None:
         """Test that FileNotFoundError is raised for a nonexistent file."""
 
@@ -213,3 +229,131 @@ class TestLSEDataReader:
 
         with pytest.raises(KeyError):
             reader.read(invalid_csv_file)
+
+
+WIDE_INPUT = pd.DataFrame(
+    {
+        "Company Name": ["Alpha Beta Corp", "Numeric Holdings"],
+        "Stock Code": ["ABC", "0123"],
+        "Priority": [2, 1],
+        "Timestamp": [None, None],
+        EXTRA_COLUMN_NAME: [[1, 2], [3]],
+    }
+)
+
+
+def write_input(data: pd.DataFrame, path: Path) -> Path:
+    """Writes input data in format given by extension of the path."""
+    if path.suffix == ".parquet":
+        data.to_parquet(path, index=False)
+    elif path.suffix == ".jsonl":
+        data.to_json(path, orient="records", lines=True)
+    elif path.suffix == ".xlsx":
+        data.astype({EXTRA_COLUMN_NAME: str}).to_excel(path, index=False)
+    else:
+        data.astype({EXTRA_COLUMN_NAME: str}).to_csv(path, index=False)
+    return path
+
+
+class TestMultiFormatReaders:
+    """Test suite for reading input in formats picked by extension."""
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet", ".jsonl", ".xlsx"])
+    def test_reads_relevant_columns_of_any_format(self, tmp_path: Path, suffix: str):
+        """
+        Test that all formats are normalized the same way and stock codes
+        are read as text, without leading zeros stripped.
+        """
+        path = write_input(WIDE_INPUT, tmp_path / f"input{suffix}")
+
+        df = LSEDataReader().read(path)
+
+        assert df.to_dict("list") == {
+            DataColumns.COMPANY_NAME: ["Alpha Beta Corp", "Numeric Holdings"],
+            DataColumns.STOCK_CODE: ["ABC", "0123"],
+            DataColumns.PRIORITY: [2, 1],
+        }
+
+    @pytest.mark.parametrize(
+        "priorities, expected",
+        [([None, 3], [None, 3.0]), ([1, 2.5], [1.0, 2.5])],
+    )
+    def test_reads_json_lines_regardless_of_first_record(
+        self, tmp_path: Path, priorities: list, expected: list
+    ):
+        """
+        Test that types of JSON Lines columns do not depend on the first record,
+        e.g. missing or integer priority followed by number with fraction.
+        """
+        path = tmp_path / "input.jsonl"
+        path.write_text(
+            "".join(
+                json.dumps(
+                    {"Company Name": "Alpha", "Stock Code": "ABC", "Priority": p}
+                )
+                + "\n"
+                for p in priorities
+            )
+        )
+
+        df = LSEDataReader().read(path)
+
+        pd.testing.assert_series_equal(
+            df[DataColumns.PRIORITY],
+            pd.Series(expected, dtype=float, name=DataColumns.PRIORITY),
+        )
+
+    def test_raises_on_invalid_json_lines(self, tmp_path: Path):
+        """Test that values of wrong type are reported as invalid input."""
+        path = tmp_path / "input.jsonl"
+        path.write_text(
+            '{"Company Name": "Alpha", "Stock Code": "ABC", "Priority": "high"}\n'
+        )
+
+        with pytest.raises(exc.DataValidationError):
+            LSEDataReader().read(path)
+
+    def test_pushes_column_selection_down_to_parser(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ):
+        """Test that irrelevant columns are not requested from the parser."""
+        path = write_input(WIDE_INPUT, tmp_path / "input.csv")
+        calls: list[dict] = []
+        read_csv = pd.read_csv
+
+        def spy(*args, **kwargs):
+            calls.append(kwargs)
+            return read_csv(*args, **kwargs)
+
+        monkeypatch.setattr(pd, "read_csv", spy)
+        LSEDataReader().read(path)
+
+        assert calls[-1]["usecols"] == ["Company Name", "Stock Code", "Priority"]
+        assert calls[-1]["dtype"] == {"Company Name": str, "Stock Code": str}
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet", ".jsonl"])
+    def test_reads_chunks_of_rows(self, tmp_path: Path, suffix: str):
+        """Test that chunks have at most given number of rows and cover all data."""
+        data = pd.concat([WIDE_INPUT] * 3, ignore_index=True)
+        path = write_input(data, tmp_path / f"input{suffix}")
+
+        chunks = list(LSEDataReader().read_chunks(path, size=4))
+
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), LSEDataReader().read(path)
+        )
+
+    def test_reads_whole_file_as_single_chunk_without_size(self, tmp_path: Path):
+        """Test that file is read as single chunk, if size is not given."""
+        path = write_input(WIDE_INPUT, tmp_path / "input.csv")
+
+        chunks = list(LSEDataReader().read_chunks(path))
+
+        assert len(chunks) == 1
+        pd.testing.assert_frame_equal(chunks[0], LSEDataReader().read(path))
+
+    def test_raises_error_for_unsupported_format(self, tmp_path: Path):
+        """Test that input with unknown extension is rejected."""
+        with pytest.raises(exc.DataValidationError):
+            LSEDataReader().read(tmp_path / "input.txt")
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.constants import DataColumns
+from app.data_managers.result_buffer import MISSING_CODE, ResultBuffer, StringPool
+from app.models.pydantic_models import FailedStockResponse, StockResponse
+
+SUCCESS = StockResponse(
+    company_name="Xylion Devices",
+    stock_code="XD",
+    timestamp="14.09.25 13:03:33 BST",
+    value=160.35,
+)
+FAILED = FailedStockResponse(company_name="Flobotics", stock_code="FBT")
+
+
+class TestStringPool:
+    """Test suite for the StringPool class."""
+
+    def test_interns_repeated_values_under_same_code(self) -> None:
+        """Test that the same string always gets the same code."""
+
+        pool = StringPool()
+
+        assert pool.code("a") == 0
+        assert pool.code("b") == 1
+        assert pool.code("a") == 0
+        assert pool.categories == ["a", "b"]
+        assert len(pool) == 2
+
+    def test_maps_none_to_missing_code(self) -> None:
+        """Test that None is not added to the pool and gets missing code."""
+
+        pool = StringPool()
+
+        assert pool.code(None) == MISSING_CODE
+        assert len(pool) == 0
+
+
+class TestResultBuffer:
+    """Test suite for the ResultBuffer class."""
+
+    def test_builds_frame_equal_to_model_dump(self) -> None:
+        """
+        Test that output DataFrame is saved the same way as DataFrame
+        built from dumped pydantic models, which was used before.
+        """
+
+        buffer = ResultBuffer()
+        buffer.append_response(SUCCESS)
+        buffer.append_response(FAILED)
+        buffer.append_response(SUCCESS)
+
+        result = buffer.to_frame()
+        expected = pd.DataFrame([r.model_dump() for r in [SUCCESS, FAILED, SUCCESS]])
+
+        assert list(result.columns) == ResultBuffer.COLUMNS
+        assert len(buffer) == 3
+        assert result.to_csv(index=False) == expected.to_csv(index=False)
+
+    def test_stores_strings_as_categoricals(self) -> None:
+        """Test that string columns are categoricals and value is float64."""
+
+        buffer = ResultBuffer()
+        buffer.append_response(SUCCESS)
+
+        result = buffer.to_frame()
+
+        for column in ResultBuffer.STRING_COLUMNS:
+            assert isinstance(result[column].dtype, pd.CategoricalDtype)
+
+        assert result[DataColumns.VALUE].dtype == np.float64
+
+    def test_grows_beyond_initial_capacity(self) -> None:
+        """Test that buffer reallocates arrays when capacity is exceeded."""
+
+        buffer = ResultBuffer(capacity=1)
+
+        for i in range(10):
+            buffer.append(company_name=f"name-{i}", stock_code=f"C{i}", value=i)
+
+        result = buffer.to_frame()
+
+        assert buffer.capacity >= 10
+        assert result[DataColumns.VALUE].tolist() == list(range(10))
+        assert result[DataColumns.STOCK_CODE].tolist() == [f"C{i}" for i in range(10)]
+
+    def test_appending_after_export_does_not_modify_frame(self) -> None:
+        """
+        Test that exported DataFrame shares memory with buffer, but appending
+        afterwards does not change already exported data.
+        """
+
+        buffer = ResultBuffer(capacity=4)
+        buffer.append_response(SUCCESS)
+
+        first = buffer.to_frame()
+        buffer.append_response(FAILED)
+        second = buffer.to_frame()
+
+        assert len(first) == 1
+        assert len(second) == 2
+        assert first[DataColumns.VALUE].tolist() == [160.35]
+
+    def test_empty_buffer_produces_empty_frame(self) -> None:
+        """Test that empty buffer produces empty frame with all columns."""
+
+        result = ResultBuffer(capacity=0).to_frame()
+
+        assert result.empty
+        assert list(result.columns) == ResultBuffer.COLUMNS
@@ -0,0 +1,154 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import app.exceptions as exc
+from app.constants import DataColumns
+from app.data_managers.sharding import (
+    merge_shards,
+    parse_shard,
+    shard_mask,
+    shard_of,
+)
+from app.models.pydantic_models import StockRequest
+
+REQUESTS = [
+    StockRequest(stock_code=f"C{i}", company_name=f"Company {i}") for i in range(20)
+]
+
+
+def write_shards(tmp_path: Path, shards: int) -> tuple[Path, list[Path]]:
+    """Writes input file and outputs of all shards, with value of each row."""
+    input_path = tmp_path / "input.csv"
+    pd.DataFrame([r.model_dump() for r in REQUESTS]).to_csv(input_path, index=False)
+    paths = []
+
+    for index in range(shards):
+        path = tmp_path / f"shard_{index}.csv"
+        rows = [
+            r.model_dump() | {DataColumns.VALUE: float(r.stock_code[1:])}
+            for r in REQUESTS
+            if shard_of(r.stock_code, shards) == index
+        ]
+        pd.DataFrame(
+            rows,
+            columns=[
+                DataColumns.COMPANY_NAME,
+                DataColumns.STOCK_CODE,
+                DataColumns.VALUE,
+            ],
+        ).to_csv(path, index=False)
+        paths.append(path)
+
+    return input_path, paths
+
+
+class TestShardOf:
+    """Test suite for the shard_of function."""
+
+    def test_is_stable(self):
+        """Test that shard of a stock does not depend on the process."""
+        assert shard_of("XD", 4) == 2
+        assert shard_of("ABC", 4) == 0
+
+    def test_shard_mask_flags_requests_of_shard(self):
+        """Test that masks of all shards are disjoint and cover all requests."""
+        masks = [shard_mask(REQUESTS, i, 3) for i in range(3)]
+
+        assert all(len(mask) == len(REQUESTS) for mask in masks)
+        assert all(any(mask) for mask in masks)
+        assert [sum(flags) for flags in zip(*masks)] == [1] * len(REQUESTS)
+        assert masks[1] == [shard_of(r.stock_code, 3) == 1 for r in REQUESTS]
+
+
+class TestParseShard:
+    """Test suite for the parse_shard function."""
+
+    def test_parses_specification(self):
+        """Test that index and total number of shards are parsed."""
+        assert parse_shard("1/4") == (1, 4)
+
+    @pytest.mark.parametrize("value", ["4/4", "-1/4", "1", "a/b", "0/0"])
+    def test_raises_on_invalid_specification(self, value: str):
+        """Test that malformed or out of range specification is rejected."""
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+class TestMergeShards:
+    """Test suite for the merge_shards function."""
+
+    def test_merges_in_input_order(self, tmp_path: Path):
+        """Test that merged output contains rows of all shards in input order."""
+        input_path, paths = write_shards(tmp_path, shards=3)
+        output_path = tmp_path / "merged" / "output.csv"
+
+        rows = merge_shards(input_path, paths, output_path)
+
+        result = pd.read_csv(output_path)
+        assert rows == len(REQUESTS)
+        assert result[DataColumns.STOCK_CODE].tolist() == [
+            r.stock_code for r in REQUESTS
+        ]
+        assert result[DataColumns.VALUE].tolist() == [float(i) for i in range(20)]
+
+    @pytest.mark.parametrize("suffix", [".parquet", ".jsonl"])
+    def test_merges_input_of_other_formats(self, tmp_path: Path, suffix: str):
+        """Test that input of any supported format is read by the input reader."""
+        csv_path, paths = write_shards(tmp_path, shards=3)
+        input_path = csv_path.with_suffix(suffix)
+        data = pd.read_csv(csv_path, dtype=str)
+
+        if suffix == ".parquet":
+            data.to_parquet(input_path)
+        else:
+            data.to_json(input_path, orient="records", lines=True)
+
+        rows = merge_shards(input_path, paths, tmp_path / "output.csv")
+
+        result = pd.read_csv(tmp_path / "output.csv")
+        assert rows == len(REQUESTS)
+        assert result[DataColumns.STOCK_CODE].tolist() == [
+            r.stock_code for r in REQUESTS
+        ]
+
+    def test_raises_on_unsupported_input_format(self, tmp_path: Path):
+        """Test that input of unknown format is rejected with clear error."""
+        input_path, paths = write_shards(tmp_path, shards=1)
+
+        with pytest.raises(exc.DataValidationError, match="Unsupported input"):
+            merge_shards(
+                input_path.rename(tmp_path / "input.txt"), paths, tmp_path / "o.csv"
+            )
+
+    def test_raises_on_missing_rows(self, tmp_path: Path):
+        """Test that error is raised if shard output lacks rows of the input."""
+        input_path, paths = write_shards(tmp_path, shards=3)
+        pd.read_csv(paths[1]).iloc[:-1].to_csv(paths[1], index=False)
+
+        with pytest.raises(exc.DataValidationError):
+            merge_shards(input_path, paths, tmp_path / "output.csv")
+
+    def test_raises_on_shards_in_wrong_order(self, tmp_path: Path):
+        """Test that error is raised if shard outputs are not ordered by index."""
+        input_path, paths = write_shards(tmp_path, shards=3)
+
+        with pytest.raises(exc.DataValidationError):
+            merge_shards(input_path, paths[::-1], tmp_path / "output.csv")
+
+    def test_raises_on_extra_rows(self, tmp_path: Path):
+        """Test that error is raised if shard output has rows not in the input."""
+        input_path, paths = write_shards(tmp_path, shards=1)
+        pd.read_csv(input_path).iloc[:-1].to_csv(input_path, index=False)
+
+        with pytest.raises(exc.DataValidationError):
+            merge_shards(input_path, paths, tmp_path / "output.csv")
+
+    def test_raises_on_missing_column(self, tmp_path: Path):
+        """Test that error is raised if input has no stock code column."""
+        input_path, paths = write_shards(tmp_path, shards=1)
+        pd.DataFrame({"name": ["a"]}).to_csv(input_path, index=False)
+
+        with pytest.raises(exc.DataValidationError):
+            merge_shards(input_path, paths, tmp_path / "output.csv")
@@ -0,0 +1,149 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.data_managers.snapshot_store import SnapshotStore, split_chunks
+
+RECORDED = Path(__file__).parents[2] / "mock_data" / "recorded"
+
+
+class FakeClock:
+    """Fake wall clock for testing, advanced manually."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def count(path: Path, table: str) -> int:
+    """Returns number of rows in table of the store database."""
+    with sqlite3.connect(path) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def html() -> str:
+    """Fixture providing recorded page of the stock."""
+    return (RECORDED / "XD.html").read_text(encoding="utf-8")
+
+
+class TestSplitChunks:
+    """Test suite for the split_chunks function."""
+
+    def test_chunks_join_into_page(self, html: str):
+        """Test that page is split without losing any content."""
+        assert "".join(split_chunks(html)) == html
+        assert split_chunks("") == []
+
+    def test_split_does_not_depend_on_preceding_content(self):
+        """Test that the same lines are split the same way after other content."""
+        lines = "".join(f"<li>{i}</li>\n" for i in range(200))
+        chunks = split_chunks(lines)
+        shifted = split_chunks("<ul>\n" + lines)
+
+        assert len(chunks) > 1
+        assert chunks[1:] == shifted[-len(chunks) + 1 :]
+
+    def test_limits_size_of_chunk(self):
+        """Test that long page without line breaks is still split."""
+        assert len(split_chunks("x\n" * 10_000)) > 1
+
+
+class TestSnapshotStore:
+    """Test suite for the SnapshotStore class."""
+
+    def test_loads_latest_snapshot_not_newer_than_run(self, tmp_path: Path):
+        """Test that snapshots of each run are kept and loaded by run."""
+        path = tmp_path / "snapshots.db"
+        SnapshotStore(path, run="1").save("XD", "first")
+        SnapshotStore(path, run="2").save("XD", "second")
+        SnapshotStore(path, run="2").save("XD", "replaced")
+
+        assert SnapshotStore(path, run="1").load("XD") == "first"
+        assert SnapshotStore(path, run="3").load("XD") == "replaced"
+        assert SnapshotStore(path, run="0").load("XD") is None
+        assert SnapshotStore(path).load("MISSING") is None
+        assert SnapshotStore(path).runs() == ["1", "2"]
+
+    def test_default_run_is_current_time(self, tmp_path: Path):
+        """Test that run identifier is built from clock, so runs are ordered."""
+        store = SnapshotStore(tmp_path / "snapshots.db", clock=FakeClock(0.0))
+        assert store.run == "19700101T000000Z"
+
+    def test_deduplicates_pages_and_chunks(self, tmp_path: Path):
+        """Test that identical pages and shared chunks are stored once."""
+        path = tmp_path / "snapshots.db"
+        html = "".join(f"<li>{i}</li>\n" for i in range(200))
+        changed = html.replace("<li>100</li>", "<li>new</li>")
+
+        for run in ["1", "2"]:
+            store = SnapshotStore(path, run=run)
+            store.save("XD", html)
+            store.save("COPY", html)
+
+        SnapshotStore(path, run="3").save("XD", changed)
+        chunks = len(set(split_chunks(html)) | set(split_chunks(changed)))
+
+        assert count(path, "snapshots") == 5
+        assert count(path, "pages") == 2
+        assert count(path, "chunks") == chunks
+        assert chunks < len(split_chunks(html)) + 2
+        assert SnapshotStore(path, run="3").load("XD") == changed
+        assert SnapshotStore(path, run="3").load("COPY") == html
+
+    def test_compresses_pages(self, tmp_path: Path, html: str):
+        """Test that stored chunks are smaller than the page."""
+        path = tmp_path / "snapshots.db"
+        SnapshotStore(path).save("XD", html)
+
+        with sqlite3.connect(path) as connection:
+            (size,) = connection.execute("SELECT SUM(LENGTH(data)) FROM chunks")
+            stored = size[0]
+
+        assert stored < len(html.encode())
+
+    def test_prunes_runs_outside_of_retention(self, tmp_path: Path, html: str):
+        """Test that only the latest runs are kept with unused data removed."""
+        path = tmp_path / "snapshots.db"
+        SnapshotStore(path, run="1").save("XD", "old")
+        SnapshotStore(path, run="2").save("XD", html)
+        SnapshotStore(path, run="3").save("XD", html)
+        store = SnapshotStore(path, run="3")
+
+        assert store.prune(keep_runs=2) == 1
+        assert store.prune(keep_runs=2) == 0
+        assert store.runs() == ["2", "3"]
+        assert count(path, "pages") == 1
+        assert count(path, "chunks") == len(set(split_chunks(html)))
+        assert store.load("XD") == html
+
+    def test_prunes_snapshots_older_than_max_age(self, tmp_path: Path):
+        """Test that snapshots are removed by age of their creation."""
+        clock = FakeClock()
+        path = tmp_path / "snapshots.db"
+        SnapshotStore(path, run="1", clock=clock).save("XD", "old")
+        clock.now += 100
+        store = SnapshotStore(path, run="2", clock=clock)
+        store.save("XD", "new")
+
+        assert store.prune(max_age=50) == 1
+        assert store.prune() == 0
+        assert store.runs() == ["2"]
+        assert count(path, "chunks") == 1
+
+    def test_rolls_back_failed_save(self, tmp_path: Path):
+        """Test that page is not stored partially if saving fails."""
+        path = tmp_path / "snapshots.db"
+        store = SnapshotStore(path)
+
+        with pytest.raises(AttributeError):
+            store.save("XD", None)  # type: ignore[arg-type]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.save(None, "html")  # type: ignore[arg-type]
+
+        assert count(path, "pages") == 0
+        assert count(path, "chunks") == 0
@@ -0,0 +1,43 @@
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from app.data_managers.sqlite import connect, transaction
+
+
+class TestSqlite:
+    """Test suite for the SQLite helpers."""
+
+    def test_connects_with_write_ahead_log(self, tmp_path: Path):
+        """Test that file is opened in WAL mode, so readers don't block writer."""
+        with closing(connect(tmp_path / "test.db")) as connection:
+            (mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+
+        assert mode == "wal"
+
+    def test_commits_transaction_on_success(self, tmp_path: Path):
+        """Test that changes made in transaction are visible after it."""
+        path = tmp_path / "test.db"
+
+        with transaction(path) as connection:
+            connection.execute("CREATE TABLE items (value INTEGER)")
+            connection.execute("INSERT INTO items VALUES (1)")
+
+        with closing(connect(path)) as connection:
+            assert connection.execute("SELECT value FROM items").fetchall() == [(1,)]
+
+    def test_rolls_back_transaction_on_error(self, tmp_path: Path):
+        """Test that changes of failed transaction are discarded."""
+        path = tmp_path / "test.db"
+
+        with transaction(path) as connection:
+            connection.execute("CREATE TABLE items (value INTEGER)")
+
+        with pytest.raises(ValueError):
+            with transaction(path) as connection:
+                connection.execute("INSERT INTO items VALUES (1)")
+                raise ValueError("failed")
+
+        with closing(connect(path)) as connection:
+            assert connection.execute("SELECT value FROM items").fetchall() == []
@@ -0,0 +1,101 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+import app.exceptions as exc
+from app.data_managers.parsers import parse_url
+from app.data_managers.url_index import UrlIndex, read_urls
+from app.models.pydantic_models import StockRequest
+
+BT_URL = "https://www.londonstockexchange.com/stock/BT.A/bt-group-plc/company-page"
+
+
+class TestReadUrls:
+    """Test suite for the read_urls function."""
+
+    def test_reads_stock_codes_and_urls(self, tmp_path: Path):
+        """Test that urls are read by stock code, skipping incomplete rows."""
+        path = tmp_path / "urls.csv"
+        path.write_text(
+            f"company_name,stock_code,url\nBT Group,BT.A,{BT_URL}\nNone,XD,\n"
+        )
+
+        assert read_urls(path) == {"BT.A": BT_URL}
+
+    def test_raises_error_for_missing_columns(self, tmp_path: Path):
+        """Test that DataValidationError is raised without url column."""
+        path = tmp_path / "urls.csv"
+        path.write_text("stock_code\nXD\n")
+
+        with pytest.raises(exc.DataValidationError):
+            read_urls(path)
+
+
+class TestUrlIndex:
+    """Test suite for the UrlIndex class."""
+
+    def test_resolves_indexed_url_or_builds_it(self):
+        """Test that indexed url is used, matching stock codes case-insensitively."""
+        index = UrlIndex()
+        index.add("bt.a", BT_URL)
+        bt = StockRequest(stock_code="BT.A", company_name="BT Group")
+        xd = StockRequest(stock_code="XD", company_name="Xylion Devices")
+
+        assert index.resolve(bt) == BT_URL
+        assert index.resolve(xd) == parse_url(xd)
+        assert "BT.A" in index and "XD" not in index
+        assert index.get("XD") is None
+
+    def test_update_counts_added_and_changed_urls(self):
+        """Test that update replaces urls and counts only real changes."""
+        index = UrlIndex()
+        index.add("XD", "old")
+
+        assert index.update({"XD": "new", "BT.A": BT_URL, "bt.a": BT_URL}) == 2
+        assert index.update({"XD": "new"}) == 0
+        assert index.get("XD") == "new"
+        assert len(index) == 2
+
+    def test_persists_index_between_runs(self, tmp_path: Path):
+        """Test that saved index is loaded from file and saved only if changed."""
+        path = tmp_path / "index" / "urls.csv"
+        index = UrlIndex(path)
+        index.save()
+        assert not path.exists()
+
+        index.add("BT.A", BT_URL)
+        index.save()
+        loaded = UrlIndex(path)
+
+        assert loaded.get("BT.A") == BT_URL
+        assert read_urls(path) == {"BT.A": BT_URL}
+
+        path.write_text("stock_code,url\n")
+        loaded.save()
+        assert read_urls(path) == {}
+
+    def test_in_memory_index_is_not_saved(self, tmp_path: Path):
+        """Test that index without path is kept in memory only."""
+        index = UrlIndex()
+        index.add("XD", "url")
+        index.save()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_is_updated_concurrently(self):
+        """Test that urls added from many threads are all indexed."""
+        index = UrlIndex()
+
+        def add(worker: int) -> None:
+            for i in range(200):
+                index.add(f"C{worker}-{i}", f"url-{i}")
+
+        threads = [threading.Thread(target=add, args=(w,)) for w in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(index) == 800
@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.constants import DataColumns
+from app.data_managers.work_queue import DONE, LEASED, PENDING, WorkQueue
+from app.models.pydantic_models import (
+    FailedStockResponse,
+    StockRequest,
+    StockResponse,
+)
+
+REQUESTS = [
+    StockRequest(stock_code="ABC", company_name="Alpha Beta Corp"),
+    StockRequest(stock_code="FBT", company_name="Flobotics"),
+    StockRequest(stock_code="XD", company_name="Xylion Devices"),
+]
+
+
+def success(request: StockRequest) -> StockResponse:
+    return StockResponse(
+        company_name=request.company_name,
+        stock_code=request.stock_code,
+        timestamp="14.09.25 13:03:33 BST",
+        value=160.35,
+    )
+
+
+class FakeClock:
+    """Fake wall clock, which can be moved forward."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path: Path, clock: FakeClock) -> WorkQueue:
+    """Fixture providing queue with enqueued requests."""
+    queue = WorkQueue(tmp_path / "queue.db", lease=60, clock=clock)
+    queue.enqueue(REQUESTS)
+    return queue
+
+
+class TestWorkQueue:
+    """Test suite for the WorkQueue class."""
+
+    def test_claims_batches_in_order_without_duplicates(self, queue: WorkQueue):
+        """Test that workers claim disjoint batches in order of enqueued requests."""
+        first = queue.claim(worker="w1", size=2)
+        second = queue.claim(worker="w2", size=2)
+        third = queue.claim(worker="w3", size=2)
+
+        assert [r for _, r in first] == REQUESTS[:2]
+        assert [r for _, r in second] == REQUESTS[2:]
+        assert third == []
+        assert queue.counts() == {PENDING: 0, LEASED: 3, DONE: 0}
+
+    def test_requeues_expired_leases(self, queue: WorkQueue, clock: FakeClock):
+        """Test that tasks of expired lease are claimed again by another worker."""
+        queue.claim(worker="w1", size=3)
+        clock.now += 61
+
+        batch = queue.claim(worker="w2", size=3)
+
+        assert [r for _, r in batch] == REQUESTS
+
+    def test_ignores_results_of_worker_that_lost_lease(
+        self, queue: WorkQueue, clock: FakeClock
+    ):
+        """
+        Test that results of worker, whose lease expired and was taken over,
+        are not written, so each task is completed once.
+        """
+        batch = queue.claim(worker="w1", size=1)
+        clock.now += 61
+        queue.claim(worker="w2", size=1)
+
+        results = [(task_id, success(r)) for task_id, r in batch]
+
+        assert queue.complete(worker="w1", results=results) == 0
+        assert queue.complete(worker="w2", results=results) == 1
+
+    def test_requeue_expired_returns_number_of_tasks(
+        self, queue: WorkQueue, clock: FakeClock
+    ):
+        """Test that expired leases can be requeued explicitly."""
+        queue.claim(worker="w1", size=2)
+        clock.now += 61
+
+        assert queue.requeue_expired() == 2
+        assert queue.counts()[PENDING] == 3
+
+    def test_exports_results_in_input_order(self, queue: WorkQueue):
+        """
+        Test that exported results keep order of enqueued requests,
+        failed and unfinished tasks have missing timestamp and value.
+        """
+        batch = queue.claim(worker="w1", size=2)
+        queue.complete(
+            worker="w1",
+            results=[
+                (batch[1][0], success(batch[1][1])),
+                (
+                    batch[0][0],
+                    FailedStockResponse(
+                        company_name=batch[0][1].company_name,
+                        stock_code=batch[0][1].stock_code,
+                    ),
+                ),
+            ],
+        )
+
+        result = queue.export()
+
+        assert result[DataColumns.STOCK_CODE].tolist() == ["ABC", "FBT", "XD"]
+        assert result[DataColumns.VALUE].tolist()[1] == 160.35
+        assert np.isnan(result[DataColumns.VALUE].tolist()[0])
+        assert result[DataColumns.TIMESTAMP].isna().tolist() == [True, False, True]
+
+    def test_queue_is_shared_between_instances(self, tmp_path: Path):
+        """Test that separate instances, like separate processes, share tasks."""
+        path = tmp_path / "queue.db"
+        WorkQueue(path).enqueue(REQUESTS)
+
+        assert len(WorkQueue(path).claim(worker="w1", size=10)) == 3
+        assert WorkQueue(path).claim(worker="w2", size=10) == []
@@ -0,0 +1,95 @@
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.logging import ERROR_CLASS, NAME, ErrorSampler, QueueLogging, logger
+
+
+def record(error_class: str | None = None) -> logging.LogRecord:
+    """Creates error record of the project logger with optional error class."""
+    extra = {} if error_class is None else {ERROR_CLASS: error_class}
+    return logger.makeRecord(
+        NAME, logging.ERROR, __file__, 0, "Failed %s", ("XD",), None, extra=extra
+    )
+
+
+class TestErrorSampler:
+    """Test suite for the ErrorSampler class."""
+
+    def test_passes_first_records_of_each_error_class(self):
+        """Test that only sample of each class passes, others are counted."""
+        sampler = ErrorSampler(sample=2)
+        classes = ["PageLoadError"] * 3 + ["ScrapingError", None]
+
+        passed = [sampler.filter(record(error_class)) for error_class in classes]
+
+        assert passed == [True, True, False, True, True]
+        assert sampler.counts() == {"PageLoadError": 3, "ScrapingError": 1}
+
+    def test_logs_summary_of_sampled_classes(self, caplog: pytest.LogCaptureFixture):
+        """Test that summary is logged only for classes with suppressed records."""
+        sampler = ErrorSampler(sample=1)
+
+        for error_class in ["PageLoadError", "PageLoadError", "ScrapingError"]:
+            sampler.filter(record(error_class))
+
+        with caplog.at_level(logging.WARNING, logger=NAME):
+            sampler.log_summary()
+
+        assert caplog.messages == ["2 × PageLoadError, first 1 shown"]
+
+
+class TestQueueLogging:
+    """Test suite for the QueueLogging class."""
+
+    def test_writes_sampled_records_to_file(self, tmp_path: Path):
+        """
+        Test that records are written by listener when logging is shut down,
+        with summary of sampled errors, and logger is restored.
+        """
+        path = tmp_path / "logs" / "run.log"
+        propagate = logger.propagate
+
+        with QueueLogging(level="INFO", sample=1, path=path):
+            logger.debug("Hidden")
+            logger.info("Started %s", "run")
+
+            for code in ["AAA", "BBB"]:
+                logger.error("Failed %s", code, extra={ERROR_CLASS: "PageLoadError"})
+
+        lines = path.read_text().splitlines()
+
+        assert [line.split(" ", 4)[-1] for line in lines] == [
+            "Started run",
+            "Failed AAA",
+            "2 × PageLoadError, first 1 shown",
+        ]
+        assert " ERROR " in lines[1]
+        assert logger.propagate == propagate
+        assert not logger.filters
+        assert not logger.handlers
+
+    def test_formats_records_in_listener_thread(self, tmp_path: Path):
+        """
+        Test that message and traceback are formatted by the listener,
+        not in the thread, which logs.
+        """
+        path = tmp_path / "run.log"
+        threads: list[threading.Thread] = []
+
+        class Probe:
+            def __str__(self) -> str:
+                threads.append(threading.current_thread())
+                return "probe"
+
+        with QueueLogging(level="INFO", path=path):
+            try:
+                raise ValueError("broken")
+            except ValueError:
+                logger.exception("Failed %s", Probe())
+
+        assert threads and threading.current_thread() not in threads
+        assert "Failed probe" in path.read_text()
+        assert "ValueError: broken" in path.read_text()
@@ -0,0 +1,96 @@
+import logging
+
+import pytest
+
+from app.logging import NAME
+from app.metrics import RunMetrics, StartupTimeline
+
+
+class TestRunMetrics:
+    """Test suite for the RunMetrics class."""
+
+    def test_counters_start_from_zero_and_accumulate(self):
+        """Test that counters are incremented by given value."""
+        metrics = RunMetrics()
+
+        assert metrics.counter("pages") == 0
+
+        metrics.increment("pages")
+        metrics.increment("pages", 2)
+
+        assert metrics.counter("pages") == 3
+
+    def test_gauges_hold_last_value(self):
+        """Test that gauge holds the last reported value."""
+        metrics = RunMetrics()
+
+        assert metrics.gauge("concurrency") is None
+
+        metrics.set_gauge("concurrency", 2)
+        metrics.set_gauge("concurrency", 4)
+
+        assert metrics.gauge("concurrency") == 4
+
+    def test_summary_contains_sorted_counters_and_gauges(self):
+        """Test that summary contains all metrics sorted by name."""
+        metrics = RunMetrics()
+        metrics.set_gauge("concurrency", 2)
+        metrics.increment("b_pages")
+
+        assert list(metrics.summary().items()) == [
+            ("b_pages", 1),
+            ("concurrency", 2),
+        ]
+
+    def test_logs_summary(self, caplog: pytest.LogCaptureFixture):
+        """Test that summary is logged in single line."""
+        metrics = RunMetrics()
+        metrics.increment("pages", 3)
+
+        with caplog.at_level(logging.INFO, logger=NAME):
+            metrics.log_summary()
+
+        assert "Run metrics: pages=3" in caplog.text
+
+
+class FakeClock:
+    """Fake monotonic clock, which can be moved forward."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStartupTimeline:
+    """Test suite for the StartupTimeline class."""
+
+    def test_records_first_occurrence_of_events_ordered_by_time(self):
+        """Test that events are ordered by time and repeated event is ignored."""
+        clock = FakeClock()
+        timeline = StartupTimeline(clock=clock)
+
+        clock.now = 2.5
+        timeline.mark("browsers_ready")
+        clock.now = 0.5
+        timeline.mark("input_read")
+        clock.now = 3.0
+        timeline.mark("input_read")
+
+        assert list(timeline.events().items()) == [
+            ("input_read", 0.5),
+            ("browsers_ready", 2.5),
+        ]
+
+    def test_logs_timeline(self, caplog: pytest.LogCaptureFixture):
+        """Test that timeline is logged in single line."""
+        clock = FakeClock()
+        timeline = StartupTimeline(clock=clock)
+        clock.now = 1.234
+        timeline.mark("input_read")
+
+        with caplog.at_level(logging.INFO, logger=NAME):
+            timeline.log()
+
+        assert "Startup timeline: input_read=1.23s" in caplog.text
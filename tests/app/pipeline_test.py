@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from app.metrics import RunMetrics
+from app.pipeline import Pipeline
+
+
+class TestPipeline:
+    """Test suite for the Pipeline class."""
+
+    def test_passes_items_through_stages_in_order(self):
+        """Test that each item goes through all stages and order is kept."""
+        results: list[int] = []
+        pipeline = Pipeline(
+            [
+                ("double", lambda item: item * 2),
+                ("increment", lambda item: item + 1),
+                ("collect", results.append),
+            ]
+        )
+
+        pipeline.run(range(10))
+
+        assert results == [item * 2 + 1 for item in range(10)]
+
+    def test_runs_stages_in_separate_threads(self):
+        """Test that stage runs in its own named thread."""
+        threads: list[str] = []
+        pipeline = Pipeline(
+            [("record", lambda item: threads.append(threading.current_thread().name))]
+        )
+
+        pipeline.run([1])
+
+        assert threads == ["pipeline-record"]
+
+    @pytest.mark.parametrize("failing", ["source", "stage"])
+    def test_raises_error_of_failing_stage(self, failing: str):
+        """Test that error of source or stage stops pipeline and is raised."""
+
+        def source():
+            yield from range(5)
+
+            if failing == "source":
+                raise ValueError("source failed")
+
+        def stage(item: int) -> int:
+            if failing == "stage" and item == 2:
+                raise ValueError("stage failed")
+            return item
+
+        pipeline = Pipeline(
+            [("check", stage), ("collect", lambda item: None)], poll_interval=0.01
+        )
+
+        with pytest.raises(ValueError, match=f"{failing} failed"):
+            pipeline.run(source())
+
+    def test_records_depth_of_queues(self):
+        """
+        Test that queue of slow stage fills up to its maximum size,
+        as source waits for it instead of piling up items.
+        """
+        release = threading.Event()
+        timer = threading.Timer(0.2, release.set)
+
+        def slow(item: int) -> int:
+            release.wait()
+            return item
+
+        metrics = RunMetrics()
+        pipeline = Pipeline(
+            [("slow", slow), ("collect", lambda item: None)],
+            metrics=metrics,
+            maxsize=2,
+            poll_interval=0.01,
+        )
+
+        timer.start()
+        pipeline.run(range(6))
+
+        assert metrics.gauge("pipeline_slow_queue_max") == 2
+        assert 1 <= metrics.gauge("pipeline_collect_queue_mean") <= 2
@@ -1,5 +1,7 @@
 import subprocess
 import sys
+import time
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -9,8 +11,18 @@ from pytest import MonkeyPatch
 
 import app.exceptions as exc
 import app.run as cli
+from app.config import ScrapeConfig
 from app.constants import DataColumns
-from app.models.pydantic_models import StockRequest, StockResponse
+from app.data_managers.snapshot_store import SnapshotStore
+from app.models.pydantic_models import (
+    RawStockResponse,
+    StockRequest,
+    StockResponse,
+)
+from app.models.soupsavvy_models import ListingRowModel
+from app.scraping.browsers import FirefoxBackend
+from app.scraping.listing import ListingIndex
+from app.scraping.planning import Deadline
 
 STOCK_REQUEST: dict[str, Any] = {
     DataColumns.COMPANY_NAME: "Xylion Devices",
@@ -20,12 +32,20 @@ STOCK_PARAMS = STOCK_REQUEST | {
     DataColumns.TIMESTAMP: "14.09.25 13:03:33 BST",
     DataColumns.VALUE: 160.35,
 }
+# stock data as scraped, before price is converted
+STOCK_RAW_PARAMS = STOCK_PARAMS | {DataColumns.VALUE: "160.35"}
 STOCK_FAILED_RESPONSE = STOCK_REQUEST | {
     DataColumns.TIMESTAMP: np.nan,
     DataColumns.VALUE: np.nan,
 }
 
 
+@pytest.fixture(autouse=True)
+def working_dir(tmp_path, monkeypatch: MonkeyPatch):
+    """Fixture running tests in temporary directory, where profiles are created."""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
 def mock_data() -> pd.DataFrame:
     """Fixture providing a mock DataFrame for testing."""
@@ -36,8 +56,14 @@ def mock_data() -> pd.DataFrame:
 class FakeDriver:
     """Fake Selenium driver for testing, always returns the same stock data."""
 
-    def scrape(self, request: StockRequest) -> StockResponse:
-        return StockResponse(**STOCK_PARAMS)
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        return RawStockResponse(**STOCK_RAW_PARAMS)
+
+    def is_alive(self) -> bool:
+        return True
+
+    def memory_usage(self) -> int:
+        return 0
 
     def quit(self):
         pass
@@ -46,7 +72,7 @@ class FakeDriver:
 class FakeFailingDriver(FakeDriver):
     """Fake Selenium driver for testing, always raises ScrapingError."""
 
-    def scrape(self, request: StockRequest) -> StockResponse:
+    def scrape(self, request: StockRequest) -> RawStockResponse:
         raise exc.ScrapingError("Failed to scrape")
 
 
@@ -60,17 +86,65 @@ class FakeMixedDriver:
     def __init__(self):
         self.calls = 0
 
-    def scrape(self, request: StockRequest) -> StockResponse:
+    def scrape(self, request: StockRequest) -> RawStockResponse:
         if self.calls == 0:
             self.calls += 1
-            return StockResponse(**STOCK_PARAMS)
+            return RawStockResponse(**STOCK_RAW_PARAMS)
         else:
             raise exc.ScrapingError("Failed to scrape")
 
+    def is_alive(self) -> bool:
+        return True
+
+    def memory_usage(self) -> int:
+        return 0
+
     def quit(self):
         pass
 
 
+class FakeTabDriver(FakeMixedDriver):
+    """
+    Fake Selenium driver for testing tabs mode, finishes requests
+    in reversed order: last one succeeds, others fail.
+    """
+
+    def scrape_many(self, requests: list[StockRequest], tabs: int):
+        for index in reversed(range(len(requests))):
+            if index == len(requests) - 1:
+                yield index, RawStockResponse(**STOCK_RAW_PARAMS)
+            else:
+                yield index, exc.ScrapingError("Failed to scrape")
+
+
+class FakeBulkDriver(FakeFailingDriver):
+    """
+    Fake Selenium driver for testing bulk mode, listing contains all stocks
+    of mock data, while scraping stock pages always fails.
+    """
+
+    def scrape_listing(self) -> ListingIndex:
+        index = ListingIndex()
+        row = ListingRowModel(
+            stock_code=STOCK_PARAMS[DataColumns.STOCK_CODE],
+            value=STOCK_RAW_PARAMS[DataColumns.VALUE],
+            currency=None,
+            timestamp=STOCK_PARAMS[DataColumns.TIMESTAMP],
+        )
+        index.update([row])
+        return index
+
+
+class FakeFailingBulkDriver(FakeDriver):
+    """
+    Fake Selenium driver for testing bulk mode, scraping listing fails,
+    so stock pages have to be scraped.
+    """
+
+    def scrape_listing(self) -> ListingIndex:
+        raise exc.PageLoadError("Failed to load listing")
+
+
 @pytest.mark.integration
 class TestCLIIntegration:
     """Tests for CLI main function."""
@@ -95,7 +169,7 @@ class TestCLIIntegration:
         Integration test for CLI main: mocks Selenium driver, checks output CSV.
         Checks for different driver behaviors (all success, all fail, mixed).
         """
-        monkeypatch.setattr(cli, "get_driver", lambda headless=True: driver_class())
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: driver_class())
 
         input_path = tmp_path / "input.csv"
         output_path = tmp_path / "output.csv"
@@ -108,3 +182,972 @@ class TestCLIIntegration:
 
         expected_df = pd.DataFrame(expected)
         pd.testing.assert_frame_equal(result, expected_df)
+
+    def test_cli_logs_sample_of_errors(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """Tests that failures of the same class are logged once and summarized."""
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeFailingDriver())
+
+        input_path = tmp_path / "input.csv"
+        log_path = tmp_path / "run.log"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.cli(
+            ["--input", str(input_path), "--output", str(tmp_path / "output.csv")]
+            + ["--log-file", str(log_path), "--log-sample", "1"]
+        )
+
+        log = log_path.read_text()
+        assert log.count("Error scraping XD") == 1
+        assert "2 × ScrapingError, first 1 shown" in log
+
+        with pytest.raises(SystemExit):
+            cli.cli(["--input", str(input_path), "--log-sample", "-1"])
+
+    def test_main_converts_prices_in_pence_and_logs_failures(
+        self, tmp_path, monkeypatch: MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """
+        Tests that prices quoted in pence are saved in pounds and prices,
+        which cannot be parsed, are saved as failed and logged together.
+        """
+
+        class FakePenceDriver(FakeDriver):
+            def scrape(self, request: StockRequest) -> RawStockResponse:
+                value = "n/a" if request.stock_code == "BAD" else "1,383.20"
+                return RawStockResponse(
+                    **request.model_dump(),
+                    timestamp=STOCK_PARAMS[DataColumns.TIMESTAMP],
+                    value=value,
+                    currency="GBX",
+                )
+
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakePenceDriver())
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        pd.DataFrame(
+            [STOCK_REQUEST, STOCK_REQUEST | {DataColumns.STOCK_CODE: "BAD"}]
+        ).to_csv(input_path, index=False)
+
+        cli.main(input_path=input_path, output_path=output_path)
+
+        result = pd.read_csv(output_path)
+        assert result[DataColumns.VALUE].tolist()[0] == pytest.approx(13.832)
+        assert result[DataColumns.VALUE].isna().tolist() == [False, True]
+        assert "Failed to parse prices of 1 stocks: BAD='n/a'" in caplog.text
+
+    def test_main_releases_browser_profiles(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """
+        Tests that browsers get persistent profiles, which are released
+        after the run, unless temporary profiles are requested.
+        """
+        kwargs: list[dict] = []
+
+        def get_driver(**options):
+            kwargs.append(options)
+            return FakeDriver()
+
+        monkeypatch.setattr(cli, "get_driver", get_driver)
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.cli(["--input", str(input_path), "--output", str(output_path)])
+        cli.cli(
+            ["--input", str(input_path), "--output", str(output_path), "--no-profiles"]
+        )
+
+        profile = tmp_path / "driver_profiles" / "worker-0"
+        assert kwargs[0]["profile_dir"].resolve() == profile
+        assert "profile_dir" not in kwargs[1]
+        assert not (profile / ".lock").exists()
+
+    def test_main_starts_browser_of_selected_backend(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """
+        Tests that browsers are started with selected backend and profiles
+        of browser other than Chrome are kept in its own subdirectory.
+        """
+        kwargs: list[dict] = []
+
+        def get_driver(**options):
+            kwargs.append(options)
+            return FakeDriver()
+
+        monkeypatch.setattr(cli, "get_driver", get_driver)
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.cli(
+            ["--input", str(input_path), "--output", str(output_path)]
+            + ["--browser", "firefox"]
+        )
+
+        profile = tmp_path / "driver_profiles" / "firefox" / "worker-0"
+        assert isinstance(kwargs[0]["browser"], FirefoxBackend)
+        assert kwargs[0]["profile_dir"].resolve() == profile
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--browser", "netscape"],
+            ["--browser", "firefox", "--network"],
+        ],
+    )
+    def test_cli_rejects_unsupported_browser(self, argv: list[str]):
+        """Tests that unknown browser and network capture of Firefox are rejected."""
+        with pytest.raises(SystemExit):
+            cli.cli(["--input", "in.csv", "--output", "out.csv"] + argv)
+
+    def test_main_uses_and_updates_url_index(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """
+        Tests that drivers share URL index with imported reference URLs,
+        which is saved with URLs of loaded pages after the run.
+        """
+        kwargs: list[dict] = []
+
+        class FakeIndexingDriver(FakeDriver):
+            def __init__(self, urls=None):
+                self.urls = urls
+
+            def scrape(self, request: StockRequest) -> RawStockResponse:
+                if self.urls is not None:
+                    self.urls.add(request.stock_code, "https://lse/XD/canonical")
+                return RawStockResponse(**STOCK_RAW_PARAMS)
+
+        def get_driver(**options):
+            kwargs.append(options)
+            return FakeIndexingDriver(options.get("urls"))
+
+        monkeypatch.setattr(cli, "get_driver", get_driver)
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        reference = tmp_path / "reference.csv"
+        mock_data.to_csv(input_path, index=False)
+        reference.write_text("stock_code,url\nBT.A,https://lse/BT.A/bt\n")
+        base = ["--input", str(input_path), "--output", str(output_path)]
+
+        cli.cli(base + ["--import-urls", str(reference)])
+        cli.cli(base + ["--no-url-index"])
+
+        assert kwargs[0]["urls"].get("BT.A") == "https://lse/BT.A/bt"
+        assert "urls" not in kwargs[1]
+        assert pd.read_csv(tmp_path / "url_index.csv").values.tolist() == [
+            ["BT.A", "https://lse/BT.A/bt"],
+            ["XD", "https://lse/XD/canonical"],
+        ]
+
+        with pytest.raises(SystemExit):
+            cli.cli(base + ["--no-url-index", "--import-urls", str(reference)])
+
+    def test_main_rejects_requests_in_preflight(
+        self, tmp_path, monkeypatch: MonkeyPatch
+    ):
+        """
+        Tests that requests rejected by pre-flight check are saved as failed
+        without being loaded in browser.
+        """
+        scraped: list[str] = []
+
+        class FakeCheckingDriver(FakeDriver):
+            def scrape(self, request: StockRequest) -> RawStockResponse:
+                scraped.append(request.stock_code)
+                return RawStockResponse(**STOCK_RAW_PARAMS)
+
+        class FakePreflight:
+            closed = False
+
+            def __init__(self, urls=None):
+                self.urls = urls
+
+            def run(self, requests: list[StockRequest]):
+                for index, request in enumerate(requests):
+                    if request.stock_code == "BAD":
+                        yield index, exc.PageLoadError("redirected")
+
+            def close(self):
+                FakePreflight.closed = True
+
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeCheckingDriver())
+        monkeypatch.setattr(cli, "PreflightChecker", FakePreflight)
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        pd.DataFrame([{**STOCK_REQUEST, "stock_code": "BAD"}, STOCK_REQUEST]).to_csv(
+            input_path, index=False
+        )
+
+        cli.cli(
+            ["--input", str(input_path), "--output", str(output_path), "--preflight"]
+        )
+
+        result = pd.read_csv(output_path)
+        expected_df = pd.DataFrame(
+            [STOCK_FAILED_RESPONSE | {"stock_code": "BAD"}, STOCK_PARAMS]
+        )
+        pd.testing.assert_frame_equal(result, expected_df)
+        assert scraped == ["XD"]
+        assert FakePreflight.closed
+
+    def test_main_with_tabs_keeps_input_order(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """
+        Tests that responses scraped in multiple tabs are saved in order of input,
+        even though they were completed in different order.
+        """
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeTabDriver())
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+
+        mock_data.to_csv(input_path, index=False)
+
+        cli.main(
+            input_path=input_path,
+            output_path=output_path,
+            config=ScrapeConfig(tabs=2),
+        )
+
+        result = pd.read_csv(output_path)
+
+        expected_df = pd.DataFrame([STOCK_FAILED_RESPONSE, STOCK_PARAMS])
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    @pytest.mark.parametrize("driver_class", [FakeBulkDriver, FakeFailingBulkDriver])
+    def test_main_in_bulk_mode(
+        self,
+        tmp_path,
+        monkeypatch: MonkeyPatch,
+        mock_data: pd.DataFrame,
+        driver_class: type[FakeDriver],
+    ):
+        """
+        Tests that in bulk mode stocks found in listing are not scraped
+        from their pages and that failure of listing falls back to stock pages.
+        """
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: driver_class())
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+
+        mock_data.to_csv(input_path, index=False)
+
+        cli.main(
+            input_path=input_path,
+            output_path=output_path,
+            config=ScrapeConfig(bulk=True),
+        )
+
+        result = pd.read_csv(output_path)
+
+        expected_df = pd.DataFrame([STOCK_PARAMS, STOCK_PARAMS])
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    def test_main_with_workers_scrapes_all_requests(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """Tests that scraping with multiple workers saves all responses in order."""
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeDriver())
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+
+        mock_data.to_csv(input_path, index=False)
+
+        cli.main(
+            input_path=input_path,
+            output_path=output_path,
+            config=ScrapeConfig(workers=2),
+        )
+
+        result = pd.read_csv(output_path)
+
+        expected_df = pd.DataFrame([STOCK_PARAMS, STOCK_PARAMS])
+        pd.testing.assert_frame_equal(result, expected_df)
+
+
+@pytest.mark.integration
+class TestOutputIntegration:
+    """Tests for output options of CLI: parsed timestamps and delta output."""
+
+    def test_saves_only_rows_changed_since_previous_output(
+        self, tmp_path, monkeypatch: MonkeyPatch
+    ):
+        """
+        Tests that rows equal to previous output are skipped
+        and timestamps are saved as datetimes.
+        """
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeEchoDriver())
+
+        input_path = tmp_path / "input.csv"
+        previous_path = tmp_path / "previous.csv"
+        output_path = tmp_path / "output.csv"
+
+        requests = [
+            {DataColumns.COMPANY_NAME: f"Company {i}", DataColumns.STOCK_CODE: f"C{i}"}
+            for i in range(3)
+        ]
+        pd.DataFrame(requests).to_csv(input_path, index=False)
+        previous = pd.DataFrame([STOCK_PARAMS | request for request in requests])
+        previous.loc[1, DataColumns.VALUE] = 100.0
+        previous.drop(index=2).to_csv(previous_path, index=False)
+
+        cli.cli(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--since",
+                str(previous_path),
+                "--parse-timestamps",
+            ]
+        )
+
+        result = pd.read_csv(output_path)
+
+        assert result[DataColumns.STOCK_CODE].tolist() == ["C1", "C2"]
+        assert result[DataColumns.TIMESTAMP].tolist() == [
+            "2025-09-14 13:03:33+01:00",
+            "2025-09-14 13:03:33+01:00",
+        ]
+
+
+@pytest.mark.integration
+class TestReplayIntegration:
+    """Tests for replay mode of CLI, parsing recorded pages without browser."""
+
+    def test_replays_recorded_pages(self, tmp_path, monkeypatch: MonkeyPatch):
+        """Tests that output is built from recorded pages, without any driver."""
+        monkeypatch.setattr(cli, "get_driver", None)
+        recorded = Path(__file__).parents[1] / "mock_data" / "recorded"
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        pd.DataFrame(
+            [STOCK_REQUEST, {**STOCK_REQUEST, "stock_code": "MISSING"}]
+        ).to_csv(input_path, index=False)
+
+        cli.cli(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--replay",
+                str(recorded),
+                "--processes",
+                "1",
+            ]
+        )
+
+        result = pd.read_csv(output_path)
+
+        expected_df = pd.DataFrame(
+            [STOCK_PARAMS, STOCK_FAILED_RESPONSE | {"stock_code": "MISSING"}]
+        )
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    def test_replays_snapshot_store(self, tmp_path, monkeypatch: MonkeyPatch):
+        """Tests that pages are replayed from snapshot store of selected run."""
+        monkeypatch.setattr(cli, "get_driver", None)
+        html = Path(__file__).parents[1] / "mock_data" / "recorded" / "XD.html"
+        store_path = tmp_path / "snapshots.db"
+        SnapshotStore(store_path, run="1").save("XD", html.read_text())
+        SnapshotStore(store_path, run="2").save("XD", "<broken/>")
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        pd.DataFrame([STOCK_REQUEST]).to_csv(input_path, index=False)
+
+        cli.cli(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--replay",
+                str(store_path),
+                "--snapshot-run",
+                "1",
+                "--processes",
+                "1",
+            ]
+        )
+
+        result = pd.read_csv(output_path)
+        pd.testing.assert_frame_equal(result, pd.DataFrame([STOCK_PARAMS]))
+
+    def test_session_prunes_snapshot_store(self, tmp_path, monkeypatch: MonkeyPatch):
+        """Tests that drivers record to one store, pruned when session closes."""
+        recorders = []
+
+        def get_driver(recorder=None, **kwargs):
+            recorders.append(recorder)
+            return FakeDriver()
+
+        monkeypatch.setattr(cli, "get_driver", get_driver)
+        store_path = tmp_path / "snapshots.db"
+        SnapshotStore(store_path, run="1").save("XD", "old")
+        config = ScrapeConfig(record_dir=store_path, keep_runs=1, snapshot_max_age=1)
+
+        with cli.ScrapeSession(config, cli.RunMetrics()) as session:
+            session.scrape([StockRequest(**STOCK_REQUEST)])
+            recorder = session.recorder
+            assert isinstance(recorder, SnapshotStore)
+            recorder.save("XD", "new")
+
+        assert recorders == [recorder]
+        assert SnapshotStore(store_path).runs() == [recorder.run]
+
+    def test_session_starts_browsers_on_remote_endpoints(
+        self, monkeypatch: MonkeyPatch
+    ):
+        """
+        Tests that browsers are started on remote endpoints without local
+        profiles and number of workers is limited by capacity of endpoints.
+        """
+        kwargs: list[dict] = []
+
+        def get_remote_driver(endpoints, **options):
+            kwargs.append(options)
+            endpoints.acquire()
+            return FakeDriver()
+
+        monkeypatch.setattr(cli, "get_driver", None)
+        monkeypatch.setattr(cli, "get_remote_driver", get_remote_driver)
+        config = ScrapeConfig(
+            remote={"http://a:4444": 2, "http://b:4444": 1}, workers=8
+        )
+
+        with cli.ScrapeSession(config, cli.RunMetrics()) as session:
+            responses = session.scrape([StockRequest(**STOCK_REQUEST)] * 4)
+
+            assert session.profiles is None
+            assert session.scheduler is not None
+            assert session.scheduler.concurrency.maximum == 3
+
+        assert responses == [StockResponse(**STOCK_PARAMS)] * 4
+        assert kwargs and all("profile_dir" not in options for options in kwargs)
+
+    def test_cli_parses_remote_endpoints(self, monkeypatch: MonkeyPatch):
+        """Tests that repeated remote endpoints are passed in config."""
+        configs: list[ScrapeConfig] = []
+        monkeypatch.setattr(
+            cli, "main", lambda config, **kwargs: configs.append(config)
+        )
+
+        cli.cli(
+            ["--input", "in.csv", "--output", "out.csv"]
+            + ["--remote", "http://a:4444=2", "--remote", "http://b:4444"]
+        )
+
+        assert configs[0].remote == {"http://a:4444": 2, "http://b:4444": 1}
+
+    def test_cli_rejects_replay_with_record(self):
+        """Tests that pages cannot be recorded while replaying."""
+        with pytest.raises(SystemExit):
+            cli.cli(["--input", "in.csv", "--replay", "dir", "--record", "dir"])
+
+
+@pytest.mark.integration
+class TestWorkQueueIntegration:
+    """Tests for work queue modes of CLI: enqueue, worker and finalize."""
+
+    def test_workers_scrape_enqueued_requests(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """
+        Tests that requests enqueued from input are scraped by workers
+        in batches and finalized output keeps order of the input.
+        """
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeMixedDriver())
+
+        input_path = tmp_path / "input.csv"
+        queue_path = tmp_path / "queue.db"
+        output_path = tmp_path / "output.csv"
+
+        mock_data.to_csv(input_path, index=False)
+
+        cli.cli(["--input", str(input_path), "--queue", str(queue_path), "--enqueue"])
+        cli.cli(["--worker", "--queue", str(queue_path), "--batch-size", "1"])
+        cli.cli(
+            ["--finalize", "--queue", str(queue_path), "--output", str(output_path)]
+        )
+
+        result = pd.read_csv(output_path)
+
+        # first batch succeeds and second fails, like mixed driver does
+        expected_df = pd.DataFrame([STOCK_PARAMS, STOCK_FAILED_RESPONSE])
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    def test_finalize_exports_unfinished_requests_as_failed(
+        self, tmp_path, mock_data: pd.DataFrame
+    ):
+        """Tests that requests not scraped by any worker are exported as failed."""
+        input_path = tmp_path / "input.csv"
+        queue_path = tmp_path / "queue.db"
+        output_path = tmp_path / "output.csv"
+
+        mock_data.to_csv(input_path, index=False)
+
+        cli.enqueue(input_path=input_path, queue_path=queue_path)
+        cli.finalize(queue_path=queue_path, output_path=output_path)
+
+        result = pd.read_csv(output_path)
+
+        expected_df = pd.DataFrame([STOCK_FAILED_RESPONSE, STOCK_FAILED_RESPONSE])
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--input", "input.csv"],
+            ["--worker"],
+            ["--enqueue", "--queue", "queue.db"],
+            ["--finalize", "--queue", "queue.db"],
+        ],
+    )
+    def test_cli_rejects_missing_arguments(self, argv: list[str]):
+        """Tests that paths required by selected mode must be provided."""
+        with pytest.raises(SystemExit):
+            cli.cli(argv)
+
+
+class FakeEchoDriver(FakeDriver):
+    """Fake Selenium driver for testing, returns stock data of the request."""
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        return RawStockResponse(**(STOCK_RAW_PARAMS | request.model_dump()))
+
+
+@pytest.mark.integration
+class TestShardingIntegration:
+    """Tests for sharding modes of CLI: scraping single shard and merge."""
+
+    def test_shards_merge_into_input_order(self, tmp_path, monkeypatch: MonkeyPatch):
+        """
+        Tests that outputs of all shards scraped independently are merged
+        into output with the same rows as single run, in order of the input.
+        """
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeEchoDriver())
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        data = pd.DataFrame(
+            [
+                {
+                    DataColumns.COMPANY_NAME: f"Company {i}",
+                    DataColumns.STOCK_CODE: f"C{i}",
+                }
+                for i in range(10)
+            ]
+        )
+        data.to_csv(input_path, index=False)
+
+        shard_paths = [str(tmp_path / f"shard_{i}.csv") for i in range(3)]
+
+        for i, path in enumerate(shard_paths):
+            cli.cli(["--input", str(input_path), "--output", path, "--shard", f"{i}/3"])
+
+        cli.cli(
+            ["--input", str(input_path), "--output", str(output_path), "--merge"]
+            + shard_paths
+        )
+
+        result = pd.read_csv(output_path)
+
+        expected_df = data.assign(
+            **{
+                DataColumns.TIMESTAMP: STOCK_PARAMS[DataColumns.TIMESTAMP],
+                DataColumns.VALUE: STOCK_PARAMS[DataColumns.VALUE],
+            }
+        )
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--input", "input.csv", "--output", "out.csv", "--shard", "3/3"],
+            ["--input", "input.csv", "--output", "out.csv", "--shard", "x"],
+            ["--input", "input.csv", "--merge", "shard_0.csv"],
+            ["--queue", "queue.db", "--worker", "--merge", "shard_0.csv"],
+            ["--input", "input.csv", "--output", "out.csv", "--shard", "0/2"]
+            + ["--since", "previous.csv"],
+        ],
+    )
+    def test_cli_rejects_invalid_arguments(self, argv: list[str]):
+        """
+        Tests that invalid shard, incomplete merge arguments and shard saving
+        only changed rows, which can't be merged, are rejected.
+        """
+        with pytest.raises(SystemExit):
+            cli.cli(argv)
+
+
+class FakeOrderDriver(FakeEchoDriver):
+    """
+    Fake Selenium driver for testing, returns stock data of the request
+    and records stock codes in order in which they were scraped.
+    """
+
+    scraped: list[str] = []
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        self.scraped.append(request.stock_code)
+        return super().scrape(request)
+
+    def scrape_many(self, requests: list[StockRequest], tabs: int):
+        for index, request in enumerate(requests):
+            yield index, self.scrape(request)
+
+
+@pytest.mark.integration
+class TestAggregationIntegration:
+    """Tests for aggregation mode of CLI."""
+
+    def test_aggregates_outputs_of_runs(self, tmp_path):
+        """Tests that outputs of repeated runs are aggregated into intervals."""
+        paths = []
+
+        for run, (timestamp, value) in enumerate(
+            [("14.09.25 13:03:33 BST", 160.0), ("14.09.25 13:33:33 BST", 162.0)]
+        ):
+            path = tmp_path / f"run_{run}.csv"
+            row = STOCK_REQUEST | {
+                DataColumns.TIMESTAMP: timestamp,
+                DataColumns.VALUE: value,
+            }
+            pd.DataFrame([row, STOCK_FAILED_RESPONSE]).to_csv(path, index=False)
+            paths.append(str(path))
+
+        output_path = tmp_path / "ohlc.csv"
+        cli.cli(
+            ["--aggregate", *paths, "--output", str(output_path), "--interval", "1h"]
+        )
+
+        expected = {
+            DataColumns.STOCK_CODE: "XD",
+            "interval": "2025-09-14 13:00:00+01:00",
+            "open": 160.0,
+            "high": 162.0,
+            "low": 160.0,
+            "close": 162.0,
+            "change_pct": np.nan,
+            "observations": 2,
+            "staleness": 1587.0,
+        }
+        result = pd.read_csv(output_path)
+        pd.testing.assert_frame_equal(result, pd.DataFrame([expected]))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--aggregate", "run.csv"],
+            ["--aggregate", "run.csv", "--output", "o.csv", "--shard", "0/2"],
+            ["--aggregate", "run.csv", "--output", "o.csv", "--interval", "0s"],
+        ],
+    )
+    def test_rejects_invalid_arguments(self, argv: list[str]):
+        """Tests that aggregation requires output and valid interval."""
+        with pytest.raises(SystemExit):
+            cli.cli(argv)
+
+
+@pytest.mark.integration
+class TestDeadlineIntegration:
+    """Tests for priority ordering and deadline of the run."""
+
+    @pytest.mark.parametrize("tabs", [1, 2])
+    def test_scrapes_by_priority_until_deadline(
+        self, tmp_path, monkeypatch: MonkeyPatch, tabs: int
+    ):
+        """
+        Tests that stocks are scraped by priority, then the most stale first,
+        and stocks not scraped before deadline are saved as failed in input order.
+        """
+        scraped: list[str] = []
+        monkeypatch.setattr(FakeOrderDriver, "scraped", scraped)
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeOrderDriver())
+
+        input_path = tmp_path / "input.csv"
+        previous_path = tmp_path / "previous.csv"
+        output_path = tmp_path / "output.csv"
+        codes = ["LOW", "HIGH", "FRESH", "STALE"]
+        pd.DataFrame(
+            {
+                "company_name": [f"Company {code}" for code in codes],
+                "stock_code": codes,
+                "priority": [0, 2, 1, 1],
+            }
+        ).to_csv(input_path, index=False)
+        pd.DataFrame(
+            {
+                "stock_code": ["FRESH", "STALE"],
+                "timestamp": ["14.09.25 14:00:00 BST", "14.09.25 13:00:00 BST"],
+                "value": [1.0, 1.0],
+            }
+        ).to_csv(previous_path, index=False)
+
+        cli.main(
+            input_path=input_path,
+            output_path=output_path,
+            config=ScrapeConfig(tabs=tabs),
+            since=previous_path,
+            deadline=Deadline(3, clock=lambda: len(scraped)),
+        )
+
+        result = pd.read_csv(output_path)
+
+        assert scraped == ["HIGH", "STALE", "FRESH"]
+        assert result[DataColumns.STOCK_CODE].tolist() == codes
+        assert result[DataColumns.VALUE].isna().tolist() == [True, False, False, False]
+
+    def test_does_not_report_deadline_without_it(self):
+        """
+        Tests that requests without outcome are saved as failed, but are not
+        reported as skipped at deadline, when there is no deadline.
+        """
+
+        class FakeIncompleteDriver(FakeDriver):
+            def scrape_many(self, requests: list[StockRequest], tabs: int):
+                yield 0, RawStockResponse(**STOCK_RAW_PARAMS)
+
+        metrics = cli.RunMetrics()
+        requests = [StockRequest(**STOCK_REQUEST)] * 2
+
+        responses = cli.scrape(
+            FakeIncompleteDriver(), requests, tabs=2, metrics=metrics  # type: ignore[arg-type]
+        )
+
+        assert responses[1].value is None
+        assert metrics.counter("deadline_skipped") == 0
+
+    def test_saves_all_stocks_as_failed_after_deadline(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """Tests that no page is loaded if deadline passed before scraping."""
+        scraped: list[str] = []
+        monkeypatch.setattr(FakeOrderDriver, "scraped", scraped)
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeOrderDriver())
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.cli(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--deadline",
+                "2000-01-01T00:00",
+            ]
+        )
+
+        result = pd.read_csv(output_path)
+
+        assert scraped == []
+        pd.testing.assert_frame_equal(
+            result, pd.DataFrame([STOCK_FAILED_RESPONSE, STOCK_FAILED_RESPONSE])
+        )
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--deadline", "soon"],
+            ["--deadline", "16:30", "--replay", "dir"],
+        ],
+    )
+    def test_cli_rejects_invalid_deadline(self, argv: list[str]):
+        """Tests that invalid deadline or deadline of replay is rejected."""
+        with pytest.raises(SystemExit):
+            cli.cli(["--input", "in.csv", "--output", "out.csv"] + argv)
+
+
+@pytest.mark.integration
+class TestPipelineIntegration:
+    """Tests for running main in chunks with pipelined stages."""
+
+    @pytest.mark.parametrize("since", [False, True])
+    def test_chunks_are_saved_in_input_order(
+        self, tmp_path, monkeypatch: MonkeyPatch, since: bool
+    ):
+        """
+        Tests that output of run in chunks has the same rows as single run,
+        in order of the input, also when only changed rows are saved.
+        """
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeEchoDriver())
+
+        input_path = tmp_path / "input.csv"
+        previous_path = tmp_path / "previous.csv"
+        output_path = tmp_path / "output.csv"
+        data = pd.DataFrame(
+            [
+                {
+                    DataColumns.COMPANY_NAME: f"Company {i}",
+                    DataColumns.STOCK_CODE: f"C{i}",
+                }
+                for i in range(7)
+            ]
+        )
+        data.to_csv(input_path, index=False)
+        argv = ["--input", str(input_path), "--chunk-size", "3"]
+
+        if since:
+            cli.cli(argv + ["--output", str(previous_path)])
+            pd.read_csv(previous_path).iloc[::2].to_csv(previous_path, index=False)
+            argv += ["--since", str(previous_path)]
+
+        cli.cli(argv + ["--output", str(output_path)])
+
+        result = pd.read_csv(output_path)
+
+        expected_df = data.assign(
+            **{
+                DataColumns.TIMESTAMP: STOCK_PARAMS[DataColumns.TIMESTAMP],
+                DataColumns.VALUE: STOCK_PARAMS[DataColumns.VALUE],
+            }
+        )
+
+        if since:
+            expected_df = expected_df.iloc[1::2].reset_index(drop=True)
+
+        pd.testing.assert_frame_equal(result, expected_df)
+
+    def test_listing_is_scraped_once_for_all_chunks(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """Tests that in bulk mode chunks share listing scraped by the first one."""
+        listings: list[ListingIndex] = []
+
+        class FakeCountingBulkDriver(FakeBulkDriver):
+            def scrape_listing(self) -> ListingIndex:
+                listings.append(super().scrape_listing())
+                return listings[-1]
+
+        monkeypatch.setattr(
+            cli, "get_driver", lambda **kwargs: FakeCountingBulkDriver()
+        )
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.main(
+            input_path=input_path,
+            output_path=output_path,
+            config=ScrapeConfig(bulk=True),
+            chunk_size=1,
+        )
+
+        result = pd.read_csv(output_path)
+        assert len(listings) == 1
+        pd.testing.assert_frame_equal(result, pd.DataFrame([STOCK_PARAMS] * 2))
+
+    def test_deadline_is_rejected_with_chunks(self, tmp_path):
+        """
+        Tests that deadline is rejected when input is processed in chunks,
+        as requests of later chunks would be skipped regardless of priority.
+        """
+        argv = ["--input", "in.csv", "--output", "out.csv", "--chunk-size", "3"]
+
+        with pytest.raises(SystemExit):
+            cli.cli(argv + ["--deadline", "23:59"])
+
+        with pytest.raises(ValueError):
+            cli.main(
+                input_path=tmp_path / "in.csv",
+                output_path=tmp_path / "out.csv",
+                deadline=Deadline(time.time() + 60),
+                chunk_size=3,
+            )
+
+    def test_main_records_depth_of_stage_queues(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """Tests that depth of queue of each stage is recorded in run metrics."""
+        monkeypatch.setattr(cli, "get_driver", lambda **kwargs: FakeDriver())
+        metrics = cli.RunMetrics()
+        monkeypatch.setattr(cli, "RunMetrics", lambda: metrics)
+
+        input_path = tmp_path / "input.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.main(input_path=input_path, output_path=tmp_path / "out.csv", chunk_size=1)
+
+        for stage in ["validate", "scrape", "save"]:
+            assert metrics.gauge(f"pipeline_{stage}_queue_max") in (1, 2)
+
+    def test_cli_rejects_invalid_chunk_size(self):
+        """Tests that chunk size must be positive."""
+        with pytest.raises(SystemExit):
+            cli.cli(["--input", "in.csv", "--output", "out.csv", "--chunk-size", "0"])
+
+
+@pytest.mark.integration
+class TestStartupIntegration:
+    """Tests for starting browsers while input is read."""
+
+    def test_browsers_start_while_input_is_read(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """
+        Tests that input is read and validated while browser starts
+        and that the first scrape waits only for the rest of its startup.
+        """
+
+        def slow_driver(**kwargs) -> FakeDriver:
+            time.sleep(0.5)
+            return FakeDriver()
+
+        monkeypatch.setattr(cli, "get_driver", slow_driver)
+        metrics = cli.RunMetrics()
+        timeline = cli.StartupTimeline()
+        monkeypatch.setattr(cli, "RunMetrics", lambda: metrics)
+        monkeypatch.setattr(cli, "StartupTimeline", lambda: timeline)
+
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        cli.main(input_path=input_path, output_path=output_path)
+
+        events = timeline.events()
+        assert list(events)[-2:] == ["browsers_ready", "scrape_started"]
+        assert events["requests_validated"] < events["browsers_ready"]
+        assert 0 < (metrics.gauge("startup_wait_seconds") or 0) <= 0.5
+
+        result = pd.read_csv(output_path)
+        pd.testing.assert_frame_equal(
+            result, pd.DataFrame([STOCK_PARAMS, STOCK_PARAMS])
+        )
+
+    def test_main_raises_error_of_failed_browser_start(
+        self, tmp_path, monkeypatch: MonkeyPatch, mock_data: pd.DataFrame
+    ):
+        """Tests that error of browser started in background is raised by main."""
+
+        def failing_driver(**kwargs) -> FakeDriver:
+            raise RuntimeError("Chrome failed to start")
+
+        monkeypatch.setattr(cli, "get_driver", failing_driver)
+
+        input_path = tmp_path / "input.csv"
+        mock_data.to_csv(input_path, index=False)
+
+        with pytest.raises(RuntimeError, match="Chrome failed to start"):
+            cli.main(input_path=input_path, output_path=tmp_path / "output.csv")
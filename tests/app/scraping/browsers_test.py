@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+
+import app.constants as const
+import app.exceptions as exc
+from app.scraping.browsers import (
+    ChromeBackend,
+    FirefoxBackend,
+    HeadlessShellBackend,
+    get_backend,
+)
+
+
+class TestChromeBackend:
+    """Tests suite for building options of Chrome."""
+
+    def test_uses_none_page_load_strategy_for_multiple_tabs(self):
+        """Tests that page loads are not awaited by driver in tabs mode."""
+        assert ChromeBackend().options(tabs=2).page_load_strategy == "none"
+
+    def test_uses_default_page_load_strategy_for_single_tab(self):
+        """Tests that default page load strategy is kept for single tab."""
+        assert ChromeBackend().options(tabs=1).page_load_strategy == "normal"
+
+    def test_enables_performance_logging_for_network_capture(self):
+        """Tests that performance log is enabled when capturing network."""
+        opts = ChromeBackend().options(capture_network=True)
+        assert (
+            opts.to_capabilities()["goog:loggingPrefs"]
+            == const.CHROME_PERFORMANCE_LOGGING
+        )
+
+    def test_uses_profile_with_disk_cache(self, tmp_path: Path):
+        """Tests that persistent profile and its disk cache are configured."""
+        opts = ChromeBackend().options(profile_dir=tmp_path, cache_size=1024)
+
+        assert f"--user-data-dir={tmp_path.resolve()}" in opts.arguments
+        assert f"--disk-cache-dir={tmp_path.resolve() / 'cache'}" in opts.arguments
+        assert "--disk-cache-size=1024" in opts.arguments
+
+    def test_does_not_modify_default_arguments(self, tmp_path: Path):
+        """Tests that arguments of one driver are not added to the defaults."""
+        defaults = list(const.CHROME_DEFAULT_ARGS)
+        backend = ChromeBackend()
+
+        backend.options(headless=True, profile_dir=tmp_path)
+        opts = backend.options(headless=False)
+
+        assert const.CHROME_DEFAULT_ARGS == defaults
+        assert "--headless" not in opts.arguments
+
+
+class TestHeadlessShellBackend:
+    """Tests suite for building options of chrome-headless-shell."""
+
+    def test_uses_shell_binary_without_headless_switch(self, tmp_path: Path):
+        """Tests that given binary is used and it's not switched to headless."""
+        binary = tmp_path / "chrome-headless-shell"
+
+        opts = HeadlessShellBackend(binary).options(headless=True)
+
+        assert opts.to_capabilities()["goog:chromeOptions"]["binary"] == str(binary)
+        assert "--headless" not in opts.arguments
+        assert set(const.CHROME_DEFAULT_ARGS) <= set(opts.arguments)
+
+
+class TestFirefoxBackend:
+    """Tests suite for building options of Firefox."""
+
+    def test_builds_headless_options_with_preferences(self):
+        """Tests that Firefox runs headless with preferences of the scraper."""
+        opts = FirefoxBackend().options(headless=True, tabs=2)
+
+        assert opts.arguments == ["-headless"]
+        assert opts.page_load_strategy == "none"
+        prefs = opts.to_capabilities()["moz:firefoxOptions"]["prefs"]
+        assert const.FIREFOX_PREFERENCES.items() <= prefs.items()
+
+    def test_uses_profile_with_disk_cache(self, tmp_path: Path):
+        """Tests that persistent profile and its disk cache are configured."""
+        opts = FirefoxBackend().options(
+            headless=False, profile_dir=tmp_path, cache_size=2048
+        )
+
+        prefs = opts.to_capabilities()["moz:firefoxOptions"]["prefs"]
+        assert opts.arguments == ["-profile", str(tmp_path.resolve())]
+        assert prefs["browser.cache.disk.capacity"] == 2
+        assert prefs["browser.cache.disk.parent_directory"] == str(
+            tmp_path.resolve() / "cache"
+        )
+
+    def test_rejects_network_capture(self):
+        """Tests that network capture is not supported by Firefox."""
+        with pytest.raises(exc.BrowserBackendError):
+            FirefoxBackend().options(capture_network=True)
+
+
+class TestGetBackend:
+    """Tests suite for get_backend function."""
+
+    @pytest.mark.parametrize(
+        "name, backend_class",
+        [
+            ("chrome", ChromeBackend),
+            ("chrome-headless-shell", HeadlessShellBackend),
+            ("firefox", FirefoxBackend),
+        ],
+    )
+    def test_returns_backend_of_name(self, name: str, backend_class: type):
+        """Tests that backend is picked by name of the browser."""
+        backend = get_backend(name)
+
+        assert type(backend) is backend_class
+        assert backend.name == name
+
+    def test_raises_error_for_unknown_browser(self):
+        """Tests that unknown browser is rejected."""
+        with pytest.raises(exc.BrowserBackendError):
+            get_backend("netscape")
@@ -1,6 +1,17 @@
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from typing import Iterator
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
 
+NETWORK_MOCK_DIR = Path("tests", "mock_data", "network")
+
 
 def get_driver_options() -> Options:
     """Set up a single Chrome driver for the entire session."""
@@ -18,3 +29,32 @@ def get_driver_options() -> Options:
 def insert(html: str, driver: WebDriver) -> None:
     """Insert HTML content into the selenium browser."""
     driver.execute_script("document.body.innerHTML = arguments[0];", html)
+
+
+class StandInHandler(SimpleHTTPRequestHandler):
+    """
+    Handler serving files without extension as JSON, like LSE API urls.
+    Response is delayed by number of seconds given in `delay` query parameter.
+    """
+
+    extensions_map = {**SimpleHTTPRequestHandler.extensions_map, "": "application/json"}
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlsplit(self.path).query)
+        time.sleep(float(query.get("delay", ["0"])[0]))
+        super().do_GET()
+
+
+@pytest.fixture(scope="session")
+def stand_in_server() -> Iterator[str]:
+    """
+    Local HTTP server standing in for LSE website, serves mock pages
+    and recorded JSON responses. Yields base url of the server.
+    """
+    handler = partial(StandInHandler, directory=str(NETWORK_MOCK_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{server.server_port}"
+
+    server.shutdown()
@@ -0,0 +1,115 @@
+import pytest
+
+import app.exceptions as exc
+from app.scraping.endpoints import EndpointPool, parse_endpoint
+
+FIRST = "http://10.0.0.2:4444"
+SECOND = "http://10.0.0.3:4444"
+
+
+class FakeClock:
+    """Fake monotonic clock, which can be moved forward."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(clock: FakeClock) -> EndpointPool:
+    """Fixture providing pool of endpoints with capacity of 2 and 1 browsers."""
+    return EndpointPool(
+        {FIRST: 2, SECOND: 1}, failure_threshold=2, cooldown=60, clock=clock
+    )
+
+
+class TestParseEndpoint:
+    """Test suite for the parse_endpoint function."""
+
+    def test_parses_url_with_capacity(self):
+        """Test that capacity follows the last equals sign."""
+        assert parse_endpoint(f"{FIRST}=4") == (FIRST, 4)
+
+    def test_uses_default_capacity(self):
+        """Test that endpoint without capacity runs single browser."""
+        assert parse_endpoint(FIRST) == (FIRST, 1)
+
+    @pytest.mark.parametrize("value", [f"{FIRST}=0", f"{FIRST}=many"])
+    def test_raises_error_for_invalid_capacity(self, value: str):
+        """Test that capacity must be positive integer."""
+        with pytest.raises(ValueError):
+            parse_endpoint(value)
+
+
+class TestEndpointPool:
+    """Test suite for the EndpointPool class."""
+
+    def test_spreads_browsers_by_free_capacity(self, pool: EndpointPool):
+        """Test that each browser goes to endpoint with the most free slots."""
+        assert pool.capacity == 3
+        assert [pool.acquire() for _ in range(3)] == [FIRST, FIRST, SECOND]
+
+        with pytest.raises(exc.EndpointUnavailableError):
+            pool.acquire()
+
+        pool.release(SECOND)
+        assert pool.acquire() == SECOND
+
+    def test_skips_endpoint_down_until_cooldown_passes(
+        self, pool: EndpointPool, clock: FakeClock
+    ):
+        """Test that endpoint failing repeatedly is not used for cooldown."""
+        pool.report(FIRST, ok=False)
+        pool.report(FIRST, ok=True)
+        pool.report(FIRST, ok=False)
+        assert pool.acquire() == FIRST
+        pool.release(FIRST)
+
+        pool.report(FIRST, ok=False)
+        assert pool.acquire() == SECOND
+
+        clock.now += 60
+        assert pool.acquire() == FIRST
+
+    def test_starts_on_next_endpoint_after_failure(self, pool: EndpointPool):
+        """Test that failed connection is retried on another endpoint."""
+        attempts: list[str] = []
+
+        def connect(url: str) -> str:
+            attempts.append(url)
+
+            if url == FIRST:
+                raise ConnectionError("refused")
+            return f"driver at {url}"
+
+        assert pool.start(connect) == (SECOND, f"driver at {SECOND}")
+        assert attempts == [FIRST, SECOND]
+
+        # slot of failed endpoint was released, slot of connected one is reserved
+        assert [pool.acquire(), pool.acquire()] == [FIRST, FIRST]
+
+    def test_raises_error_when_all_endpoints_fail(self, pool: EndpointPool):
+        """Test that error is raised after each endpoint was tried once."""
+        attempts: list[str] = []
+
+        def connect(url: str) -> str:
+            attempts.append(url)
+            raise ConnectionError("refused")
+
+        with pytest.raises(exc.EndpointUnavailableError) as error:
+            pool.start(connect)
+
+        assert attempts == [FIRST, SECOND]
+        assert isinstance(error.value.__cause__, ConnectionError)
+
+    def test_raises_error_without_available_endpoint(self):
+        """Test that nothing is started, when there are no endpoints."""
+        with pytest.raises(exc.EndpointUnavailableError):
+            EndpointPool({}).start(str)
@@ -0,0 +1,95 @@
+import pytest
+from bs4 import BeautifulSoup
+from soupsavvy import to_soupsavvy
+
+import app.constants as const
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.models.soupsavvy_models import ListingRowModel
+from app.scraping.listing import ListingIndex, has_next_page
+
+TIMESTAMP = "14.09.25 13:03:33 BST"
+
+
+def row(stock_code: str, value: str, currency: str | None = None) -> ListingRowModel:
+    """Creates listing row model as if it was scraped from the page."""
+    return ListingRowModel(
+        stock_code=stock_code, value=value, currency=currency, timestamp=TIMESTAMP
+    )
+
+
+class TestListingIndex:
+    """Test suite for the ListingIndex class."""
+
+    def test_answers_request_for_indexed_stock(self):
+        """
+        Test that request for stock present in listing is answered
+        with company name from request and data from listing.
+        """
+        index = ListingIndex()
+        index.update([row("XD", "160.35", "GBX"), row("FBT", "12.5")])
+
+        result = index.get(StockRequest(stock_code="XD", company_name="Xylion"))
+
+        expected = RawStockResponse(
+            company_name="Xylion",
+            stock_code="XD",
+            timestamp=TIMESTAMP,
+            value="160.35",
+            currency="GBX",
+        )
+        assert result == expected
+
+    def test_returns_none_for_stock_missing_from_listing(self):
+        """Test that request for stock not present in listing is not answered."""
+        index = ListingIndex()
+        index.update([row("XD", "160.35")])
+
+        assert index.get(StockRequest(stock_code="ABC", company_name="Abc")) is None
+
+    def test_matches_stock_codes_case_insensitively(self):
+        """Test that stock codes are matched ignoring case and whitespace."""
+        index = ListingIndex()
+        index.update([row("bt.a", "3.5")])
+
+        assert "BT.A " in index
+        assert index.get(StockRequest(stock_code="BT.A", company_name="BT")) is not None
+
+    def test_update_counts_only_new_stock_codes(self):
+        """
+        Test that rows of already indexed stocks are not counted nor overwritten,
+        so repeated page can be detected.
+        """
+        index = ListingIndex()
+
+        assert index.update([row("XD", "1.0"), row("FBT", "2.0")]) == 2
+        assert index.update([row("XD", "3.0")]) == 0
+        assert len(index) == 2
+
+        response = index.get(StockRequest(stock_code="XD", company_name="Xylion"))
+        assert response is not None
+        assert response.value == "1.0"
+
+
+class TestHasNextPage:
+    """Test suite for the has_next_page function."""
+
+    @pytest.mark.parametrize(
+        "html, expected",
+        [
+            (f'<table></table><a class="{const.LISTING_NEXT_CLASS}">Next</a>', True),
+            ("<table></table><span>Page 5 of 5</span>", False),
+            (
+                f'<p class="{const.LISTING_EMPTY_CLASS}">No results</p>'
+                f'<a class="{const.LISTING_NEXT_CLASS}">Next</a>',
+                False,
+            ),
+        ],
+    )
+    def test_detects_link_to_next_page(self, html: str, expected: bool):
+        """
+        Test that page links to the next one only if pagination has next link
+        and listing is not empty.
+        """
+        element = to_soupsavvy(BeautifulSoup(html, const.REPLAY_HTML_PARSER))
+
+        assert has_next_page(element) is expected
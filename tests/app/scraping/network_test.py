@@ -0,0 +1,122 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.scraping.network import extract_price, format_timestamp, iter_json_responses
+
+MOCK_DATA_DIR = Path("tests", "mock_data", "network")
+RESPONSE_PATH = MOCK_DATA_DIR / "alldata" / "XD"
+PERFORMANCE_LOG_PATH = MOCK_DATA_DIR / "performance_log.json"
+
+
+@pytest.fixture
+def payload() -> dict:
+    """Fixture with recorded JSON response containing stock data."""
+    return json.loads(RESPONSE_PATH.read_text())
+
+
+@pytest.fixture
+def entries() -> list[dict]:
+    """Fixture with recorded entries of Chrome performance log."""
+    return json.loads(PERFORMANCE_LOG_PATH.read_text())
+
+
+class TestIterJsonResponses:
+    """Test suite for the iter_json_responses function."""
+
+    def test_yields_only_json_responses_of_the_stock(self, entries: list[dict]):
+        """
+        Test that only JSON responses with stock code in url are found,
+        document responses and responses of other stocks are skipped.
+        """
+        assert list(iter_json_responses(entries, "XD")) == ["1000.9"]
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://api.lse.com/instruments/alldata/XD", True),
+            ("https://api.lse.com/instruments?tidm=xd&period=1d", True),
+            ("https://api.lse.com/instruments/alldata/XDX", False),
+            ("https://api.lse.com/instruments?tidm=AXD", False),
+            ("https://api.lse.com/xdata/GLEN", False),
+        ],
+    )
+    def test_matches_stock_code_as_whole_url_part(self, url: str, expected: bool):
+        """
+        Test that stock code must be whole path segment or query value of url,
+        urls containing it as part of other codes or words are skipped.
+        """
+        message = {
+            "method": "Network.responseReceived",
+            "params": {
+                "requestId": "1",
+                "response": {"url": url, "mimeType": "application/json"},
+            },
+        }
+        entries = [{"message": json.dumps({"message": message})}]
+
+        assert list(iter_json_responses(entries, "XD")) == (["1"] if expected else [])
+
+    def test_yields_nothing_for_stock_without_response(self, entries: list[dict]):
+        """Test that nothing is found when there was no response for the stock."""
+        assert list(iter_json_responses(entries, "HSBA")) == []
+
+
+class TestExtractPrice:
+    """Test suite for the extract_price function."""
+
+    def test_extracts_price_from_nested_payload(self, payload: dict):
+        """
+        Test that price, its currency and timestamp are found in nested object
+        of payload and timestamp is formatted the same way as on LSE page.
+        """
+        assert extract_price(payload, "XD") == (
+            "14.09.25 13:03:33 BST",
+            "160.35",
+            "GBX",
+        )
+
+    def test_returns_none_for_data_of_other_stock(self, payload: dict):
+        """Test that object with different stock code is not accepted."""
+        assert extract_price(payload, "GLEN") is None
+
+    def test_returns_none_when_price_is_missing(self):
+        """Test that payload without price key does not match."""
+        assert extract_price({"lastupdate": "2025-09-14T13:03:33"}, "XD") is None
+
+    def test_keeps_price_text_for_conversion(self):
+        """
+        Test that price is returned as text without currency if it's missing,
+        it's converted and validated later together with other prices.
+        """
+        payload = [
+            {"tidm": "XD", "lastprice": "n/a", "lastupdate": "2025-09-14T13:03:33"},
+            {"tidm": "XD", "lastprice": "1,234", "lastupdate": "2025-09-14T13:03:33"},
+        ]
+        assert extract_price(payload, "XD") == ("14.09.25 13:03:33 BST", "n/a", None)
+
+    def test_skips_objects_without_stock_code(self):
+        """Test that price not attributed to any stock is not accepted."""
+        payload = {"lastprice": "1,234.5", "lastupdate": "2025-09-14T13:03:33"}
+        assert extract_price(payload, "XD") is None
+
+
+class TestFormatTimestamp:
+    """Test suite for the format_timestamp function."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("2025-09-14T13:03:33", "14.09.25 13:03:33 BST"),
+            ("2025-01-14T13:03:33", "14.01.25 13:03:33 GMT"),
+            ("2025-09-14T12:03:33+00:00", "14.09.25 13:03:33 BST"),
+            ("14.09.25 13:03:33 BST", "14.09.25 13:03:33 BST"),
+        ],
+    )
+    def test_formats_timestamp_like_lse_page(self, raw: str, expected: str):
+        """
+        Test that ISO timestamps are converted to London time in LSE page format
+        and other values are returned unchanged.
+        """
+        assert format_timestamp(raw) == expected
@@ -0,0 +1,82 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.scraping.planning import Deadline, parse_deadline, priority_order
+
+
+class TestDeadline:
+    """Test suite for the Deadline class."""
+
+    def test_expires_at_given_time(self):
+        """Test that deadline expires when clock reaches it."""
+        now = [10.0]
+        deadline = Deadline(15.0, clock=lambda: now[0])
+
+        assert deadline.remaining() == 5.0
+        assert not deadline.expired()
+
+        now[0] = 15.0
+        assert deadline.expired()
+
+
+class TestParseDeadline:
+    """Test suite for the parse_deadline function."""
+
+    def test_parses_date_and_time_with_offset(self):
+        """Test that full ISO 8601 datetime is parsed as exact point in time."""
+        deadline = parse_deadline("2025-09-14T16:30:00+01:00")
+        assert deadline.at == datetime.fromisoformat("2025-09-14T15:30Z").timestamp()
+
+    def test_parses_time_as_today(self):
+        """Test that time without date, which is still ahead, means today."""
+        now = datetime(2025, 9, 14, 10, 0)
+
+        deadline = parse_deadline("16:30", now=now)
+
+        assert deadline.at == datetime(2025, 9, 14, 16, 30).timestamp()
+
+    def test_parses_passed_time_as_tomorrow(self):
+        """
+        Test that time without date, which has already passed today,
+        means tomorrow, so run started before midnight is not expired at once.
+        """
+        now = datetime(2025, 9, 14, 23, 0)
+
+        deadline = parse_deadline("01:00", now=now)
+
+        assert deadline.at == datetime(2025, 9, 15, 1, 0).timestamp()
+
+    def test_parses_time_in_local_time_by_default(self):
+        """Test that time without date is the next occurrence in local time."""
+        deadline = parse_deadline("16:30")
+        at = datetime.fromtimestamp(deadline.at)
+
+        assert (at.hour, at.minute) == (16, 30)
+        assert 0 < deadline.remaining() <= 24 * 3600
+
+    @pytest.mark.parametrize("value", ["tomorrow", "25:00", ""])
+    def test_raises_error_for_invalid_value(self, value: str):
+        """Test that ValueError is raised for value, which is not ISO 8601."""
+        with pytest.raises(ValueError):
+            parse_deadline(value)
+
+
+class TestPriorityOrder:
+    """Test suite for the priority_order function."""
+
+    def test_orders_by_descending_priority_keeping_input_order(self):
+        """Test that higher priority goes first and ties keep order of input."""
+        assert priority_order(np.array([0, 2, 0, 1, 2])) == [1, 4, 3, 0, 2]
+
+    def test_orders_most_stale_first_within_priority(self):
+        """Test that unknown and the oldest updates go first within priority."""
+        updated = pd.Series(
+            pd.to_datetime(
+                ["2025-09-14 10:00", "2025-09-14 09:00", None, "2025-09-14 08:00"]
+            ).tz_localize("Europe/London")
+        )
+
+        assert priority_order(np.array([0, 0, 0, 1]), updated) == [3, 2, 1, 0]
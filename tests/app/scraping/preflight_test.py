@@ -0,0 +1,96 @@
+import threading
+from types import SimpleNamespace
+
+from requests import ConnectionError
+
+import app.constants as const
+import app.exceptions as exc
+from app.data_managers.parsers import parse_url
+from app.models.pydantic_models import StockRequest
+from app.scraping.preflight import PreflightChecker
+from app.scraping.scheduler import HostRateLimiter
+
+REQUESTS = [
+    StockRequest(stock_code="XD", company_name="Xylion Devices"),
+    StockRequest(stock_code="BAD", company_name="Wrong Name"),
+    StockRequest(stock_code="DOWN", company_name="Unreachable"),
+    StockRequest(stock_code="BAD2", company_name="Wrong Name"),
+]
+
+
+class FakeSession:
+    """
+    Fake HTTP session, redirecting pages of stock codes starting with BAD
+    to price explorer and failing for stock code DOWN.
+    """
+
+    def __init__(self):
+        self.urls: list[str] = []
+        self.threads: set[int] = set()
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def head(self, url: str, allow_redirects: bool, timeout: float):
+        with self._lock:
+            self.urls.append(url)
+            self.threads.add(threading.get_ident())
+
+        assert allow_redirects
+
+        if "/BAD" in url:
+            return SimpleNamespace(url=f"{const.LSEWebsite.PRICE_EXPLORER_URL}/?x=1")
+        if "/DOWN/" in url:
+            raise ConnectionError("connection refused")
+        return SimpleNamespace(url=url)
+
+    def close(self):
+        self.closed = True
+
+
+def build_checker(session: FakeSession, workers: int = 2) -> PreflightChecker:
+    """Returns checker with given session and without rate limiting."""
+    return PreflightChecker(
+        workers=workers,
+        limiter=HostRateLimiter(rate=1e9),
+        session=session,  # type: ignore[arg-type]
+    )
+
+
+class TestPreflightChecker:
+    """Test suite for the PreflightChecker class."""
+
+    def test_rejects_only_redirected_pages(self):
+        """Test that only pages redirected to price explorer are rejected."""
+        session = FakeSession()
+
+        with build_checker(session) as checker:
+            rejected = list(checker.run(REQUESTS))
+
+        assert [index for index, _ in rejected] == [1, 3]
+        assert all(isinstance(e, exc.PageLoadError) for _, e in rejected)
+        assert sorted(session.urls) == sorted(map(parse_url, REQUESTS))
+        assert session.closed
+
+    def test_checks_pages_concurrently(self):
+        """Test that requests are sent from multiple threads."""
+        session = FakeSession()
+        gate = threading.Barrier(2, timeout=5)
+        head = session.head
+
+        def blocking_head(url: str, **kwargs):
+            gate.wait()  # both workers must be inside to pass
+            return head(url, **kwargs)
+
+        session.head = blocking_head  # type: ignore[method-assign]
+        checker = build_checker(session, workers=2)
+
+        assert list(checker.run(REQUESTS[:2])) != []
+        assert len(session.threads) == 2
+
+    def test_default_session_pools_connections(self):
+        """Test that default session keeps pool of connections per worker."""
+        checker = PreflightChecker(workers=4)
+        adapter = checker.session.get_adapter("https://www.londonstockexchange.com")
+
+        assert adapter._pool_maxsize == 4  # type: ignore[attr-defined]
+        checker.close()
@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+from app.scraping.process import process_tree_rss
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def add_process(proc: Path, pid: int, parent: int, pages: int) -> None:
+    """Adds process with given parent and resident pages to fake proc filesystem."""
+    directory = proc / str(pid)
+    directory.mkdir()
+    (directory / "stat").write_text(f"{pid} (chrome (renderer)) S {parent} 1 1 0")
+    (directory / "statm").write_text(f"1000 {pages} 10 1 0 100 0")
+
+
+class TestProcessTreeRss:
+    """Test suite for the process_tree_rss function."""
+
+    def test_sums_memory_of_descendants(self, tmp_path: Path):
+        """Test that memory of the process and all its descendants is summed."""
+        add_process(tmp_path, 10, parent=1, pages=1)
+        add_process(tmp_path, 11, parent=10, pages=2)
+        add_process(tmp_path, 12, parent=11, pages=4)
+        add_process(tmp_path, 20, parent=1, pages=8)  # not in the tree
+        (tmp_path / "self").mkdir()
+        (tmp_path / "30").mkdir()  # exited while reading
+
+        assert process_tree_rss(10, proc=tmp_path) == 7 * PAGE_SIZE
+
+    def test_returns_zero_without_proc(self, tmp_path: Path):
+        """Test that zero is returned if proc filesystem is not available."""
+        assert process_tree_rss(10, proc=tmp_path / "missing") == 0
+
+    def test_returns_zero_for_exited_process(self, tmp_path: Path):
+        """Test that processes, which exited, are skipped."""
+        add_process(tmp_path, 10, parent=1, pages=1)
+
+        assert process_tree_rss(99, proc=tmp_path) == 0
@@ -0,0 +1,144 @@
+import os
+import socket
+from pathlib import Path
+
+import pytest
+
+import app.exceptions as exc
+from app.scraping.profiles import ProfilePool
+
+
+class FakeClock:
+    """Fake wall clock, which can be moved forward."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(tmp_path: Path, clock: FakeClock) -> ProfilePool:
+    """Fixture providing pool of two profiles in temporary directory."""
+    return ProfilePool(tmp_path / "profiles", max_profiles=2, max_age=60, clock=clock)
+
+
+def lock_by(profile: Path, owner: str) -> None:
+    """Locks profile as if it was reserved by given owner."""
+    profile.mkdir(parents=True)
+    (profile / ".lock").write_text(owner)
+
+
+class TestProfilePool:
+    """Test suite for the ProfilePool class."""
+
+    def test_acquires_distinct_profiles(self, pool: ProfilePool):
+        """Test that concurrently used profiles are different directories."""
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert first != second
+        assert first.is_dir() and second.is_dir()
+
+        with pytest.raises(exc.ProfileUnavailableError):
+            pool.acquire()
+
+    def test_reuses_released_profile(self, pool: ProfilePool):
+        """Test that released profile is acquired again, keeping its cache."""
+        profile = pool.acquire()
+        (profile / "cache").mkdir()
+        pool.release(profile)
+
+        assert pool.acquire() == profile
+        assert (profile / "cache").is_dir()
+
+    def test_release_all(self, pool: ProfilePool):
+        """Test that all profiles of the pool are released."""
+        pool.acquire()
+        pool.acquire()
+        pool.release_all()
+
+        assert pool.acquire().name == "worker-0"
+
+    def test_takes_over_lock_of_dead_process(self, pool: ProfilePool):
+        """Test that profile locked by process, which no longer runs, is reused."""
+        lock_by(pool.root / "worker-0", f"{socket.gethostname()}:999999999")
+
+        assert pool.acquire().name == "worker-0"
+
+    @pytest.mark.parametrize(
+        "owner",
+        [f"{socket.gethostname()}:{os.getpid()}", "other-host:1", "corrupted"],
+    )
+    def test_skips_profile_locked_by_other_owner(self, pool: ProfilePool, owner: str):
+        """
+        Test that profile locked by running process, process of another host
+        or unknown owner is not used.
+        """
+        lock_by(pool.root / "worker-0", owner)
+
+        assert pool.acquire().name == "worker-1"
+
+    def test_cleanup_removes_expired_and_excess_profiles(
+        self, pool: ProfilePool, clock: FakeClock
+    ):
+        """
+        Test that profiles unused for longer than max age and profiles
+        above the limit are removed, unless they are in use.
+        """
+        old = pool.acquire()
+        used = pool.acquire()
+        pool.release(old)
+        (pool.root / "worker-5").mkdir()
+        clock.now += 61
+
+        assert pool.cleanup() == 2
+        assert sorted(p.name for p in pool.root.iterdir()) == [used.name]
+
+    def test_cleanup_keeps_recent_profiles(self, pool: ProfilePool):
+        """Test that recently used profiles are kept."""
+        pool.release(pool.acquire())
+
+        assert pool.cleanup() == 0
+        assert ProfilePool(pool.root / "missing").cleanup() == 0
+
+    def test_release_of_unknown_profile(self, pool: ProfilePool):
+        """Test that profile reserved by another pool can be released."""
+        profile = ProfilePool(pool.root).acquire()
+        pool.release(profile)
+
+        assert not (profile / ".lock").exists()
+
+    def test_skips_profile_of_process_owned_by_other_user(
+        self, pool: ProfilePool, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that lock of process, which cannot be signalled, is respected."""
+
+        def kill(pid: int, signal: int):
+            raise PermissionError(pid)
+
+        lock_by(pool.root / "worker-0", f"{socket.gethostname()}:1")
+        monkeypatch.setattr(os, "kill", kill)
+
+        assert pool.acquire().name == "worker-1"
+
+    def test_takes_over_lock_released_in_the_meantime(
+        self, pool: ProfilePool, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that profile is acquired if its lock disappears while checked."""
+        lock_by(pool.root / "worker-0", "other-host:1")
+        read_text = Path.read_text
+
+        def released(path: Path, *args, **kwargs) -> str:
+            path.unlink()
+            return read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", released)
+
+        assert pool.acquire().name == "worker-0"
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+import app.exceptions as exc
+from app.data_managers.page_store import DirectoryPageStore
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.scraping.replay import parse_page, replay
+
+RECORDED_DIR = Path("tests", "mock_data", "recorded")
+
+REQUESTS = [
+    StockRequest(stock_code="XD", company_name="Xylion Devices"),
+    StockRequest(stock_code="BROKEN", company_name="Broken Markup"),
+    StockRequest(stock_code="MISSING", company_name="Never Recorded"),
+    StockRequest(stock_code="GLEN", company_name="Glencore plc"),
+]
+
+
+class TestParsePage:
+    """Test suite for the parse_page function."""
+
+    def test_parses_recorded_page(self):
+        """Test that stock data is extracted from recorded page."""
+        html = (RECORDED_DIR / "GLEN.html").read_text()
+
+        response = parse_page(REQUESTS[3], html)
+
+        assert response == RawStockResponse(
+            company_name="Glencore plc",
+            stock_code="GLEN",
+            timestamp="14.09.25 13:05:12 BST",
+            value="1,383.20",
+        )
+
+    def test_raises_on_changed_markup(self):
+        """Test that error is raised if page does not match scraper model."""
+        html = (RECORDED_DIR / "BROKEN.html").read_text()
+
+        with pytest.raises(exc.ElementNotFoundError):
+            parse_page(REQUESTS[1], html)
+
+
+class TestReplay:
+    """Test suite for the replay function."""
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_replays_requests_in_order(self, processes: int):
+        """
+        Test that responses are parsed from recorded pages in order of requests,
+        failing for pages that are missing or do not match scraper model.
+        """
+        store = DirectoryPageStore(RECORDED_DIR)
+
+        outcomes = list(replay(REQUESTS, store, processes=processes))
+
+        assert [index for index, _ in outcomes] == [0, 1, 2, 3]
+        assert isinstance(outcomes[0][1], RawStockResponse)
+        assert isinstance(outcomes[1][1], exc.ElementNotFoundError)
+        assert isinstance(outcomes[2][1], exc.PageLoadError)
+        assert isinstance(outcomes[3][1], RawStockResponse)
+        assert outcomes[0][1].value == "160.35"
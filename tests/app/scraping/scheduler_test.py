@@ -0,0 +1,274 @@
+import threading
+import time
+
+import pytest
+
+import app.exceptions as exc
+from app.metrics import RunMetrics
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.scraping.planning import Deadline
+from app.scraping.scheduler import (
+    AdaptiveConcurrency,
+    HostRateLimiter,
+    ScrapeScheduler,
+    TokenBucket,
+)
+
+REQUESTS = [
+    StockRequest(stock_code=f"C{i}", company_name=f"Company {i}") for i in range(20)
+]
+
+
+class FakeClock:
+    """Fake monotonic clock, sleeping moves time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeDriver:
+    """Fake driver returning response for stock codes not listed as failing."""
+
+    def __init__(self, failing: tuple[str, ...] = ()):
+        self.failing = failing
+        self.scraped: list[str] = []
+        self.closed = False
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        self.scraped.append(request.stock_code)
+
+        if request.stock_code in self.failing:
+            raise exc.PageLoadTimeoutError("Timed out")
+
+        return RawStockResponse(
+            company_name=request.company_name,
+            stock_code=request.stock_code,
+            timestamp="14.09.25 13:03:33 BST",
+            value="1.0",
+        )
+
+    def quit(self) -> None:
+        self.closed = True
+
+
+class TestTokenBucket:
+    """Test suite for the TokenBucket class."""
+
+    def test_waits_for_tokens_beyond_capacity(self):
+        """
+        Test that requests within capacity pass immediately
+        and following ones wait for tokens refilled at given rate.
+        """
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits == [0, 0, 0.5, 0.5]
+
+    def test_refills_tokens_over_time(self):
+        """Test that tokens are refilled after time passes."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        clock.now += 5
+
+        assert bucket.acquire() == 0
+
+
+class TestHostRateLimiter:
+    """Test suite for the HostRateLimiter class."""
+
+    def test_limits_each_host_separately(self):
+        """Test that requests to different hosts do not wait for each other."""
+        clock = FakeClock()
+        limiter = HostRateLimiter(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire("https://a.com/stock/XD") == 0
+        assert limiter.acquire("https://b.com/stock/XD") == 0
+        assert limiter.acquire("https://a.com/stock/FBT") == 1
+
+
+class TestAdaptiveConcurrency:
+    """Test suite for the AdaptiveConcurrency class."""
+
+    def test_increases_limit_additively_on_fast_successes(self):
+        """Test that limit grows by roughly one after `limit` fast successes."""
+        controller = AdaptiveConcurrency(maximum=4, slow_threshold=1)
+
+        assert controller.limit == 1
+        assert [controller.record(0.1) for _ in range(4)] == [2, 2, 2, 3]
+
+    def test_does_not_exceed_maximum(self):
+        """Test that limit never grows above maximum."""
+        controller = AdaptiveConcurrency(maximum=2, slow_threshold=1)
+
+        for _ in range(10):
+            controller.record(0.1)
+
+        assert controller.limit == 2
+
+    def test_keeps_limit_on_slow_success(self):
+        """Test that slow page loads do not increase the limit."""
+        controller = AdaptiveConcurrency(maximum=4, slow_threshold=1)
+
+        assert controller.record(2.0) == 1
+
+    def test_decreases_limit_multiplicatively_on_timeout(self):
+        """Test that page load timeout halves the limit."""
+        controller = AdaptiveConcurrency(maximum=8, initial=8)
+
+        assert controller.record(10, exc.PageLoadTimeoutError("Timed out")) == 4
+        assert controller.record(10, exc.PageLoadTimeoutError("Timed out")) == 2
+
+    def test_decreases_limit_on_error_spike(self):
+        """
+        Test that other errors decrease the limit only when their share
+        in full window exceeds threshold.
+        """
+        controller = AdaptiveConcurrency(
+            maximum=8, initial=8, window=4, error_threshold=0.5
+        )
+        error = exc.ElementNotFoundError("Not found")
+
+        assert controller.record(10, error) == 8
+        assert controller.record(10, error) == 8
+        assert controller.record(10, None) == 8
+        assert controller.record(10, error) == 4
+
+
+class TestScrapeScheduler:
+    """Test suite for the ScrapeScheduler class."""
+
+    def scheduler(self, driver_factory, **kwargs) -> ScrapeScheduler:
+        return ScrapeScheduler(
+            driver_factory=driver_factory,
+            concurrency=AdaptiveConcurrency(maximum=4, slow_threshold=10),
+            limiter=HostRateLimiter(rate=1000, burst=1000),
+            **kwargs,
+        )
+
+    def test_scrapes_every_request_exactly_once(self):
+        """Test that each request is scraped once and its index is kept."""
+        drivers: list[FakeDriver] = []
+
+        def factory() -> FakeDriver:
+            drivers.append(FakeDriver())
+            return drivers[-1]
+
+        scheduler = self.scheduler(factory)
+        result = dict(scheduler.run(REQUESTS))
+
+        assert sorted(result) == list(range(len(REQUESTS)))
+        assert all(result[i].stock_code == REQUESTS[i].stock_code for i in result)
+        assert sorted(sum((d.scraped for d in drivers), [])) == sorted(
+            r.stock_code for r in REQUESTS
+        )
+        assert 1 <= len(drivers) <= 4
+
+    def test_reports_errors_and_limits_to_metrics(self):
+        """
+        Test that errors are yielded as outcomes, timeouts are counted
+        and current limits are reported to metrics.
+        """
+        metrics = RunMetrics()
+        scheduler = self.scheduler(lambda: FakeDriver(failing=("C0",)), metrics=metrics)
+
+        result = dict(scheduler.run(REQUESTS[:3]))
+
+        assert isinstance(result[0], exc.PageLoadTimeoutError)
+        assert metrics.counter("page_load_timeouts") == 1
+        assert metrics.gauge("concurrency") is not None
+        assert metrics.gauge("rate_limit_per_host") == 1000
+
+    def test_uses_provided_drivers_first_and_closes_only_created(self):
+        """
+        Test that provided driver is used before creating new ones
+        and that close does not quit it.
+        """
+        provided = FakeDriver()
+        created: list[FakeDriver] = []
+
+        def factory() -> FakeDriver:
+            created.append(FakeDriver())
+            return created[-1]
+
+        scheduler = self.scheduler(factory, drivers=[provided])
+        list(scheduler.run(REQUESTS[:1]))
+        scheduler.close()
+
+        assert provided.scraped == ["C0"]
+        assert not created
+        assert not provided.closed
+
+    def test_fails_requests_when_driver_cannot_start(self):
+        """Test that failure of driver factory fails requests instead of hanging."""
+
+        def factory() -> FakeDriver:
+            raise RuntimeError("Chrome failed to start")
+
+        scheduler = self.scheduler(factory)
+        result = dict(scheduler.run(REQUESTS[:2]))
+
+        assert all(isinstance(e, exc.ScrapingError) for e in result.values())
+
+    def test_fails_requests_when_driver_raises_unexpected_error(self):
+        """Test that error other than ScrapingError fails request instead of hanging."""
+
+        class BrokenDriver(FakeDriver):
+            def scrape(self, request: StockRequest) -> RawStockResponse:
+                raise RuntimeError("session deleted")
+
+        scheduler = self.scheduler(BrokenDriver)
+        result = dict(scheduler.run(REQUESTS[:3]))
+
+        assert sorted(result) == [0, 1, 2]
+        assert all(isinstance(e, exc.ScrapingError) for e in result.values())
+        assert isinstance(result[0].__cause__, RuntimeError)
+
+    def test_stops_starting_requests_at_deadline(self):
+        """Test that no request is started after deadline expired."""
+        drivers: list[FakeDriver] = []
+        scraped = [0]
+
+        def factory() -> FakeDriver:
+            drivers.append(FakeDriver())
+            return drivers[-1]
+
+        # deadline expires after the third scraped page
+        deadline = Deadline(3, clock=lambda: sum(len(d.scraped) for d in drivers))
+        scheduler = self.scheduler(factory)
+        scheduler.concurrency = AdaptiveConcurrency(maximum=1)
+
+        for _ in scheduler.run(REQUESTS, deadline=deadline):
+            scraped[0] += 1
+
+        assert scraped[0] == 3
+        assert sum(len(d.scraped) for d in drivers) == 3
+
+    def test_closing_run_stops_starting_requests(self):
+        """Test that closed run does not scrape remaining requests."""
+
+        class SlowDriver(FakeDriver):
+            def scrape(self, request: StockRequest) -> RawStockResponse:
+                time.sleep(0.05)
+                return super().scrape(request)
+
+        driver = SlowDriver()
+        scheduler = self.scheduler(lambda: driver)
+        scheduler.concurrency = AdaptiveConcurrency(maximum=1)
+
+        outcomes = scheduler.run(REQUESTS)
+        next(outcomes)
+        outcomes.close()
+
+        assert 1 <= len(driver.scraped) <= 2
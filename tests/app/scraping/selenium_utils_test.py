@@ -1,13 +1,26 @@
+import time
+from pathlib import Path
 from unittest.mock import PropertyMock
 
 import pytest
 from pytest import MonkeyPatch
+from selenium.webdriver.chrome.service import Service
 
 import app.constants as const
 import app.exceptions as exc
+import app.scraping.selenium_utils as selenium_utils
 from app.constants import LSEWebsite
-from app.models.pydantic_models import StockRequest, StockResponse
-from app.scraping.selenium_utils import LSEDriver, get_driver
+from app.data_managers.page_store import DirectoryPageStore
+from app.data_managers.url_index import UrlIndex
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.scraping.replay import parse_page
+from app.scraping.endpoints import EndpointPool
+from app.scraping.selenium_utils import (
+    LSEDriver,
+    RemoteLSEDriver,
+    get_driver,
+    get_remote_driver,
+)
 from tests.app.scraping.conftest import get_driver_options, insert
 
 mock_request = StockRequest(stock_code="XD", company_name="Xylion Devices")
@@ -19,7 +32,7 @@ def mock_raise():
 
 
 timestamp = "14.09.25 13:03:33 BST"
-price = 160.35
+price = "160.35"
 price_tag = f'<span class="{const.PRICE_TAG_CLASS}"> {price} </span>'
 
 HTML_TEMPLATE = """
@@ -61,7 +74,7 @@ class TestLSEDriver:
         self, monkeypatch: MonkeyPatch, driver: LSEDriver
     ):
         """
-        Tests that scrape method returns correct StockResponse object
+        Tests that scrape method returns correct RawStockResponse object
         if process was finished without errors and elements were found correctly.
         """
         monkeypatch.setattr(LSEDriver, "get", lambda self, url: None)
@@ -70,11 +83,11 @@ class TestLSEDriver:
         insert(text, driver)
         result = driver.scrape(mock_request)
 
-        expected = StockResponse(
+        expected = RawStockResponse(
             company_name="Xylion Devices",
             stock_code="XD",
             timestamp="14.09.25 13:03:33 BST",
-            value=160.35,
+            value="160.35",
         )
         assert result == expected
 
@@ -154,33 +167,309 @@ class TestLSEDriver:
         with pytest.raises(exc.ElementNotFoundError):
             driver.scrape(mock_request)
 
-    def test_handles_price_with_commas(
+    def test_keeps_price_text_with_commas_and_currency(
         self, monkeypatch: MonkeyPatch, driver: LSEDriver
     ):
         """
-        Tests that price with commas (in thousands) is handled correctly
-        and converted to float properly. All this is handled by soupsavvy model.
+        Tests that price with commas (in thousands) and its currency are scraped
+        as displayed, they are converted later together with other prices.
         """
         monkeypatch.setattr(LSEDriver, "get", lambda self, url: None)
 
         text = HTML_TEMPLATE.format(
             ticker_id=const.STOCK_SCOPE_ID,
-            price_tag=f'<span class="{const.PRICE_TAG_CLASS}"> 1,234.50 </span>',
+            price_tag=(
+                f'<span class="{const.PRICE_TAG_CLASS}"> 1,234.50 </span>'
+                f'<span class="{const.CURRENCY_TAG_CLASS}">GBX</span>'
+            ),
             timestamp=timestamp,
         )
         insert(text, driver)
 
         result = driver.scrape(mock_request)
 
-        expected = StockResponse(
+        expected = RawStockResponse(
             company_name="Xylion Devices",
             stock_code="XD",
             timestamp="14.09.25 13:03:33 BST",
-            value=1234.50,
+            value="1,234.50",
+            currency="GBX",
         )
         assert result == expected
 
 
+@pytest.fixture(scope="session")
+def network_driver():
+    """Fixture providing LSEDriver instance capturing network traffic."""
+    options = get_driver_options()
+    options.set_capability("goog:loggingPrefs", const.CHROME_PERFORMANCE_LOGGING)
+    driver = LSEDriver(options=options)
+    driver.capture_network = True
+
+    yield driver
+
+    driver.quit()
+
+
+@pytest.mark.selenium
+class TestLSEDriverNetworkCapture:
+    """
+    Tests suite for reading stock data from network traffic with LSEDriver.
+    Pages and recorded JSON responses are served by local stand-in server.
+    """
+
+    def test_reads_stock_data_from_json_response(
+        self, monkeypatch: MonkeyPatch, network_driver: LSEDriver, stand_in_server: str
+    ):
+        """
+        Tests that stock data is read from JSON response fetched by the page.
+        Page renders different price with a delay, so it proves
+        that the data did not come from parsing the page.
+        """
+        monkeypatch.setattr(
+            selenium_utils,
+            "parse_url",
+            lambda request: f"{stand_in_server}/stock_page.html",
+        )
+
+        result = network_driver.scrape(mock_request)
+
+        expected = RawStockResponse(
+            company_name="Xylion Devices",
+            stock_code="XD",
+            timestamp="14.09.25 13:03:33 BST",
+            value="160.35",
+            currency="GBX",
+        )
+        assert result == expected
+
+    def test_falls_back_to_parsing_page_without_json_response(
+        self, monkeypatch: MonkeyPatch, network_driver: LSEDriver, stand_in_server: str
+    ):
+        """
+        Tests that stock data is parsed from the page, when page does not fetch
+        any JSON response with stock data.
+        """
+        monkeypatch.setattr(
+            selenium_utils,
+            "parse_url",
+            lambda request: f"{stand_in_server}/static_page.html",
+        )
+
+        result = network_driver.scrape(mock_request)
+
+        expected = RawStockResponse(
+            company_name="Xylion Devices",
+            stock_code="XD",
+            timestamp="14.09.25 13:03:33 BST",
+            value="1,234.50",
+        )
+        assert result == expected
+
+
+LISTING_ROW_TEMPLATE = """
+<tr class="{row}">
+    <td class="{code}">{stock_code}</td>
+    <td class="{price}">{value}</td>
+    <td class="{timestamp_class}">{timestamp}</td>
+</tr>
+"""
+
+
+def listing_page(rows: list[tuple[str, str]], last: bool = False) -> str:
+    """
+    Creates HTML of listing page with rows of given stock codes and values,
+    with pagination link to the next page, unless the page is the last one.
+    """
+    html = "".join(
+        LISTING_ROW_TEMPLATE.format(
+            row=const.LISTING_ROW_CLASS,
+            code=const.LISTING_CODE_CLASS,
+            price=const.LISTING_PRICE_CLASS,
+            timestamp_class=const.LISTING_TIMESTAMP_CLASS,
+            stock_code=stock_code,
+            value=value,
+            timestamp=timestamp,
+        )
+        for stock_code, value in rows
+    )
+    pagination = "" if last else f'<a class="{const.LISTING_NEXT_CLASS}">Next</a>'
+    return f"<table>{html}</table>{pagination}"
+
+
+@pytest.mark.selenium
+class TestLSEDriverListing:
+    """Tests suite for scraping paginated listing with LSEDriver."""
+
+    def test_indexes_rows_from_all_pages(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver
+    ):
+        """
+        Tests that rows from all listing pages are indexed with prices
+        as displayed and walk stops at the page without link to the next one,
+        without waiting for page beyond the end of listing.
+        Navigation is mocked by inserting HTML of the page selected by url.
+        """
+        pages = {
+            "1": listing_page([("XD", "160.35"), ("FBT", "1,234.50")]),
+            "2": listing_page([("ABC", "not-a-price"), ("GLEN", "12")], last=True),
+        }
+        calls: list[str] = []
+
+        def navigate(self, url):
+            calls.append(url)
+            insert(pages[url.split("=")[-1]], self)
+
+        monkeypatch.setattr(LSEDriver, "_start_navigation", navigate)
+
+        index = driver.scrape_listing()
+
+        assert len(index) == 4
+        assert len(calls) == 2
+        assert "ABC" in index
+
+        response = index.get(mock_request)
+        assert response is not None
+        assert response.value == "160.35"
+        assert response.timestamp == timestamp
+
+    def test_stops_at_empty_listing(self, monkeypatch: MonkeyPatch, driver: LSEDriver):
+        """
+        Tests that walk stops as soon as empty listing marker is shown,
+        not after waiting for rows until timeout.
+        """
+        pages = {
+            "1": listing_page([("XD", "160.35")]),
+            "2": f'<p class="{const.LISTING_EMPTY_CLASS}">No results</p>',
+        }
+        monkeypatch.setattr(
+            LSEDriver,
+            "_start_navigation",
+            lambda self, url: insert(pages[url.split("=")[-1]], self),
+        )
+
+        start = time.perf_counter()
+        index = driver.scrape_listing(timeout=30)
+
+        assert len(index) == 1
+        assert time.perf_counter() - start < 10
+
+    def test_stops_when_page_repeats_indexed_rows(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver
+    ):
+        """
+        Tests that walk stops when page contains only already indexed rows,
+        which happens when page number exceeds number of pages of listing.
+        """
+        calls: list[str] = []
+
+        def navigate(self, url):
+            calls.append(url)
+            insert(listing_page([("XD", "160.35")]), self)
+
+        monkeypatch.setattr(LSEDriver, "_start_navigation", navigate)
+
+        index = driver.scrape_listing()
+
+        assert len(index) == 1
+        assert len(calls) == 2
+
+
+@pytest.mark.selenium
+class TestLSEDriverTabs:
+    """Tests suite for scraping in multiple tabs with LSEDriver."""
+
+    expected = RawStockResponse(
+        company_name="Xylion Devices",
+        stock_code="XD",
+        timestamp="14.09.25 13:03:33 BST",
+        value="160.35",
+    )
+
+    def test_scrapes_all_requests_in_tabs(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver
+    ):
+        """
+        Tests that every request is scraped exactly once, when there are
+        more requests than tabs, and extra tabs are closed afterwards.
+        Navigation is mocked by inserting HTML into the tab.
+        """
+        monkeypatch.setattr(
+            LSEDriver, "_start_navigation", lambda self, url: insert(DEFAULT_TEXT, self)
+        )
+
+        result = dict(driver.scrape_many([mock_request] * 3, tabs=2))
+
+        assert sorted(result) == [0, 1, 2]
+        assert all(response == self.expected for response in result.values())
+        assert len(driver.window_handles) == 1
+
+    def test_yields_error_when_redirected_to_price_explorer(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver
+    ):
+        """
+        Tests that redirection to price explorer is detected per tab
+        and reported as PageLoadError for the request.
+        """
+        monkeypatch.setattr(
+            LSEDriver, "_start_navigation", lambda self, url: insert(DEFAULT_TEXT, self)
+        )
+        monkeypatch.setattr(
+            LSEDriver,
+            "current_url",
+            PropertyMock(return_value=LSEWebsite.PRICE_EXPLORER_URL),
+        )
+
+        result = dict(driver.scrape_many([mock_request] * 2, tabs=2))
+
+        assert all(isinstance(e, exc.PageLoadError) for e in result.values())
+
+    def test_scrapes_stock_after_redirect_in_the_same_tab(
+        self, monkeypatch: MonkeyPatch, stand_in_server: str
+    ):
+        """
+        Tests that request loaded in tab, which was redirected to price explorer
+        by previous request, is not reported as redirected while its page
+        is still loading and the tab shows url of price explorer.
+        """
+        explorer = f"{stand_in_server}/price_explorer.html"
+        urls = iter([explorer, f"{stand_in_server}/stock_details.html?delay=1"])
+        monkeypatch.setattr(LSEWebsite, "PRICE_EXPLORER_URL", explorer)
+        monkeypatch.setattr(LSEDriver, "_resolve_url", lambda self, r: next(urls))
+
+        options = get_driver_options()
+        options.page_load_strategy = "none"
+        driver = LSEDriver(options=options)
+
+        try:
+            result = dict(driver.scrape_many([mock_request] * 2, tabs=1))
+        finally:
+            driver.quit()
+
+        assert isinstance(result[0], exc.PageLoadError)
+        assert result[1] == self.expected
+
+    def test_yields_error_when_page_did_not_load_within_timeout(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver
+    ):
+        """
+        Tests that PageLoadError is yielded for request, which page
+        does not contain stock element within timeout.
+        """
+        text = HTML_TEMPLATE.format(
+            ticker_id="not-ticker-id",
+            price_tag=price_tag,
+            timestamp=timestamp,
+        )
+        monkeypatch.setattr(
+            LSEDriver, "_start_navigation", lambda self, url: insert(text, self)
+        )
+
+        result = dict(driver.scrape_many([mock_request], tabs=2, timeout=0))
+
+        assert isinstance(result[0], exc.PageLoadError)
+
+
 @pytest.mark.selenium
 class TestGetDriver:
     """Tests suite for get_driver function."""
@@ -189,3 +478,115 @@ class TestGetDriver:
         """Tests that get_driver returns LSEDriver instance."""
         driver = get_driver()
         assert isinstance(driver, LSEDriver)
+
+
+@pytest.mark.selenium
+class TestLSEDriverRecording:
+    """Tests suite for recording scraped pages with LSEDriver."""
+
+    def test_records_stock_data_section(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver, tmp_path: Path
+    ):
+        """Tests that recorded page is parsed to the same response as live page."""
+        store = DirectoryPageStore(tmp_path)
+        monkeypatch.setattr(LSEDriver, "get", lambda self, url: None)
+        monkeypatch.setattr(driver, "recorder", store)
+
+        insert(DEFAULT_TEXT, driver)
+        response = driver.scrape(mock_request)
+
+        html = store.load(mock_request.stock_code)
+        assert html is not None
+        assert html.startswith(f'<div id="{const.STOCK_SCOPE_ID}"')
+        assert parse_page(mock_request, html) == response
+
+
+@pytest.mark.selenium
+class TestLSEDriverHealth:
+    """Tests suite for checking health of the browser with LSEDriver."""
+
+    def test_responding_browser_is_alive(self, driver: LSEDriver):
+        """Tests that running browser is reported as alive and uses memory."""
+        assert driver.is_alive()
+        assert driver.memory_usage() > 0
+
+    def test_quit_browser_is_not_alive(self):
+        """Tests that browser, which was quit, is not reported as alive."""
+        driver = LSEDriver(options=get_driver_options())
+        driver.quit()
+
+        assert not driver.is_alive()
+
+
+@pytest.mark.selenium
+class TestLSEDriverUrlIndex:
+    """Tests suite for resolving stock page URLs with index in LSEDriver."""
+
+    def test_loads_indexed_url_and_indexes_loaded_page(
+        self, monkeypatch: MonkeyPatch, driver: LSEDriver
+    ):
+        """
+        Tests that indexed URL is loaded instead of built one and URL
+        of loaded page is indexed. `current_url` is mocked to simulate redirection
+        to canonical URL.
+        """
+        loaded: list[str] = []
+        canonical = f"{LSEWebsite.BASE_URL}/stock/XD/xylion-devices-plc/company-page"
+        urls = UrlIndex()
+        urls.add("XD", f"{LSEWebsite.BASE_URL}/stock/XD/xylion")
+        monkeypatch.setattr(LSEDriver, "get", lambda self, url: loaded.append(url))
+        monkeypatch.setattr(
+            LSEDriver, "current_url", PropertyMock(return_value=canonical)
+        )
+        monkeypatch.setattr(driver, "urls", urls)
+
+        insert(DEFAULT_TEXT, driver)
+        driver.scrape(mock_request)
+
+        assert loaded == [f"{LSEWebsite.BASE_URL}/stock/XD/xylion"]
+        assert urls.get("XD") == canonical
+
+
+@pytest.fixture
+def endpoint():
+    """
+    Fixture providing URL of local chromedriver, which stands in
+    for remote WebDriver endpoint, e.g. Selenium standalone container.
+    """
+    service = Service()
+    service.start()
+
+    yield service.service_url
+
+    service.stop()
+
+
+@pytest.mark.selenium
+class TestRemoteLSEDriver:
+    """Tests suite for drivers started on remote endpoints."""
+
+    def test_scrapes_with_browser_on_endpoint(
+        self, monkeypatch: MonkeyPatch, endpoint: str
+    ):
+        """
+        Tests that remote driver scrapes pages and holds slot of the endpoint
+        until it quits.
+        """
+        endpoints = EndpointPool({endpoint: 1})
+        driver = get_remote_driver(endpoints)
+        monkeypatch.setattr(RemoteLSEDriver, "get", lambda self, url: None)
+
+        try:
+            assert isinstance(driver, RemoteLSEDriver)
+            assert driver.is_alive()
+
+            insert(DEFAULT_TEXT, driver)
+            response = driver.scrape(mock_request)
+            assert response.value == price
+
+            with pytest.raises(exc.EndpointUnavailableError):
+                endpoints.acquire()
+        finally:
+            driver.quit()
+
+        assert endpoints.acquire() == endpoint
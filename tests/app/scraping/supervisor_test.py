@@ -0,0 +1,289 @@
+from typing import Iterator, Sequence
+
+import pytest
+
+import app.exceptions as exc
+from app.metrics import RunMetrics
+from app.models.pydantic_models import RawStockResponse, StockRequest
+from app.scraping.listing import ListingIndex
+from app.scraping.selenium_utils import ScrapeOutcome
+from app.scraping.supervisor import DriverSupervisor
+
+REQUESTS = [
+    StockRequest(stock_code=f"C{i}", company_name=f"Company {i}") for i in range(5)
+]
+
+
+def success(request: StockRequest) -> RawStockResponse:
+    return RawStockResponse(
+        company_name=request.company_name,
+        stock_code=request.stock_code,
+        timestamp="14.09.25 13:03:33 BST",
+        value="1.0",
+    )
+
+
+class FakeDriver:
+    """
+    Fake driver, which crashes on stock codes listed as crashing:
+    browser stops responding and loading page fails.
+    """
+
+    def __init__(self, crashing: tuple[str, ...] = (), memory: int = 0):
+        self.crashing = crashing
+        self.memory = memory
+        self.scraped: list[str] = []
+        self.alive = True
+        self.closed = False
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        self.scraped.append(request.stock_code)
+
+        if request.stock_code in self.crashing:
+            self.alive = False
+
+        if not self.alive:
+            raise exc.PageLoadError("Chrome crashed")
+
+        return success(request)
+
+    def scrape_many(
+        self, requests: Sequence[StockRequest], tabs: int
+    ) -> Iterator[tuple[int, ScrapeOutcome]]:
+        for index, request in enumerate(requests):
+            try:
+                yield index, self.scrape(request)
+            except exc.ScrapingError as e:
+                yield index, e
+
+    def scrape_listing(self) -> ListingIndex:
+        if self.crashing:
+            self.alive = False
+            raise exc.PageLoadError("Chrome crashed")
+        return ListingIndex()
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def memory_usage(self) -> int:
+        return self.memory
+
+    def quit(self) -> None:
+        self.closed = True
+
+
+class FakeMissingPageDriver(FakeDriver):
+    """Fake driver, which fails to load pages, but keeps responding."""
+
+    def scrape(self, request: StockRequest) -> RawStockResponse:
+        raise exc.PageLoadError("Page not found")
+
+
+class FakeDyingDriver(FakeDriver):
+    """Fake driver, whose session is lost in the middle of scraping in tabs."""
+
+    def scrape_many(
+        self, requests: Sequence[StockRequest], tabs: int
+    ) -> Iterator[tuple[int, ScrapeOutcome]]:
+        yield 0, self.scrape(requests[0])
+        self.alive = False
+        raise ConnectionError("chromedriver is gone")
+
+    def quit(self) -> None:
+        raise ConnectionError("chromedriver is gone")
+
+
+class FakeFactory:
+    """Factory returning prepared drivers one after another."""
+
+    def __init__(self, *drivers: FakeDriver):
+        self.drivers = list(drivers)
+        self.started: list[FakeDriver] = []
+
+    def __call__(self) -> FakeDriver:
+        driver = self.drivers.pop(0) if self.drivers else FakeDriver()
+        self.started.append(driver)
+        return driver
+
+
+class TestDriverSupervisor:
+    """Test suite for the DriverSupervisor class."""
+
+    def test_recycles_after_max_pages(self):
+        """Test that browser is restarted after given number of pages."""
+        factory = FakeFactory()
+        metrics = RunMetrics()
+        supervisor = DriverSupervisor(factory, max_pages=2, metrics=metrics)
+
+        for request in REQUESTS:
+            supervisor.scrape(request)
+
+        assert [d.scraped for d in factory.started] == [
+            ["C0", "C1"],
+            ["C2", "C3"],
+            ["C4"],
+        ]
+        assert all(d.closed for d in factory.started[:2])
+        assert metrics.summary() == {
+            "drivers_recycled": 2,
+            "drivers_recycled_pages": 2,
+        }
+
+    def test_recycles_when_memory_exceeds_limit(self):
+        """Test that memory is checked every interval and large browser is restarted."""
+        factory = FakeFactory(FakeDriver(memory=200))
+        metrics = RunMetrics()
+        supervisor = DriverSupervisor(
+            factory, max_memory=100, memory_interval=3, metrics=metrics
+        )
+
+        for request in REQUESTS:
+            supervisor.scrape(request)
+
+        assert [d.scraped for d in factory.started] == [
+            ["C0", "C1", "C2"],
+            ["C3", "C4"],
+        ]
+        assert metrics.counter("drivers_recycled_memory") == 1
+
+    def test_keeps_browser_within_memory_limit(self):
+        """Test that browser using less memory than the limit is kept."""
+        factory = FakeFactory(FakeDriver(memory=50))
+        supervisor = DriverSupervisor(factory, max_memory=100, memory_interval=1)
+
+        for request in REQUESTS:
+            supervisor.scrape(request)
+
+        assert len(factory.started) == 1
+
+    def test_retries_request_after_crash(self):
+        """Test that request in flight during crash is scraped with new browser."""
+        factory = FakeFactory(FakeDriver(crashing=("C1",)))
+        metrics = RunMetrics()
+        supervisor = DriverSupervisor(factory, metrics=metrics)
+
+        responses = [supervisor.scrape(request) for request in REQUESTS]
+
+        assert responses == [success(request) for request in REQUESTS]
+        assert [d.scraped for d in factory.started] == [
+            ["C0", "C1"],
+            ["C1", "C2", "C3", "C4"],
+        ]
+        assert metrics.counter("drivers_recycled_crash") == 1
+
+    def test_raises_errors_of_responding_browser(self):
+        """Test that errors, after which browser still responds, are raised."""
+        factory = FakeFactory(FakeMissingPageDriver())
+        supervisor = DriverSupervisor(factory)
+
+        with pytest.raises(exc.PageLoadError):
+            supervisor.scrape(REQUESTS[0])
+
+        assert len(factory.started) == 1
+
+    def test_scrape_many_recycles_between_chunks(self):
+        """Test that requests scraped in tabs are split by page limit of browser."""
+        factory = FakeFactory()
+        supervisor = DriverSupervisor(factory, max_pages=2)
+
+        outcomes = dict(supervisor.scrape_many(REQUESTS, tabs=2))
+
+        assert outcomes == {i: success(r) for i, r in enumerate(REQUESTS)}
+        assert [len(d.scraped) for d in factory.started] == [2, 2, 1]
+
+    def test_scrape_many_retries_requests_failed_by_crash(self):
+        """Test that requests of chunk, during which browser crashed, are retried."""
+        factory = FakeFactory(FakeDriver(crashing=("C2",)))
+        metrics = RunMetrics()
+        supervisor = DriverSupervisor(factory, metrics=metrics)
+
+        outcomes = dict(supervisor.scrape_many(REQUESTS, tabs=2))
+
+        assert outcomes == {i: success(r) for i, r in enumerate(REQUESTS)}
+        assert factory.started[1].scraped == ["C2", "C3", "C4"]
+        assert metrics.counter("drivers_recycled_crash") == 1
+
+    def test_scrape_many_retries_requests_after_lost_session(self):
+        """
+        Test that requests not finished before session of the browser was lost
+        are retried, even if old browser fails to quit.
+        """
+        factory = FakeFactory(FakeDyingDriver())
+        supervisor = DriverSupervisor(factory)
+
+        outcomes = dict(supervisor.scrape_many(REQUESTS, tabs=2))
+
+        assert outcomes == {i: success(r) for i, r in enumerate(REQUESTS)}
+        assert factory.started[1].scraped == ["C1", "C2", "C3", "C4"]
+
+    def test_scrape_many_fails_requests_after_error_of_responding_browser(self):
+        """
+        Test that requests not finished before unexpected error, after which
+        browser still responds, are yielded as failed instead of raising.
+        """
+        driver = FakeDyingDriver()
+        driver.is_alive = lambda: True  # type: ignore[method-assign]
+        factory = FakeFactory(driver)
+        supervisor = DriverSupervisor(factory)
+
+        outcomes = dict(supervisor.scrape_many(REQUESTS, tabs=2))
+
+        assert outcomes[0] == success(REQUESTS[0])
+        assert sorted(outcomes) == list(range(len(REQUESTS)))
+
+        for index in range(1, len(REQUESTS)):
+            assert isinstance(outcomes[index], exc.ScrapingError)
+            assert isinstance(outcomes[index].__cause__, ConnectionError)
+
+        assert len(factory.started) == 1
+
+    def test_scrape_many_fails_requests_when_restart_fails(self):
+        """Test that requests are yielded as failed if browser can't be restarted."""
+        factory = FakeFactory(FakeDriver(crashing=("C2",)))
+        supervisor = DriverSupervisor(factory)
+
+        def fail() -> FakeDriver:
+            raise ConnectionError("chromedriver is gone")
+
+        supervisor._factory = fail  # type: ignore[assignment]
+
+        outcomes = dict(supervisor.scrape_many(REQUESTS, tabs=2))
+
+        assert [outcomes[i] for i in range(2)] == [success(r) for r in REQUESTS[:2]]
+
+        for index in range(2, len(REQUESTS)):
+            assert isinstance(outcomes[index], exc.PageLoadError)
+
+    def test_wraps_unexpected_errors_of_responding_browser(self):
+        """Test that errors other than ScrapingError are raised as ScrapingError."""
+        driver = FakeDriver()
+        driver.scrape = lambda request: 1 / 0  # type: ignore[method-assign]
+        supervisor = DriverSupervisor(FakeFactory(driver))
+
+        with pytest.raises(exc.ScrapingError) as info:
+            supervisor.scrape(REQUESTS[0])
+
+        assert isinstance(info.value.__cause__, ZeroDivisionError)
+
+    def test_raises_page_load_error_when_restart_fails(self):
+        """Test that failure to start new browser is raised as PageLoadError."""
+        factory = FakeFactory(FakeDriver(crashing=("C0",)))
+        supervisor = DriverSupervisor(factory)
+
+        def fail() -> FakeDriver:
+            raise ConnectionError("chromedriver is gone")
+
+        supervisor._factory = fail  # type: ignore[assignment]
+
+        with pytest.raises(exc.PageLoadError) as info:
+            supervisor.scrape(REQUESTS[0])
+
+        assert isinstance(info.value.__cause__, ConnectionError)
+
+    def test_scrape_listing_retries_after_crash(self):
+        """Test that listing is scraped again with new browser after crash."""
+        factory = FakeFactory(FakeDriver(crashing=("C0",)))
+        supervisor = DriverSupervisor(factory)
+
+        assert len(supervisor.scrape_listing()) == 0
+        assert len(factory.started) == 2